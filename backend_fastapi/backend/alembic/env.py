@@ -19,13 +19,7 @@ from core.config import get_settings
 from db.base import Base
 
 # Import all models so Base sees them
-from db.models import (
-    college_students, driver_profiles, driver_verifications, 
-    emergency_contacts, face_data, fare_estimates, identity_verifications, 
-    otp_sessions, ratings, refresh_tokens, reports, ride_history, 
-    ride_participants, ride_requests, rides, saved_addresses, 
-    sos_alerts, users, vehicles
-)
+import db.models  # noqa: F401
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -0,0 +1,38 @@
+"""Add face match columns and face_data sync index
+
+Revision ID: 3c6e9b1f0a28
+Revises: f08b4e7d2c63
+Create Date: 2026-10-19 21:02:37.518204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c6e9b1f0a28'
+down_revision: Union[str, Sequence[str], None] = 'f08b4e7d2c63'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('identity_verifications', sa.Column('face_match_user_id', postgresql.UUID(as_uuid=True), nullable=True))
+    op.add_column('identity_verifications', sa.Column('face_match_score', sa.Float(), nullable=True))
+    # Polled by each app worker's face index sync
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_face_data_last_verified_at', 'face_data', ['last_verified_at'],
+            unique=False, postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_face_data_last_verified_at', table_name='face_data')
+    op.drop_column('identity_verifications', 'face_match_score')
+    op.drop_column('identity_verifications', 'face_match_user_id')
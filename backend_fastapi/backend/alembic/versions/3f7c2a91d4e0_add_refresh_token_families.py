@@ -0,0 +1,35 @@
+"""Add refresh token families
+
+Revision ID: 3f7c2a91d4e0
+Revises: ad9dba31b12a
+Create Date: 2026-10-19 09:12:41.518204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f7c2a91d4e0'
+down_revision: Union[str, Sequence[str], None] = 'ad9dba31b12a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('refresh_tokens', sa.Column('family_id', sa.UUID(), nullable=True))
+    op.add_column('refresh_tokens', sa.Column('revoked_at', sa.TIMESTAMP(timezone=True), nullable=True))
+    # Existing tokens each start their own family
+    op.execute("UPDATE refresh_tokens SET family_id = token_id WHERE family_id IS NULL")
+    op.alter_column('refresh_tokens', 'family_id', nullable=False)
+    op.create_index(op.f('ix_refresh_tokens_family_id'), 'refresh_tokens', ['family_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_refresh_tokens_family_id'), table_name='refresh_tokens')
+    op.drop_column('refresh_tokens', 'revoked_at')
+    op.drop_column('refresh_tokens', 'family_id')
@@ -0,0 +1,37 @@
+"""Store face_data.last_verified_at with a time zone
+
+Revision ID: 4b9e2d7a1c05
+Revises: c81b6f3d9e40
+Create Date: 2026-10-19 23:12:47.301582
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4b9e2d7a1c05'
+down_revision: Union[str, Sequence[str], None] = 'c81b6f3d9e40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Existing values came from now() in UTC sessions
+    op.alter_column('face_data', 'last_verified_at',
+               existing_type=sa.TIMESTAMP(),
+               type_=sa.TIMESTAMP(timezone=True),
+               existing_nullable=True,
+               postgresql_using="last_verified_at AT TIME ZONE 'UTC'")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column('face_data', 'last_verified_at',
+               existing_type=sa.TIMESTAMP(timezone=True),
+               type_=sa.TIMESTAMP(),
+               existing_nullable=True,
+               postgresql_using="last_verified_at AT TIME ZONE 'UTC'")
@@ -0,0 +1,69 @@
+"""Add ride templates and campus holidays
+
+Revision ID: 5d8b3e0c7a92
+Revises: e2a95c7f4b31
+Create Date: 2026-10-19 18:05:13.602947
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import geoalchemy2
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d8b3e0c7a92'
+down_revision: Union[str, Sequence[str], None] = 'e2a95c7f4b31'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('campus_holidays',
+    sa.Column('holiday_date', sa.Date(), nullable=False),
+    sa.Column('name', sa.String(length=100), nullable=False),
+    sa.PrimaryKeyConstraint('holiday_date')
+    )
+    op.create_table('ride_templates',
+    sa.Column('template_id', sa.UUID(), nullable=False),
+    sa.Column('driver_id', sa.UUID(), nullable=False),
+    sa.Column('vehicle_id', sa.UUID(), nullable=False),
+    sa.Column('start_location', geoalchemy2.types.Geography(geometry_type='POINT', srid=4326, from_text='ST_GeogFromText', name='geography'), nullable=True),
+    sa.Column('end_location', geoalchemy2.types.Geography(geometry_type='POINT', srid=4326, from_text='ST_GeogFromText', name='geography'), nullable=True),
+    sa.Column('start_address', sa.String(), nullable=False),
+    sa.Column('end_address', sa.String(), nullable=False),
+    sa.Column('weekday_mask', sa.Integer(), nullable=False),
+    sa.Column('ride_time', sa.Time(), nullable=False),
+    sa.Column('available_seats', sa.Integer(), nullable=False),
+    sa.Column('allowed_gender', postgresql.ENUM('any', 'male', 'female', name='allowedgenderenum', create_type=False), nullable=False),
+    sa.Column('allowed_community', sa.String(length=50), nullable=True),
+    sa.Column('estimated_fare', sa.DECIMAL(precision=6, scale=2), nullable=True),
+    sa.Column('valid_from', sa.Date(), nullable=False),
+    sa.Column('valid_until', sa.Date(), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=False),
+    sa.Column('created_at', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.ForeignKeyConstraint(['driver_id'], ['users.user_id'], ),
+    sa.ForeignKeyConstraint(['vehicle_id'], ['vehicles.vehicle_id'], ),
+    sa.PrimaryKeyConstraint('template_id')
+    )
+    op.create_index(op.f('ix_ride_templates_driver_id'), 'ride_templates', ['driver_id'], unique=False)
+    op.add_column('rides', sa.Column('template_id', sa.UUID(), nullable=True))
+    op.create_foreign_key(
+        'rides_template_id_fkey', 'rides', 'ride_templates', ['template_id'], ['template_id']
+    )
+    op.create_unique_constraint(
+        'rides_template_id_ride_date_key', 'rides', ['template_id', 'ride_date']
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('rides_template_id_ride_date_key', 'rides', type_='unique')
+    op.drop_constraint('rides_template_id_fkey', 'rides', type_='foreignkey')
+    op.drop_column('rides', 'template_id')
+    op.drop_index(op.f('ix_ride_templates_driver_id'), table_name='ride_templates')
+    op.drop_table('ride_templates')
+    op.drop_table('campus_holidays')
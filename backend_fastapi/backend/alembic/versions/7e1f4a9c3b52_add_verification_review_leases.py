@@ -0,0 +1,37 @@
+"""Add review lease columns to verification tables
+
+Revision ID: 7e1f4a9c3b52
+Revises: 3c6e9b1f0a28
+Create Date: 2026-10-19 21:40:12.804417
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7e1f4a9c3b52'
+down_revision: Union[str, Sequence[str], None] = '3c6e9b1f0a28'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ('identity_verifications', 'driver_verifications')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in TABLES:
+        op.add_column(table, sa.Column('claimed_by', postgresql.UUID(as_uuid=True), nullable=True))
+        op.add_column(table, sa.Column('claimed_until', sa.TIMESTAMP(timezone=True), nullable=True))
+        op.create_foreign_key(f'{table}_claimed_by_fkey', table, 'users', ['claimed_by'], ['user_id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in TABLES:
+        op.drop_constraint(f'{table}_claimed_by_fkey', table, type_='foreignkey')
+        op.drop_column(table, 'claimed_until')
+        op.drop_column(table, 'claimed_by')
@@ -0,0 +1,40 @@
+"""Add user ride stats and unique ride history rows
+
+Revision ID: 8c4d1e6b2a57
+Revises: 3f7c2a91d4e0
+Create Date: 2026-10-19 14:03:27.904112
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c4d1e6b2a57'
+down_revision: Union[str, Sequence[str], None] = '3f7c2a91d4e0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('user_ride_stats',
+    sa.Column('user_id', sa.UUID(), nullable=False),
+    sa.Column('rides_given', sa.Integer(), nullable=False),
+    sa.Column('rides_taken', sa.Integer(), nullable=False),
+    sa.Column('distance_shared_km', sa.Float(), nullable=False),
+    sa.Column('last_ride_at', sa.TIMESTAMP(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.user_id'], ),
+    sa.PrimaryKeyConstraint('user_id')
+    )
+    op.create_unique_constraint(
+        'ride_history_ride_id_passenger_id_key', 'ride_history', ['ride_id', 'passenger_id']
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('ride_history_ride_id_passenger_id_key', 'ride_history', type_='unique')
+    op.drop_table('user_ride_stats')
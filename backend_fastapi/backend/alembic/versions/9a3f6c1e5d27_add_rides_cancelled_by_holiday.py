@@ -0,0 +1,30 @@
+"""Mark rides cancelled by a campus holiday
+
+Revision ID: 9a3f6c1e5d27
+Revises: 4b9e2d7a1c05
+Create Date: 2026-10-19 23:41:09.518264
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9a3f6c1e5d27'
+down_revision: Union[str, Sequence[str], None] = '4b9e2d7a1c05'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Constant default: no table rewrite. Rides cancelled before this column
+    # existed stay cancelled when their holiday is removed.
+    op.add_column('rides', sa.Column('cancelled_by_holiday', sa.Boolean(), server_default=sa.text('false'), nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('rides', 'cancelled_by_holiday')
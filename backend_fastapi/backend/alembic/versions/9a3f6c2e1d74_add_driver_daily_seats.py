@@ -0,0 +1,45 @@
+"""Add per-day driver seat counters
+
+Revision ID: 9a3f6c2e1d74
+Revises: 5d8b3e0c7a92
+Create Date: 2026-10-19 17:42:11.318604
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9a3f6c2e1d74'
+down_revision: Union[str, Sequence[str], None] = '5d8b3e0c7a92'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('driver_daily_seats',
+    sa.Column('driver_id', sa.UUID(), nullable=False),
+    sa.Column('ride_date', sa.Date(), nullable=False),
+    sa.Column('seats_reserved', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['driver_id'], ['users.user_id'], ),
+    sa.PrimaryKeyConstraint('driver_id', 'ride_date')
+    )
+    # Seed counters from riders already on upcoming, still-live rides
+    op.execute("""
+        INSERT INTO driver_daily_seats (driver_id, ride_date, seats_reserved)
+        SELECT r.driver_id, r.ride_date, count(*)
+        FROM ride_participants p
+        JOIN rides r ON r.ride_id = p.ride_id
+        WHERE r.ride_date >= current_date
+          AND r.status <> 'cancelled'
+          AND p.user_id <> r.driver_id
+        GROUP BY r.driver_id, r.ride_date
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('driver_daily_seats')
@@ -0,0 +1,55 @@
+"""Add acknowledgement and resolution to SOS alerts
+
+Revision ID: a5d2c8e47f19
+Revises: 7e1f4a9c3b52
+Create Date: 2026-10-19 22:05:51.372690
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a5d2c8e47f19'
+down_revision: Union[str, Sequence[str], None] = '7e1f4a9c3b52'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('sos_alerts', sa.Column('acknowledged_at', sa.TIMESTAMP(timezone=True), nullable=True))
+    op.add_column('sos_alerts', sa.Column('acknowledged_by', postgresql.UUID(as_uuid=True), nullable=True))
+    op.add_column('sos_alerts', sa.Column('resolved_at', sa.TIMESTAMP(timezone=True), nullable=True))
+    op.add_column('sos_alerts', sa.Column('resolved_by', postgresql.UUID(as_uuid=True), nullable=True))
+    op.add_column('sos_alerts', sa.Column('resolution_notes', sa.Text(), nullable=True))
+    op.create_foreign_key('sos_alerts_acknowledged_by_fkey', 'sos_alerts', 'users', ['acknowledged_by'], ['user_id'])
+    op.create_foreign_key('sos_alerts_resolved_by_fkey', 'sos_alerts', 'users', ['resolved_by'], ['user_id'])
+    # Nothing tracked resolution before; treat alerts older than a day as closed
+    op.execute(
+        "UPDATE sos_alerts SET resolved_at = now(), resolution_notes = 'Closed by migration' "
+        "WHERE triggered_at < now() - interval '1 day'"
+    )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_sos_alerts_unresolved', 'sos_alerts', ['triggered_at'],
+            unique=False,
+            postgresql_where=sa.text('resolved_at IS NULL'),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_sos_alerts_unresolved', table_name='sos_alerts', postgresql_concurrently=True)
+    op.drop_constraint('sos_alerts_resolved_by_fkey', 'sos_alerts', type_='foreignkey')
+    op.drop_constraint('sos_alerts_acknowledged_by_fkey', 'sos_alerts', type_='foreignkey')
+    op.drop_column('sos_alerts', 'resolution_notes')
+    op.drop_column('sos_alerts', 'resolved_by')
+    op.drop_column('sos_alerts', 'resolved_at')
+    op.drop_column('sos_alerts', 'acknowledged_by')
+    op.drop_column('sos_alerts', 'acknowledged_at')
@@ -0,0 +1,42 @@
+"""Add expired ride status and partial index on open rides
+
+Revision ID: b47e2d9c0f15
+Revises: 9a3f6c2e1d74
+Create Date: 2026-10-19 18:26:40.502917
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b47e2d9c0f15'
+down_revision: Union[str, Sequence[str], None] = '9a3f6c2e1d74'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # ADD VALUE and CREATE INDEX CONCURRENTLY cannot share a transaction
+    # with other work; rides is large, so build the index without blocking writes
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TYPE ridestatusenum ADD VALUE IF NOT EXISTS 'expired'")
+        op.create_index(
+            'ix_rides_open_departure', 'rides', ['ride_date', 'ride_time'],
+            unique=False,
+            postgresql_where=sa.text("status = 'open'"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_rides_open_departure', table_name='rides', postgresql_concurrently=True
+        )
+    # Enum values cannot be dropped; fold expired rides back into cancelled
+    op.execute("UPDATE rides SET status = 'cancelled' WHERE status = 'expired'")
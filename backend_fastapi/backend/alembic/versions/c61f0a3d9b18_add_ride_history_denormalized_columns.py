@@ -0,0 +1,62 @@
+"""Add denormalized ride history columns and covering indexes
+
+Revision ID: c61f0a3d9b18
+Revises: 8c4d1e6b2a57
+Create Date: 2026-10-19 15:21:06.337481
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c61f0a3d9b18'
+down_revision: Union[str, Sequence[str], None] = '8c4d1e6b2a57'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ROW_COLUMNS = ['ride_id', 'start_address', 'end_address', 'fare', 'driver_name', 'passenger_name']
+
+BACKFILL = """
+UPDATE ride_history h
+SET start_address = r.start_address,
+    end_address = r.end_address,
+    fare = r.estimated_fare,
+    driver_name = d.full_name,
+    passenger_name = p.full_name
+FROM rides r, users d, users p
+WHERE r.ride_id = h.ride_id AND d.user_id = h.driver_id AND p.user_id = h.passenger_id
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('ride_history', sa.Column('start_address', sa.String(), nullable=True))
+    op.add_column('ride_history', sa.Column('end_address', sa.String(), nullable=True))
+    op.add_column('ride_history', sa.Column('fare', sa.DECIMAL(precision=6, scale=2), nullable=True))
+    op.add_column('ride_history', sa.Column('driver_name', sa.String(length=100), nullable=True))
+    op.add_column('ride_history', sa.Column('passenger_name', sa.String(length=100), nullable=True))
+    op.execute(BACKFILL)
+    op.create_index(
+        'ix_ride_history_passenger_completed', 'ride_history',
+        ['passenger_id', 'completed_at', 'history_id'],
+        unique=False, postgresql_include=ROW_COLUMNS + ['driver_id'],
+    )
+    op.create_index(
+        'ix_ride_history_driver_completed', 'ride_history',
+        ['driver_id', 'completed_at', 'history_id'],
+        unique=False, postgresql_include=ROW_COLUMNS + ['passenger_id'],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_ride_history_driver_completed', table_name='ride_history')
+    op.drop_index('ix_ride_history_passenger_completed', table_name='ride_history')
+    op.drop_column('ride_history', 'passenger_name')
+    op.drop_column('ride_history', 'driver_name')
+    op.drop_column('ride_history', 'fare')
+    op.drop_column('ride_history', 'end_address')
+    op.drop_column('ride_history', 'start_address')
@@ -0,0 +1,45 @@
+"""Add sos_notifications and index emergency contacts by user
+
+Revision ID: c81b6f3d9e40
+Revises: a5d2c8e47f19
+Create Date: 2026-10-19 22:38:26.915043
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c81b6f3d9e40'
+down_revision: Union[str, Sequence[str], None] = 'a5d2c8e47f19'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('sos_notifications',
+    sa.Column('notification_id', sa.UUID(), nullable=False),
+    sa.Column('alert_id', sa.UUID(), nullable=False),
+    sa.Column('contact_id', sa.UUID(), nullable=True),
+    sa.Column('phone', sa.String(length=15), nullable=False),
+    sa.Column('delivered', sa.Boolean(), nullable=False),
+    sa.Column('error', sa.Text(), nullable=True),
+    sa.Column('latency_ms', sa.Integer(), nullable=False),
+    sa.Column('sent_at', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.ForeignKeyConstraint(['alert_id'], ['sos_alerts.alert_id'], ),
+    sa.ForeignKeyConstraint(['contact_id'], ['emergency_contacts.contact_id'], ondelete='SET NULL'),
+    sa.PrimaryKeyConstraint('notification_id')
+    )
+    op.create_index(op.f('ix_sos_notifications_alert_id'), 'sos_notifications', ['alert_id'], unique=False)
+    # Read on every SOS trigger
+    op.create_index(op.f('ix_emergency_contacts_user_id'), 'emergency_contacts', ['user_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_emergency_contacts_user_id'), table_name='emergency_contacts')
+    op.drop_index(op.f('ix_sos_notifications_alert_id'), table_name='sos_notifications')
+    op.drop_table('sos_notifications')
@@ -0,0 +1,51 @@
+"""Index foreign keys and status filters used by the routers
+
+Revision ID: d3c8a5f17e60
+Revises: b47e2d9c0f15
+Create Date: 2026-10-19 19:05:52.671340
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd3c8a5f17e60'
+down_revision: Union[str, Sequence[str], None] = 'b47e2d9c0f15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (name, table, columns). ride_requests.ride_id is already the leading
+# column of the (ride_id, passenger_id) unique constraint.
+INDEXES = [
+    ('ix_ride_participants_ride_id', 'ride_participants', ['ride_id']),
+    ('ix_ride_participants_user_id', 'ride_participants', ['user_id']),
+    ('ix_ratings_ride_id', 'ratings', ['ride_id']),
+    ('ix_ratings_rated_user_id', 'ratings', ['rated_user_id']),
+    ('ix_vehicles_user_id', 'vehicles', ['user_id']),
+    ('ix_sos_alerts_user_id', 'sos_alerts', ['user_id']),
+    ('ix_reports_reporter_id', 'reports', ['reporter_id']),
+    ('ix_identity_verifications_user_id', 'identity_verifications', ['user_id']),
+    ('ix_identity_verifications_status_created_at', 'identity_verifications', ['status', 'created_at']),
+    ('ix_driver_verifications_user_id', 'driver_verifications', ['user_id']),
+    ('ix_driver_verifications_status_created_at', 'driver_verifications', ['status', 'created_at']),
+    ('ix_users_created_at', 'users', ['created_at']),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY keeps the tables writable while the indexes build; it
+    # cannot run inside a transaction. A failed build leaves an INVALID
+    # index behind: drop it and re-run the migration.
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, unique=False, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
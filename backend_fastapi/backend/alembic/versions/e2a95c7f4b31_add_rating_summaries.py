@@ -0,0 +1,39 @@
+"""Add rating summaries
+
+Revision ID: e2a95c7f4b31
+Revises: c61f0a3d9b18
+Create Date: 2026-10-19 16:44:52.118730
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2a95c7f4b31'
+down_revision: Union[str, Sequence[str], None] = 'c61f0a3d9b18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('rating_summaries',
+    sa.Column('user_id', sa.UUID(), nullable=False),
+    sa.Column('rating_count', sa.Integer(), nullable=False),
+    sa.Column('rating_sum', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.user_id'], ),
+    sa.PrimaryKeyConstraint('user_id')
+    )
+    op.execute(
+        "INSERT INTO rating_summaries (user_id, rating_count, rating_sum) "
+        "SELECT rated_user_id, count(*), sum(rating_value) FROM ratings GROUP BY rated_user_id"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('rating_summaries')
@@ -0,0 +1,49 @@
+"""Add OCR job columns to identity verifications
+
+Revision ID: f08b4e7d2c63
+Revises: d3c8a5f17e60
+Create Date: 2026-10-19 20:11:08.245931
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f08b4e7d2c63'
+down_revision: Union[str, Sequence[str], None] = 'd3c8a5f17e60'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ocr_status = postgresql.ENUM('queued', 'running', 'done', 'failed', name='ocrstatusenum')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    ocr_status.create(op.get_bind(), checkfirst=True)
+    op.add_column('identity_verifications', sa.Column('ocr_status', postgresql.ENUM(name='ocrstatusenum', create_type=False), nullable=True))
+    op.add_column('identity_verifications', sa.Column('ocr_college_id_number', sa.String(length=50), nullable=True))
+    op.add_column('identity_verifications', sa.Column('ocr_flags', postgresql.ARRAY(sa.String()), nullable=True))
+    op.add_column('identity_verifications', sa.Column('ocr_started_at', sa.TIMESTAMP(timezone=True), nullable=True))
+    op.add_column('identity_verifications', sa.Column('ocr_completed_at', sa.TIMESTAMP(timezone=True), nullable=True))
+    op.create_index(
+        'ix_identity_verifications_ocr_queue', 'identity_verifications', ['created_at'],
+        unique=False,
+        postgresql_where=sa.text("ocr_status IN ('queued', 'running')"),
+    )
+    # Submissions already waiting for review get read too
+    op.execute("UPDATE identity_verifications SET ocr_status = 'queued' WHERE status = 'submitted'")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_identity_verifications_ocr_queue', table_name='identity_verifications')
+    op.drop_column('identity_verifications', 'ocr_completed_at')
+    op.drop_column('identity_verifications', 'ocr_started_at')
+    op.drop_column('identity_verifications', 'ocr_flags')
+    op.drop_column('identity_verifications', 'ocr_college_id_number')
+    op.drop_column('identity_verifications', 'ocr_status')
+    ocr_status.drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1 @@
+# Benchmarks package — run modules from the app/ directory, e.g. `python -m benchmarks.jwt_decode`
@@ -0,0 +1,164 @@
+"""
+EXPLAIN audit: no sequential scans of large tables on the hot read routes.
+
+Calls each audited route in-process, captures every SELECT it sends to the
+database, and re-runs it as `EXPLAIN (FORMAT JSON)` with the same
+parameters. A Seq Scan node on a table with at least --min-rows rows
+(pg_class.reltuples) fails the run, so a dropped index or a query that
+stops matching one shows up before it reaches production.
+
+Routes are the query budget routes plus a few per-user lookups on indexed
+foreign keys. Point DATABASE_URL at a seeded database (see seed_data.py).
+
+Usage (from backend/app):
+    python -m benchmarks.explain_audit [--min-rows 10000] [--generic-plans]
+
+--generic-plans explains under plan_cache_mode = force_generic_plan, which
+is what asyncpg's prepared statements end up using after a few executions:
+a predicate that only matches an index for a specific parameter value
+(e.g. a partial index on status) fails there.
+"""
+import argparse
+import asyncio
+import json
+import re
+import sys
+from dataclasses import dataclass, field
+
+import httpx
+from sqlalchemy import event
+
+from benchmarks.query_budget import ROUTE_BUDGETS, load_fixtures
+from core.security import create_access_token
+from db.session import engine
+
+
+@dataclass(frozen=True)
+class AuditedRoute:
+    method: str
+    path: str            # formatted with fixture ids
+    as_user: str | None  # fixture key of the caller, or None for anonymous
+    allow_seq_scan: frozenset[str] = field(default_factory=frozenset)
+
+
+# Whole-table aggregates legitimately read every row
+_ALLOWED = {
+    "/admin/stats": frozenset({"users"}),
+}
+
+AUDITED_ROUTES = [
+    AuditedRoute(b.method, b.path, b.as_user, _ALLOWED.get(b.path, frozenset()))
+    for b in ROUTE_BUDGETS
+] + [
+    AuditedRoute("GET", "/vehicles/", "driver_id"),
+    AuditedRoute("GET", "/sos/active", "driver_id"),
+    AuditedRoute("GET", "/reports/mine", "driver_id"),
+    AuditedRoute("GET", "/ratings/ride/{ride_id}", None),
+    AuditedRoute("GET", "/verification/identity/status", "driver_id"),
+    AuditedRoute("GET", "/verification/driver/status", "driver_id"),
+    AuditedRoute("GET", "/ride-templates/", "driver_id"),
+]
+
+_READ = re.compile(r"^\s*(SELECT|WITH)\b", re.IGNORECASE)
+
+
+class StatementRecorder:
+    """Collects (statement, parameters) for every SELECT while enabled."""
+
+    def __init__(self):
+        self.enabled = False
+        self.statements: list[tuple[str, tuple]] = []
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        if self.enabled and _READ.match(statement):
+            self.statements.append((statement, tuple(parameters or ())))
+
+    def take(self) -> list[tuple[str, tuple]]:
+        statements, self.statements = self.statements, []
+        return statements
+
+
+def seq_scans(plan: dict) -> list[str]:
+    """Relation names of every Seq Scan node in an EXPLAIN JSON plan tree."""
+    found = []
+    if plan.get("Node Type") == "Seq Scan":
+        found.append(plan["Relation Name"])
+    for child in plan.get("Plans", ()):
+        found.extend(seq_scans(child))
+    return found
+
+
+async def run_audit(min_rows: int, generic_plans: bool) -> bool:
+    fixtures = await load_fixtures()
+    recorder = StatementRecorder()
+    event.listen(engine.sync_engine, "before_cursor_execute", recorder)
+
+    from main import app
+    ok = True
+    async with engine.connect() as conn:
+        raw = (await conn.get_raw_connection()).driver_connection
+        table_rows = {
+            row["relname"]: row["reltuples"]
+            for row in await raw.fetch(
+                "SELECT relname, reltuples FROM pg_class "
+                "WHERE relkind = 'r' AND relnamespace = 'public'::regnamespace"
+            )
+        }
+        if generic_plans:
+            await raw.execute("SET plan_cache_mode = force_generic_plan")
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://audit") as client:
+            for route in AUDITED_ROUTES:
+                needed = re.findall(r"{(\w+)}", route.path) + ([route.as_user] if route.as_user else [])
+                missing = [key for key in needed if key not in fixtures]
+                if missing:
+                    print(f"SKIP  {route.method} {route.path}  (no fixture: {', '.join(missing)})")
+                    continue
+
+                headers = {}
+                if route.as_user:
+                    headers["Authorization"] = f"Bearer {create_access_token(fixtures[route.as_user])}"
+                recorder.enabled = True
+                response = await client.request(
+                    route.method, route.path.format(**fixtures), headers=headers
+                )
+                recorder.enabled = False
+                statements = recorder.take()
+
+                failures = []
+                for statement, params in statements:
+                    explained = await raw.fetchval(f"EXPLAIN (FORMAT JSON) {statement}", *params)
+                    plan = json.loads(explained)[0]["Plan"]
+                    for table in seq_scans(plan):
+                        rows = table_rows.get(table, 0)
+                        if rows >= min_rows and table not in route.allow_seq_scan:
+                            failures.append((table, rows, statement))
+
+                passed = not failures and response.status_code < 500
+                ok &= passed
+                print(
+                    f"{'PASS' if passed else 'FAIL':<5} {route.method} {route.path}  "
+                    f"{len(statements)} statements  [{response.status_code}]"
+                )
+                for table, rows, statement in failures:
+                    print(f"      Seq Scan on {table} (~{rows:,.0f} rows): {' '.join(statement.split())[:160]}")
+
+    event.remove(engine.sync_engine, "before_cursor_execute", recorder)
+    await engine.dispose()
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fail on sequential scans of large tables")
+    parser.add_argument("--min-rows", type=int, default=10_000,
+                        help="Only flag Seq Scans of tables at least this large")
+    parser.add_argument("--generic-plans", action="store_true",
+                        help="Explain with plan_cache_mode = force_generic_plan")
+    args = parser.parse_args()
+    if not asyncio.run(run_audit(args.min_rows, args.generic_plans)):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Face index benchmark: duplicate-account lookups on synthetic embeddings.
+
+Builds services.face_index.FaceIndex over --users random embeddings (with
+--dupes near-copies planted, as a second account of the same person would
+be) and compares, per single query (the inline identity submission check)
+and per batch:
+
+  python   per-row cosine in Python over face_data rows (the old approach),
+           timed on a slice and extrapolated
+  exact    one matrix product over the contiguous float32 matrix
+  ivf      coarse quantizer with --nlist partitions, --nprobe probed
+
+"dupes found" counts planted pairs scoring above FACE_DUPLICATE_THRESHOLD,
+which is what the check needs. Recall is the share of exact top-k results
+the IVF search also returns; on random vectors everything but the planted
+copy is near-equidistant, so expect it to be low there. No database needed.
+
+Usage (from backend/app):
+    python -m benchmarks.face_index [--users 200000] [--nlist 1024] [--nprobe 16]
+"""
+import argparse
+import math
+import time
+import uuid
+
+import numpy as np
+
+from core.config import get_settings
+from services.face_index import FaceIndex
+
+settings = get_settings()
+
+
+def python_cosine_scan(query: list[float], rows: list[list[float]]) -> list[float]:
+    qn = math.sqrt(sum(x * x for x in query))
+    scores = []
+    for row in rows:
+        dot = sum(a * b for a, b in zip(query, row))
+        scores.append(dot / (qn * math.sqrt(sum(x * x for x in row))))
+    return scores
+
+
+def timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the face embedding index")
+    parser.add_argument("--users", type=int, default=200_000)
+    parser.add_argument("--dupes", type=int, default=200)
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--k", type=int, default=settings.FACE_MATCH_TOP_K)
+    parser.add_argument("--nlist", type=int, default=1024)
+    parser.add_argument("--nprobe", type=int, default=16)
+    args = parser.parse_args()
+
+    dim = settings.FACE_EMBEDDING_DIM
+    rng = np.random.default_rng(7)
+    vectors = rng.standard_normal((args.users, dim), dtype=np.float32)
+    # Second accounts: the same face re-captured, slightly perturbed
+    vectors[-args.dupes:] = vectors[:args.dupes] + 0.15 * rng.standard_normal((args.dupes, dim), dtype=np.float32)
+    ids = [uuid.uuid4() for _ in range(args.users)]
+
+    exact = FaceIndex(dim)
+    build_exact = timed(lambda: exact.upsert_many(ids, vectors))
+    ivf = FaceIndex(dim, nlist=args.nlist, nprobe=args.nprobe)
+    build_ivf = timed(lambda: (ivf.upsert_many(ids, vectors), ivf.train()))
+    print(f"{args.users:,} x {dim} embeddings  build: exact {build_exact:.2f}s, ivf {build_ivf:.2f}s (incl. k-means)")
+
+    queries = vectors[:args.queries]
+    exclude = ids[:args.queries]
+
+    sample = 2_000
+    rows = vectors[:sample].tolist()
+    python_single = timed(lambda: python_cosine_scan(rows[0], rows)) * args.users / sample
+    single = {
+        name: timed(lambda: [index.search(q, k=args.k, exclude=[u]) for q, u in zip(queries[:100], exclude)]) / 100
+        for name, index in (("exact", exact), ("ivf", ivf))
+    }
+    print(f"single query:  python ~{python_single * 1000:,.0f}ms  "
+          f"exact {single['exact'] * 1000:.2f}ms  ivf {single['ivf'] * 1000:.2f}ms")
+
+    results = {}
+    batch = {}
+    for name, index in (("exact", exact), ("ivf", ivf)):
+        batch[name] = timed(lambda: results.__setitem__(name, index.search(queries, k=args.k, exclude=exclude)))
+    print(f"batch of {args.queries}:  exact {batch['exact'] * 1000:.0f}ms  ivf {batch['ivf'] * 1000:.0f}ms")
+
+    recall = np.mean([
+        len({u for u, _ in a} & {u for u, _ in b}) / max(len(a), 1)
+        for a, b in zip(results["exact"], results["ivf"])
+    ])
+    dupes = args.dupes if args.dupes <= args.queries else args.queries
+    for name in ("exact", "ivf"):
+        found = sum(
+            1 for i in range(dupes)
+            if any(u == ids[args.users - args.dupes + i] and s >= settings.FACE_DUPLICATE_THRESHOLD
+                   for u, s in results[name][i])
+        )
+        print(f"{name:<6} dupes found {found}/{dupes}")
+    print(f"ivf recall@{args.k}: {recall:.3f}")
+
+
+if __name__ == "__main__":
+    main()
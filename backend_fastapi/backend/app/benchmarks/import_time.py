@@ -0,0 +1,77 @@
+"""
+Import-time profile of application startup.
+
+Runs `python -X importtime -c "import main"` in a fresh interpreter and
+reports the slowest modules by cumulative and self time, plus totals per
+top-level package. Watched packages (httpx etc.) should not appear at
+all: they are meant to load on first use, not at startup.
+
+Usage (from backend/app):
+    python -m benchmarks.import_time [--module main] [--top 25]
+"""
+import argparse
+import os
+import subprocess
+import sys
+from collections import defaultdict
+
+# Heavy packages that must stay out of the startup import graph.
+# shapely and numpy are not watched: geoalchemy2 (needed by the models for
+# Geography columns) imports them eagerly via geoalchemy2.shape, so no
+# deferral in app code can keep them out.
+WATCHED_PACKAGES = ("httpx", "cryptography")
+
+
+def profile_imports(module: str) -> list[tuple[str, int, int]]:
+    """Return (module, self_us, cumulative_us) rows for importing `module`."""
+    app_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=app_dir,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        sys.stderr.write(proc.stderr)
+        raise SystemExit(f"Importing {module!r} failed")
+
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        rows.append((name.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import-time profile of application startup")
+    parser.add_argument("--module", default="main", help="Module to import (default: main)")
+    parser.add_argument("--top", type=int, default=25, help="Rows to show per table")
+    args = parser.parse_args()
+
+    rows = profile_imports(args.module)
+    total_us = sum(self_us for _, self_us, _ in rows)
+
+    per_package = defaultdict(int)
+    for name, self_us, _ in rows:
+        per_package[name.split(".")[0]] += self_us
+
+    print(f"Importing {args.module!r}: {len(rows)} modules, {total_us / 1000:.1f} ms total\n")
+
+    print(f"{'cumulative ms':>14} {'self ms':>9}  module")
+    for name, self_us, cumulative_us in sorted(rows, key=lambda r: r[2], reverse=True)[:args.top]:
+        print(f"{cumulative_us / 1000:14.1f} {self_us / 1000:9.1f}  {name}")
+
+    print(f"\n{'self ms':>14} {'share':>9}  top-level package")
+    for package, self_us in sorted(per_package.items(), key=lambda kv: kv[1], reverse=True)[:args.top]:
+        print(f"{self_us / 1000:14.1f} {self_us / total_us:9.1%}  {package}")
+
+    loaded = [p for p in WATCHED_PACKAGES if p in per_package]
+    if loaded:
+        print(f"\nWARNING: heavy packages imported at startup: {', '.join(loaded)}")
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
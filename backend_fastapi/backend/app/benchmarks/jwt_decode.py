@@ -0,0 +1,52 @@
+"""
+Micro-benchmark: per-token decode cost of python-jose vs the cached JWTCodec.
+
+Usage (from backend/app):
+    python -m benchmarks.jwt_decode [--iterations 20000]
+"""
+import argparse
+import timeit
+from datetime import datetime, timedelta, timezone
+
+from jose import jwt
+
+from core.config import get_settings
+from core.tokens import get_jwt_codec
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    settings = get_settings()
+    codec = get_jwt_codec()
+    now = datetime.now(timezone.utc)
+    token = codec.encode({
+        "sub": "00000000-0000-0000-0000-000000000000",
+        "exp": now + timedelta(minutes=60),
+        "iat": now,
+        "type": "access",
+    })
+
+    candidates = {"jwt_codec": lambda: codec.decode(token)}
+    if settings.JWT_ALGORITHM.startswith("HS"):
+        # python-jose has no EdDSA support, so only compare shared-secret algorithms
+        candidates["python-jose"] = lambda: jwt.decode(
+            token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM]
+        )
+
+    print(f"Algorithm: {settings.JWT_ALGORITHM}  iterations: {args.iterations}")
+    results = {}
+    for name, fn in candidates.items():
+        fn()  # warm up
+        best = min(timeit.repeat(fn, number=args.iterations, repeat=5))
+        results[name] = best / args.iterations * 1e6
+        print(f"  {name:<12} {results[name]:8.2f} µs/token")
+
+    if "python-jose" in results:
+        print(f"  speedup      {results['python-jose'] / results['jwt_codec']:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
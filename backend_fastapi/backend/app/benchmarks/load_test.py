@@ -0,0 +1,268 @@
+"""
+Load test with scripted carpool traffic personas.
+
+Personas:
+  driver   — POST /tracking/{ride_id}/location every few seconds
+  rider    — polls GET /tracking/{ride_id}
+  rush     — morning-rush burst of POST /rides/{ride_id}/request (one per rider)
+  admin    — polls the admin dashboard (stats, pending verifications, SOS)
+
+Users, rides and admins are taken from the configured database; the rush
+persona creates ride requests, so run against a seeded scratch database.
+
+Results are reported as p50/p95/p99 per route and can be compared against
+a stored baseline (p95 regression beyond --tolerance fails the run).
+
+Usage (from backend/app):
+    python -m benchmarks.load_test --profile exam_week
+    python -m benchmarks.load_test --base-url http://localhost:8000 --duration 120
+    python -m benchmarks.load_test --save-baseline
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+
+import httpx
+from sqlalchemy import select
+
+from core.security import create_access_token
+from db.session import AsyncSessionLocal
+from db.models.users import User
+from db.models.rides import Ride
+from db.enums import RideStatusEnum
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baselines", "load_test.json")
+
+
+@dataclass(frozen=True)
+class Profile:
+    drivers: int
+    riders: int
+    rush_riders: int
+    admins: int
+    location_interval: float  # seconds between driver location posts
+    poll_interval: float      # seconds between rider tracking polls
+    admin_interval: float     # seconds between admin dashboard refreshes
+
+
+PROFILES = {
+    "steady": Profile(
+        drivers=20, riders=60, rush_riders=0, admins=2,
+        location_interval=5.0, poll_interval=3.0, admin_interval=10.0,
+    ),
+    "morning_rush": Profile(
+        drivers=50, riders=150, rush_riders=300, admins=3,
+        location_interval=5.0, poll_interval=3.0, admin_interval=10.0,
+    ),
+    "exam_week": Profile(
+        drivers=120, riders=400, rush_riders=800, admins=5,
+        location_interval=4.0, poll_interval=2.0, admin_interval=5.0,
+    ),
+}
+
+
+class LatencyRecorder:
+    def __init__(self):
+        self.samples: dict[str, list[float]] = defaultdict(list)
+        self.errors: dict[str, int] = defaultdict(int)
+
+    async def call(self, client: httpx.AsyncClient, route: str, method: str, url: str, **kwargs):
+        started = time.perf_counter()
+        try:
+            response = await client.request(method, url, **kwargs)
+            failed = response.status_code >= 500
+        except httpx.HTTPError:
+            failed = True
+        self.samples[route].append(time.perf_counter() - started)
+        if failed:
+            self.errors[route] += 1
+
+    def summary(self) -> dict[str, dict]:
+        result = {}
+        for route, values in sorted(self.samples.items()):
+            ordered = sorted(values)
+            result[route] = {
+                "count": len(ordered),
+                "errors": self.errors[route],
+                "p50_ms": round(_percentile(ordered, 50) * 1000, 2),
+                "p95_ms": round(_percentile(ordered, 95) * 1000, 2),
+                "p99_ms": round(_percentile(ordered, 99) * 1000, 2),
+            }
+        return result
+
+
+def _percentile(ordered: list[float], pct: float) -> float:
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def _auth(user_id) -> dict:
+    return {"Authorization": f"Bearer {create_access_token(str(user_id))}"}
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+async def load_fixtures(profile: Profile) -> dict:
+    async with AsyncSessionLocal() as db:
+        rides = (await db.execute(
+            select(Ride.ride_id, Ride.driver_id)
+            .where(Ride.status == RideStatusEnum.open)
+            .limit(max(profile.drivers, 1))
+        )).all()
+        riders = (await db.execute(
+            select(User.user_id)
+            .where(User.is_identity_verified == True, User.is_driver_verified == False)
+            .limit(profile.riders + profile.rush_riders)
+        )).scalars().all()
+        admins = (await db.execute(
+            select(User.user_id).where(User.is_admin == True).limit(profile.admins)
+        )).scalars().all()
+    if not rides or not riders:
+        raise SystemExit("Load test needs open rides and rider accounts; seed the database first.")
+    return {"rides": rides, "riders": list(riders), "admins": list(admins)}
+
+
+# ---------------------------------------------------------------------------
+# Personas
+# ---------------------------------------------------------------------------
+
+async def driver_persona(client, rec, ride, profile, deadline):
+    headers = _auth(ride.driver_id)
+    lat, lng = 12.9346 + random.uniform(-0.05, 0.05), 77.6069 + random.uniform(-0.05, 0.05)
+    await asyncio.sleep(random.uniform(0, profile.location_interval))
+    while time.monotonic() < deadline:
+        lat += random.uniform(-0.0005, 0.0005)
+        lng += random.uniform(-0.0005, 0.0005)
+        await rec.call(
+            client, "POST /tracking/{ride_id}/location", "POST",
+            f"/tracking/{ride.ride_id}/location",
+            json={"latitude": lat, "longitude": lng}, headers=headers,
+        )
+        await asyncio.sleep(profile.location_interval)
+
+
+async def rider_persona(client, rec, rider_id, ride, profile, deadline):
+    headers = _auth(rider_id)
+    await asyncio.sleep(random.uniform(0, profile.poll_interval))
+    while time.monotonic() < deadline:
+        await rec.call(
+            client, "GET /tracking/{ride_id}", "GET", f"/tracking/{ride.ride_id}", headers=headers
+        )
+        await asyncio.sleep(profile.poll_interval)
+
+
+async def rush_persona(client, rec, rider_id, ride, window):
+    # Morning rush: every rider joins within the first `window` seconds
+    await asyncio.sleep(random.uniform(0, window))
+    await rec.call(
+        client, "POST /rides/{ride_id}/request", "POST", f"/rides/{ride.ride_id}/request",
+        json={"pickup_lat": 12.93, "pickup_lng": 77.60, "pickup_address": "Load test stop"},
+        headers=_auth(rider_id),
+    )
+
+
+async def admin_persona(client, rec, admin_id, profile, deadline):
+    headers = _auth(admin_id)
+    while time.monotonic() < deadline:
+        for path in ("/admin/stats", "/admin/verifications/identity/pending", "/admin/sos/active"):
+            await rec.call(client, f"GET {path}", "GET", path, headers=headers)
+        await asyncio.sleep(profile.admin_interval)
+
+
+# ---------------------------------------------------------------------------
+# Runner
+# ---------------------------------------------------------------------------
+
+def _client(base_url: str | None) -> httpx.AsyncClient:
+    limits = httpx.Limits(max_connections=200, max_keepalive_connections=200)
+    if base_url:
+        return httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30)
+    from main import app
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://load", timeout=30
+    )
+
+
+async def run(profile: Profile, duration: float, base_url: str | None) -> dict:
+    fixtures = await load_fixtures(profile)
+    rides, riders, admins = fixtures["rides"], fixtures["riders"], fixtures["admins"]
+    rec = LatencyRecorder()
+    deadline = time.monotonic() + duration
+
+    async with _client(base_url) as client:
+        tasks = [driver_persona(client, rec, ride, profile, deadline) for ride in rides[:profile.drivers]]
+        pollers, rushers = riders[:profile.riders], riders[profile.riders:]
+        tasks += [
+            rider_persona(client, rec, rider_id, random.choice(rides), profile, deadline)
+            for rider_id in pollers
+        ]
+        tasks += [
+            rush_persona(client, rec, rider_id, random.choice(rides), min(duration, 30.0))
+            for rider_id in rushers[:profile.rush_riders]
+        ]
+        tasks += [admin_persona(client, rec, admin_id, profile, deadline) for admin_id in admins]
+        await asyncio.gather(*tasks)
+
+    return rec.summary()
+
+
+def compare_with_baseline(summary: dict, baseline: dict, tolerance: float) -> bool:
+    ok = True
+    print(f"\n{'route':<48} {'p95 ms':>9} {'baseline':>9} {'change':>8}")
+    for route, stats in summary.items():
+        base = baseline.get(route)
+        if not base or not base["p95_ms"]:
+            print(f"{route:<48} {stats['p95_ms']:9.2f} {'-':>9} {'new':>8}")
+            continue
+        change = stats["p95_ms"] / base["p95_ms"] - 1
+        regressed = change > tolerance
+        ok &= not regressed
+        flag = "  REGRESSION" if regressed else ""
+        print(f"{route:<48} {stats['p95_ms']:9.2f} {base['p95_ms']:9.2f} {change:+8.1%}{flag}")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Carpool traffic load test")
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="steady")
+    parser.add_argument("--duration", type=float, default=60.0, help="Seconds to run")
+    parser.add_argument("--base-url", help="Run against a live server instead of in-process")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed p95 regression (0.2 = 20%%)")
+    args = parser.parse_args()
+
+    summary = asyncio.run(run(PROFILES[args.profile], args.duration, args.base_url))
+
+    print(f"\n{'route':<48} {'count':>7} {'errors':>6} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    for route, s in summary.items():
+        print(f"{route:<48} {s['count']:7d} {s['errors']:6d} {s['p50_ms']:9.2f} {s['p95_ms']:9.2f} {s['p99_ms']:9.2f}")
+
+    baselines = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baselines = json.load(f)
+
+    if args.save_baseline:
+        baselines[args.profile] = summary
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        with open(args.baseline, "w") as f:
+            json.dump(baselines, f, indent=2, sort_keys=True)
+        print(f"\nSaved baseline for profile {args.profile!r} to {args.baseline}")
+    elif args.profile in baselines:
+        if not compare_with_baseline(summary, baselines[args.profile], args.tolerance):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""
+Per-endpoint SQL query budgets.
+
+Calls each budgeted route and reads the query count from the Server-Timing
+header added by MetricsMiddleware (`db;dur=...;desc="N queries"`). Any route
+that issues more statements than its declared budget fails the run, which
+catches N+1 patterns and new per-row queries in response builders.
+
+Fixtures (a ride with participants, its driver, an admin) are looked up in
+the configured database, so point DATABASE_URL at a seeded database.
+
+Usage (from backend/app; the target needs METRICS_ENABLED=true):
+    python -m benchmarks.query_budget                           # in-process ASGI
+    python -m benchmarks.query_budget --base-url http://localhost:8000
+"""
+import argparse
+import asyncio
+import re
+import sys
+from dataclasses import dataclass
+
+import httpx
+from sqlalchemy import select, func
+
+from core.security import create_access_token
+from db.session import AsyncSessionLocal
+from db.models.users import User
+from db.models.rides import Ride
+from db.models.ride_participants import RideParticipant
+
+
+@dataclass(frozen=True)
+class RouteBudget:
+    method: str
+    path: str            # formatted with fixture ids
+    max_queries: int
+    as_user: str | None  # fixture key of the caller, or None for anonymous
+
+
+# Authenticated routes include one query for get_current_user.
+ROUTE_BUDGETS = [
+    RouteBudget("GET", "/rides/", 1, None),
+    RouteBudget("GET", "/rides/feed", 1, None),
+    RouteBudget("GET", "/rides/{ride_id}", 2, "driver_id"),
+    RouteBudget("GET", "/rides/{ride_id}/participants", 4, "driver_id"),
+    RouteBudget("GET", "/rides/{ride_id}/requests", 4, "driver_id"),
+    RouteBudget("GET", "/tracking/{ride_id}", 4, "driver_id"),
+    RouteBudget("GET", "/ratings/user/{driver_id}", 1, None),
+    RouteBudget("GET", "/ratings/users?user_id={driver_id}", 1, None),
+    RouteBudget("GET", "/users/me/history", 2, "driver_id"),
+    RouteBudget("GET", "/admin/users", 2, "admin_id"),
+    RouteBudget("GET", "/admin/verifications/identity/pending", 2, "admin_id"),
+    RouteBudget("GET", "/admin/verifications/driver/pending", 2, "admin_id"),
+    RouteBudget("GET", "/admin/sos/active", 2, "admin_id"),
+    RouteBudget("GET", "/admin/stats", 10, "admin_id"),
+]
+
+_QUERY_COUNT = re.compile(r'db;dur=[\d.]+;desc="(\d+) queries"')
+
+
+async def load_fixtures() -> dict[str, str]:
+    """Pick the busiest ride (most participants) and any admin from the database."""
+    async with AsyncSessionLocal() as db:
+        ride_row = (await db.execute(
+            select(Ride.ride_id, Ride.driver_id)
+            .join(RideParticipant, RideParticipant.ride_id == Ride.ride_id)
+            .group_by(Ride.ride_id, Ride.driver_id)
+            .order_by(func.count(RideParticipant.participant_id).desc())
+            .limit(1)
+        )).first()
+        admin_id = (await db.execute(
+            select(User.user_id).where(User.is_admin == True).limit(1)
+        )).scalar_one_or_none()
+
+    fixtures = {}
+    if ride_row:
+        fixtures["ride_id"] = str(ride_row.ride_id)
+        fixtures["driver_id"] = str(ride_row.driver_id)
+    if admin_id:
+        fixtures["admin_id"] = str(admin_id)
+    return fixtures
+
+
+def _client(base_url: str | None) -> httpx.AsyncClient:
+    if base_url:
+        return httpx.AsyncClient(base_url=base_url)
+    from main import app
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://budget")
+
+
+async def check_budgets(base_url: str | None) -> bool:
+    fixtures = await load_fixtures()
+    ok = True
+    async with _client(base_url) as client:
+        for budget in ROUTE_BUDGETS:
+            needed = re.findall(r"{(\w+)}", budget.path) + ([budget.as_user] if budget.as_user else [])
+            missing = [key for key in needed if key not in fixtures]
+            if missing:
+                print(f"SKIP  {budget.method} {budget.path}  (no fixture: {', '.join(missing)})")
+                continue
+
+            headers = {}
+            if budget.as_user:
+                headers["Authorization"] = f"Bearer {create_access_token(fixtures[budget.as_user])}"
+            response = await client.request(
+                budget.method, budget.path.format(**fixtures), headers=headers
+            )
+
+            match = _QUERY_COUNT.search(response.headers.get("server-timing", ""))
+            if match is None:
+                print(f"ERROR {budget.method} {budget.path}  no Server-Timing header (METRICS_ENABLED?)")
+                ok = False
+                continue
+
+            used = int(match.group(1))
+            passed = used <= budget.max_queries and response.status_code < 500
+            ok &= passed
+            print(
+                f"{'PASS' if passed else 'FAIL':<5} {budget.method} {budget.path}  "
+                f"{used}/{budget.max_queries} queries  [{response.status_code}]"
+            )
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-endpoint SQL query budgets")
+    parser.add_argument("--base-url", help="Run against a live server instead of in-process")
+    args = parser.parse_args()
+    if not asyncio.run(check_budgets(args.base_url)):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+List serialization: FastAPI response_model vs core.responses.list_response.
+
+Builds a throwaway app with one route per path, each returning the same
+10k synthetic RideRead rows, and times full requests over ASGITransport:
+
+  response_model   ORM-like objects through FastAPI's default pipeline
+  adapter          list_response(trusted=False): cached TypeAdapter + dump_json
+  trusted          list_response(trusted=True): SQL-shaped dicts straight to orjson
+
+No database is needed.
+
+Usage (from backend/app):
+    python -m benchmarks.serialization [--rows 10000] [--repeat 20]
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import time
+import uuid
+from datetime import date, datetime, time as dt_time, timedelta, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+
+import httpx
+from fastapi import FastAPI
+
+from core.responses import list_response
+from db.enums import AllowedGenderEnum, RideStatusEnum
+from schemas.rides import RideRead
+
+
+def make_rows(n: int) -> list[dict]:
+    rng = random.Random(0)
+    now = datetime.now(timezone.utc)
+    return [
+        {
+            "ride_id": uuid.UUID(int=rng.getrandbits(128), version=4),
+            "start_location": {"latitude": 12.9 + rng.random() / 10, "longitude": 77.5 + rng.random() / 10},
+            "end_location": {"latitude": 12.9 + rng.random() / 10, "longitude": 77.5 + rng.random() / 10},
+            "start_address": "Koramangala 5th Block",
+            "end_address": "Christ University Central Campus",
+            "ride_date": date.today() + timedelta(days=rng.randint(0, 14)),
+            "ride_time": dt_time(rng.randint(7, 18), 30),
+            "available_seats": rng.randint(1, 4),
+            "allowed_gender": AllowedGenderEnum.any,
+            "allowed_community": None,
+            "estimated_fare": Decimal(f"{rng.uniform(30, 250):.2f}"),
+            "status": RideStatusEnum.open,
+            "created_at": now - timedelta(minutes=rng.randint(0, 10_000)),
+        }
+        for _ in range(n)
+    ]
+
+
+def build_app(rows: list[dict]) -> FastAPI:
+    objects = [SimpleNamespace(**row) for row in rows]
+    app = FastAPI()
+
+    @app.get("/response_model", response_model=list[RideRead])
+    async def via_response_model():
+        return objects
+
+    @app.get("/adapter", response_model=list[RideRead])
+    async def via_adapter():
+        return list_response(RideRead, objects)
+
+    @app.get("/trusted", response_model=list[RideRead])
+    async def via_trusted():
+        return list_response(RideRead, rows, trusted=True)
+
+    return app
+
+
+async def time_path(client: httpx.AsyncClient, path: str, repeat: int) -> tuple[list[float], int]:
+    await client.get(path)  # warm caches / adapters
+    samples = []
+    size = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        response = await client.get(path)
+        samples.append(time.perf_counter() - started)
+        size = len(response.content)
+    return samples, size
+
+
+async def run(n_rows: int, repeat: int) -> None:
+    app = build_app(make_rows(n_rows))
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        results = {path: await time_path(client, path, repeat) for path in ("/response_model", "/adapter", "/trusted")}
+
+    baseline = statistics.median(results["/response_model"][0])
+    print(f"{n_rows:,} rows, {repeat} requests each\n")
+    print(f"{'path':<16} {'median ms':>10} {'p95 ms':>9} {'KiB':>8} {'speedup':>8}")
+    for path, (samples, size) in results.items():
+        median = statistics.median(samples)
+        p95 = sorted(samples)[max(0, int(len(samples) * 0.95) - 1)]
+        print(f"{path.strip('/'):<16} {median * 1000:10.1f} {p95 * 1000:9.1f} {size / 1024:8.0f} {baseline / median:7.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare list serialization paths")
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(run(args.rows, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
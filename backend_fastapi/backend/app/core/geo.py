@@ -0,0 +1,116 @@
+"""
+EWKB codec for PostGIS POINTs.
+
+PostGIS returns geography/geometry values as (E)WKB, which geoalchemy2 wraps
+in WKBElement. Reading a point only needs the two doubles at a fixed offset,
+so this module decodes them with `struct` instead of building a shapely
+geometry per row. It is the single conversion point between DB values and
+{latitude, longitude}; app code should not call into shapely for points
+(geoalchemy2 itself still imports shapely and numpy at load time).
+
+    decode_point(ride.start_location)          -> (lat, lng) | None
+    point_to_dict(ride.start_location)         -> {"latitude", "longitude"} | None
+    decode_points(values)                      -> batch decode
+    geography_point(lat, lng)                  -> SQL value for a Geography column
+    point_coords(column, "start")              -> SQL-side start_lat / start_lng columns
+    point_json(column)                         -> SQL-side {latitude, longitude} JSON
+"""
+import math
+import struct
+from typing import Any, Iterable, Optional
+
+from geoalchemy2 import Geometry
+from sqlalchemy import JSON, cast, func
+
+SRID_WGS84 = 4326
+
+_SRID_FLAG = 0x20000000
+_Z_FLAG = 0x80000000
+_M_FLAG = 0x40000000
+_WKB_POINT = 1
+
+_HEADER = {0: struct.Struct(">BI"), 1: struct.Struct("<BI")}
+_UINT = {0: struct.Struct(">I"), 1: struct.Struct("<I")}
+_XY = {0: struct.Struct(">dd"), 1: struct.Struct("<dd")}
+
+# Little-endian EWKB POINT with SRID 4326: what PostGIS sends for our columns
+_COMMON_PREFIX = struct.pack("<BII", 1, _WKB_POINT | _SRID_FLAG, SRID_WGS84)
+_COMMON_XY = _XY[1]
+
+Coords = tuple[float, float]
+
+
+def _as_bytes(value: Any) -> Optional[bytes]:
+    if value is None:
+        return None
+    data = getattr(value, "data", value)  # WKBElement keeps the raw value in .data
+    if isinstance(data, str):
+        return bytes.fromhex(data)
+    return bytes(data)
+
+
+def _decode(data: bytes) -> Optional[Coords]:
+    if data.startswith(_COMMON_PREFIX):
+        x, y = _COMMON_XY.unpack_from(data, len(_COMMON_PREFIX))
+    else:
+        byte_order, geom_type = _HEADER[data[0]].unpack_from(data, 0)
+        offset = 5
+        if geom_type & _SRID_FLAG:
+            offset += 4
+        # ISO WKB encodes Z/M as 1001/2001/3001, EWKB as high flag bits
+        if (geom_type & ~(_SRID_FLAG | _Z_FLAG | _M_FLAG)) % 1000 != _WKB_POINT:
+            raise ValueError(f"Expected a WKB POINT, got geometry type {geom_type:#x}")
+        x, y = _XY[byte_order].unpack_from(data, offset)
+    if math.isnan(x) or math.isnan(y):  # POINT EMPTY
+        return None
+    return y, x
+
+
+def decode_point(value: Any) -> Optional[Coords]:
+    """Decode a WKBElement / (E)WKB bytes / hex string into (latitude, longitude)."""
+    data = _as_bytes(value)
+    return _decode(data) if data else None
+
+
+def decode_points(values: Iterable[Any]) -> list[Optional[Coords]]:
+    """Decode many points, e.g. every ride endpoint in a list response."""
+    return [decode_point(value) for value in values]
+
+
+def point_to_dict(value: Any) -> Optional[dict]:
+    """Decode a point into the {latitude, longitude} shape used by the API."""
+    coords = decode_point(value)
+    if coords is None:
+        return None
+    return {"latitude": coords[0], "longitude": coords[1]}
+
+
+def encode_point(latitude: float, longitude: float, srid: int = SRID_WGS84) -> bytes:
+    """Little-endian EWKB POINT (x = longitude, y = latitude)."""
+    return struct.pack("<BIIdd", 1, _WKB_POINT | _SRID_FLAG, srid, longitude, latitude)
+
+
+def geography_point(latitude: float, longitude: float):
+    """SQL expression assignable to a Geography(POINT, 4326) column."""
+    return func.ST_GeogFromWKB(encode_point(latitude, longitude))
+
+
+def _as_geometry(column):
+    return cast(column, Geometry(geometry_type="POINT", srid=SRID_WGS84))
+
+
+def point_coords(column, prefix: str) -> list:
+    """Project a geography POINT column as <prefix>_lat / <prefix>_lng floats in SQL."""
+    geom = _as_geometry(column)
+    return [
+        func.ST_Y(geom).label(f"{prefix}_lat"),
+        func.ST_X(geom).label(f"{prefix}_lng"),
+    ]
+
+
+def point_json(column):
+    """Project a geography POINT column as a {latitude, longitude} JSON object in SQL."""
+    geom = _as_geometry(column)
+    return func.json_build_object(
+        "latitude", func.ST_Y(geom), "longitude", func.ST_X(geom), type_=JSON
+    )
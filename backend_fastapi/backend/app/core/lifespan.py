@@ -0,0 +1,163 @@
+"""
+Application lifespan — warm-up, background tasks and graceful drain.
+
+Startup:
+  1. Configure ORM mappers, build the JWT codec and prime DB pool connections
+  2. Run registered warm-up hooks (campus matrix, tracking snapshot, ...)
+  3. Start registered background tasks (sweepers, workers)
+
+Shutdown (uvicorn runs this after SIGTERM stops new connections):
+  1. Wait for in-flight requests to drain (bounded by SHUTDOWN_DRAIN_TIMEOUT_SECONDS)
+  2. Cancel background tasks
+  3. Run shutdown hooks (flush buffered state)
+  4. Dispose the engine so pooled connections close cleanly
+
+Modules register hooks at import time:
+
+    @on_startup
+    def warm_campus_matrix(): ...
+
+    @background_task("ride-expiry-sweeper")
+    async def sweep_loop(): ...
+"""
+import asyncio
+import inspect
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import Awaitable, Callable
+
+from fastapi import FastAPI
+from sqlalchemy import text
+from sqlalchemy.orm import configure_mappers
+
+from core.config import get_settings
+from core.tokens import get_jwt_codec
+from db.session import engine
+
+logger = logging.getLogger("uvicorn.error")
+settings = get_settings()
+
+Hook = Callable[[], Awaitable[None] | None]
+
+_startup_hooks: list[Hook] = []
+_shutdown_hooks: list[Hook] = []
+_background_tasks: dict[str, Callable[[], Awaitable[None]]] = {}
+
+
+def on_startup(fn: Hook) -> Hook:
+    """Register a warm-up hook (sync or async) run before serving traffic."""
+    _startup_hooks.append(fn)
+    return fn
+
+
+def on_shutdown(fn: Hook) -> Hook:
+    """Register a flush hook (sync or async) run after requests have drained."""
+    _shutdown_hooks.append(fn)
+    return fn
+
+
+def background_task(name: str):
+    """Register a long-running coroutine started at startup and cancelled at shutdown."""
+    def decorator(fn: Callable[[], Awaitable[None]]):
+        _background_tasks[name] = fn
+        return fn
+    return decorator
+
+
+async def _run_hook(fn: Hook) -> None:
+    try:
+        result = fn()
+        if inspect.isawaitable(result):
+            await result
+    except Exception:
+        logger.exception("Lifespan hook %s failed", fn.__qualname__)
+
+
+# ---------------------------------------------------------------------------
+# In-flight request tracking
+# ---------------------------------------------------------------------------
+
+class InFlightMiddleware:
+    """Pure ASGI middleware counting HTTP requests currently being served."""
+
+    active = 0
+    _idle = asyncio.Event()
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        cls = type(self)
+        cls.active += 1
+        cls._idle.clear()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            cls.active -= 1
+            if cls.active == 0:
+                cls._idle.set()
+
+    @classmethod
+    async def drain(cls, timeout: float) -> bool:
+        """Wait until no requests are in flight. Returns False on timeout."""
+        if cls.active == 0:
+            return True
+        try:
+            await asyncio.wait_for(cls._idle.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+
+# ---------------------------------------------------------------------------
+# Startup steps
+# ---------------------------------------------------------------------------
+
+async def _prime_pool(connections: int) -> None:
+    """Open pool connections concurrently so the first requests skip the TLS/auth handshake."""
+    async def ping():
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    try:
+        await asyncio.gather(*(ping() for _ in range(connections)))
+    except Exception:
+        logger.exception("Could not prime database pool; connecting lazily instead")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    started = time.perf_counter()
+    configure_mappers()
+    get_jwt_codec()
+    await _prime_pool(settings.DB_POOL_PRIME_CONNECTIONS)
+    for hook in _startup_hooks:
+        await _run_hook(hook)
+
+    tasks = {
+        name: asyncio.create_task(fn(), name=name)
+        for name, fn in _background_tasks.items()
+    }
+    logger.info(
+        "Warm-up finished in %.0f ms (%d hooks, %d background tasks)",
+        (time.perf_counter() - started) * 1000, len(_startup_hooks), len(tasks),
+    )
+
+    try:
+        yield
+    finally:
+        if not await InFlightMiddleware.drain(settings.SHUTDOWN_DRAIN_TIMEOUT_SECONDS):
+            logger.warning("Shutdown drain timed out with %d requests in flight", InFlightMiddleware.active)
+
+        for task in tasks.values():
+            task.cancel()
+        await asyncio.gather(*tasks.values(), return_exceptions=True)
+
+        for hook in _shutdown_hooks:
+            await _run_hook(hook)
+
+        await engine.dispose()
@@ -0,0 +1,182 @@
+"""
+Request and database instrumentation with Prometheus text exposition.
+
+- MetricsMiddleware records per-route latency, response size, status codes
+  and adds a Server-Timing header (app time, DB time, query count).
+- db/session.py feeds query counts/durations into the current request's
+  RequestStats through record_query().
+- render_prometheus() serves everything on GET /metrics.
+
+Metrics are per process; with several uvicorn workers each worker exposes
+its own series.
+"""
+import bisect
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 34, 55)
+
+
+@dataclass
+class RequestStats:
+    """Per-request accumulator populated by the engine event hooks."""
+    query_count: int = 0
+    db_seconds: float = 0.0
+
+
+_request_stats: ContextVar[RequestStats | None] = ContextVar("request_stats", default=None)
+
+
+def current_request_stats() -> RequestStats | None:
+    return _request_stats.get()
+
+
+def record_query(duration: float) -> None:
+    """Called from after_cursor_execute for every statement."""
+    stats = _request_stats.get()
+    if stats is not None:
+        stats.query_count += 1
+        stats.db_seconds += duration
+
+
+# ---------------------------------------------------------------------------
+# Minimal metric types
+# ---------------------------------------------------------------------------
+
+@dataclass
+class Histogram:
+    name: str
+    help: str
+    buckets: tuple
+    series: dict = field(default_factory=dict)  # labels -> [bucket counts..., sum, count]
+
+    def observe(self, labels: tuple, value: float) -> None:
+        row = self.series.get(labels)
+        if row is None:
+            row = self.series[labels] = [0] * (len(self.buckets) + 2)
+        index = bisect.bisect_left(self.buckets, value)
+        if index < len(self.buckets):
+            row[index] += 1
+        row[-2] += value
+        row[-1] += 1
+
+    def render(self, label_names: tuple) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        for labels, row in sorted(self.series.items()):
+            base = _format_labels(label_names, labels)
+            cumulative = 0
+            for bound, count in zip(self.buckets, row):
+                cumulative += count
+                lines.append(f'{self.name}_bucket{{{base},le="{bound}"}} {cumulative}')
+            lines.append(f'{self.name}_bucket{{{base},le="+Inf"}} {row[-1]}')
+            lines.append(f"{self.name}_sum{{{base}}} {row[-2]}")
+            lines.append(f"{self.name}_count{{{base}}} {row[-1]}")
+        return lines
+
+
+@dataclass
+class Counter:
+    name: str
+    help: str
+    series: dict = field(default_factory=dict)
+
+    def inc(self, labels: tuple, value: float = 1) -> None:
+        self.series[labels] = self.series.get(labels, 0) + value
+
+    def render(self, label_names: tuple) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        for labels, value in sorted(self.series.items()):
+            lines.append(f"{self.name}{{{_format_labels(label_names, labels)}}} {value}")
+        return lines
+
+
+def _format_labels(names: tuple, values: tuple) -> str:
+    return ",".join(f'{n}="{v}"' for n, v in zip(names, values))
+
+
+ROUTE_LABELS = ("method", "route")
+
+request_latency = Histogram(
+    "http_request_duration_seconds", "Request latency by route.", LATENCY_BUCKETS
+)
+response_size = Histogram(
+    "http_response_size_bytes", "Response body size by route.", SIZE_BUCKETS
+)
+request_queries = Histogram(
+    "http_request_db_queries", "SQL statements executed per request.", QUERY_COUNT_BUCKETS
+)
+request_db_time = Counter(
+    "http_request_db_seconds_total", "Time spent in SQL statements by route."
+)
+responses_total = Counter(
+    "http_responses_total", "Responses by route and status code."
+)
+
+
+# ---------------------------------------------------------------------------
+# Middleware
+# ---------------------------------------------------------------------------
+
+class MetricsMiddleware:
+    """Pure ASGI middleware recording per-route timings and adding Server-Timing."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] == "/metrics":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = _request_stats.set(stats)
+        started = time.perf_counter()
+        status_code = 500
+        body_bytes = 0
+
+        async def send_wrapper(message):
+            nonlocal status_code, body_bytes
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                elapsed_ms = (time.perf_counter() - started) * 1000
+                timing = (
+                    f'app;dur={elapsed_ms:.1f}, '
+                    f'db;dur={stats.db_seconds * 1000:.1f};desc="{stats.query_count} queries"'
+                )
+                message["headers"] = list(message.get("headers", [])) + [
+                    (b"server-timing", timing.encode())
+                ]
+            elif message["type"] == "http.response.body":
+                body_bytes += len(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _request_stats.reset(token)
+            route = scope.get("route")
+            # Use the path template, never the raw path, to bound label cardinality
+            labels = (scope["method"], route.path if route is not None else "unmatched")
+            request_latency.observe(labels, time.perf_counter() - started)
+            response_size.observe(labels, body_bytes)
+            request_queries.observe(labels, stats.query_count)
+            request_db_time.inc(labels, stats.db_seconds)
+            responses_total.inc(labels + (str(status_code),))
+
+
+def render_prometheus(in_flight: int) -> str:
+    """Render all metrics in the Prometheus text exposition format."""
+    lines = [
+        "# HELP http_requests_in_flight Requests currently being served.",
+        "# TYPE http_requests_in_flight gauge",
+        f"http_requests_in_flight {in_flight}",
+    ]
+    lines += request_latency.render(ROUTE_LABELS)
+    lines += response_size.render(ROUTE_LABELS)
+    lines += request_queries.render(ROUTE_LABELS)
+    lines += request_db_time.render(ROUTE_LABELS)
+    lines += responses_total.render(ROUTE_LABELS + ("status",))
+    return "\n".join(lines) + "\n"
@@ -8,9 +8,8 @@ import secrets
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
-from jose import jwt, JWTError
-
 from core.config import get_settings
+from core.tokens import get_jwt_codec, TokenError
 
 settings = get_settings()
 
@@ -92,11 +91,7 @@ def create_token(
         "type": token_type
     })
 
-    return jwt.encode(
-        to_encode,
-        settings.JWT_SECRET_KEY,
-        algorithm=settings.JWT_ALGORITHM
-    )
+    return get_jwt_codec().encode(to_encode)
 
 
 def decode_token(token: str, expected_type: str | None = None) -> dict[str, Any] | None:
@@ -111,20 +106,16 @@ def decode_token(token: str, expected_type: str | None = None) -> dict[str, Any]
         Decoded payload or None if invalid
     """
     try:
-        payload = jwt.decode(
-            token,
-            settings.JWT_SECRET_KEY,
-            algorithms=[settings.JWT_ALGORITHM]
-        )
-
-        # Validate token type if specified
-        if expected_type and payload.get("type") != expected_type:
-            return None
-
-        return payload
-    except JWTError:
+        payload = get_jwt_codec().decode(token)
+    except TokenError:
         return None
 
+    # Validate token type if specified
+    if expected_type and payload.get("type") != expected_type:
+        return None
+
+    return payload
+
 
 def create_access_token(user_id: str) -> str:
     """Create a short-lived access token for authenticated user (1 hour)."""
@@ -0,0 +1,249 @@
+"""
+Compact JWT codec with key material parsed once at startup.
+
+python-jose re-parses the key (json.loads + jwk.construct) and the algorithm
+list on every decode. Access tokens are verified on every authenticated
+request, so the codec pins the algorithm and prepares the signing and
+verification keys once from Settings.
+
+Supported algorithms:
+- HS256 / HS384 / HS512 — shared secret (JWT_SECRET_KEY)
+- ES256 / EdDSA         — PEM keys (JWT_PRIVATE_KEY / JWT_PUBLIC_KEY); edge
+                          proxies can then verify tokens with the public key only
+"""
+import base64
+import hashlib
+import hmac
+import json
+import time
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Callable
+
+from core.config import get_settings
+
+
+class TokenError(Exception):
+    """Raised when a token cannot be signed or fails verification."""
+    pass
+
+
+HMAC_ALGORITHMS = {
+    "HS256": hashlib.sha256,
+    "HS384": hashlib.sha384,
+    "HS512": hashlib.sha512,
+}
+ASYMMETRIC_ALGORITHMS = ("ES256", "EdDSA")
+
+
+def _b64encode(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+def _b64decode(data: bytes) -> bytes:
+    return base64.urlsafe_b64decode(data + b"=" * (-len(data) % 4))
+
+
+def _json_default(value: Any) -> Any:
+    """Encode datetimes as NumericDate (seconds since epoch), like python-jose."""
+    if isinstance(value, datetime):
+        return int(value.timestamp())
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _load_pem(value: str) -> bytes:
+    # Env vars usually carry PEM blocks with literal "\n" sequences
+    return value.replace("\\n", "\n").encode()
+
+
+class JWTCodec:
+    """
+    Signs and verifies compact JWS tokens for a single pinned algorithm.
+
+    Build once (see get_jwt_codec) and reuse: all key parsing happens in
+    __init__, so encode/decode only do base64, JSON and the signature check.
+    """
+
+    def __init__(
+        self,
+        algorithm: str,
+        secret_key: str = "",
+        private_key_pem: str = "",
+        public_key_pem: str = "",
+    ):
+        self.algorithm = algorithm
+        self._sign: Callable[[bytes], bytes]
+        self._verify: Callable[[bytes, bytes], bool]
+
+        if algorithm in HMAC_ALGORITHMS:
+            self._init_hmac(HMAC_ALGORITHMS[algorithm], secret_key.encode())
+        elif algorithm == "ES256":
+            self._init_es256(private_key_pem, public_key_pem)
+        elif algorithm == "EdDSA":
+            self._init_eddsa(private_key_pem, public_key_pem)
+        else:
+            raise TokenError(f"Unsupported JWT algorithm: {algorithm}")
+
+        header = json.dumps(
+            {"alg": algorithm, "typ": "JWT"}, separators=(",", ":"), sort_keys=True
+        )
+        self._header_segment = _b64encode(header.encode())
+
+    # ------------------------------------------------------------------
+    # Key setup
+    # ------------------------------------------------------------------
+
+    def _init_hmac(self, digest, secret: bytes) -> None:
+        def sign(signing_input: bytes) -> bytes:
+            return hmac.new(secret, signing_input, digest).digest()
+
+        def verify(signing_input: bytes, signature: bytes) -> bool:
+            return hmac.compare_digest(sign(signing_input), signature)
+
+        self._sign = sign
+        self._verify = verify
+
+    def _init_es256(self, private_key_pem: str, public_key_pem: str) -> None:
+        from cryptography.exceptions import InvalidSignature
+        from cryptography.hazmat.primitives import hashes, serialization
+        from cryptography.hazmat.primitives.asymmetric import ec
+        from cryptography.hazmat.primitives.asymmetric.utils import (
+            decode_dss_signature,
+            encode_dss_signature,
+        )
+
+        private_key = (
+            serialization.load_pem_private_key(_load_pem(private_key_pem), password=None)
+            if private_key_pem else None
+        )
+        if public_key_pem:
+            public_key = serialization.load_pem_public_key(_load_pem(public_key_pem))
+        elif private_key is not None:
+            public_key = private_key.public_key()
+        else:
+            raise TokenError("ES256 requires JWT_PUBLIC_KEY or JWT_PRIVATE_KEY")
+        ecdsa = ec.ECDSA(hashes.SHA256())
+
+        def sign(signing_input: bytes) -> bytes:
+            if private_key is None:
+                raise TokenError("No JWT_PRIVATE_KEY configured; this node can only verify")
+            r, s = decode_dss_signature(private_key.sign(signing_input, ecdsa))
+            return r.to_bytes(32, "big") + s.to_bytes(32, "big")
+
+        def verify(signing_input: bytes, signature: bytes) -> bool:
+            if len(signature) != 64:
+                return False
+            der = encode_dss_signature(
+                int.from_bytes(signature[:32], "big"),
+                int.from_bytes(signature[32:], "big"),
+            )
+            try:
+                public_key.verify(der, signing_input, ecdsa)
+                return True
+            except InvalidSignature:
+                return False
+
+        self._sign = sign
+        self._verify = verify
+
+    def _init_eddsa(self, private_key_pem: str, public_key_pem: str) -> None:
+        from cryptography.exceptions import InvalidSignature
+        from cryptography.hazmat.primitives import serialization
+
+        private_key = (
+            serialization.load_pem_private_key(_load_pem(private_key_pem), password=None)
+            if private_key_pem else None
+        )
+        if public_key_pem:
+            public_key = serialization.load_pem_public_key(_load_pem(public_key_pem))
+        elif private_key is not None:
+            public_key = private_key.public_key()
+        else:
+            raise TokenError("EdDSA requires JWT_PUBLIC_KEY or JWT_PRIVATE_KEY")
+
+        def sign(signing_input: bytes) -> bytes:
+            if private_key is None:
+                raise TokenError("No JWT_PRIVATE_KEY configured; this node can only verify")
+            return private_key.sign(signing_input)
+
+        def verify(signing_input: bytes, signature: bytes) -> bool:
+            try:
+                public_key.verify(signature, signing_input)
+                return True
+            except InvalidSignature:
+                return False
+
+        self._sign = sign
+        self._verify = verify
+
+    # ------------------------------------------------------------------
+    # Encode / decode
+    # ------------------------------------------------------------------
+
+    def encode(self, claims: dict[str, Any]) -> str:
+        """Serialize and sign claims into a compact JWS string."""
+        payload = json.dumps(claims, separators=(",", ":"), default=_json_default)
+        signing_input = self._header_segment + b"." + _b64encode(payload.encode())
+        signature = self._sign(signing_input)
+        return (signing_input + b"." + _b64encode(signature)).decode()
+
+    def decode(self, token: str) -> dict[str, Any]:
+        """
+        Verify the signature and time claims of a token and return its claims.
+
+        Raises:
+            TokenError: If the token is malformed, uses another algorithm,
+                        has a bad signature, is expired or not yet valid.
+        """
+        try:
+            raw = token.encode("ascii")
+            signing_input, _, signature_segment = raw.rpartition(b".")
+            header_segment, _, payload_segment = signing_input.partition(b".")
+            if not header_segment or not payload_segment:
+                raise TokenError("Malformed token")
+
+            # Tokens we issued carry a byte-identical header; only parse others
+            if header_segment != self._header_segment:
+                header = json.loads(_b64decode(header_segment))
+                if not isinstance(header, dict) or header.get("alg") != self.algorithm:
+                    raise TokenError("Token algorithm not allowed")
+
+            if not self._verify(signing_input, _b64decode(signature_segment)):
+                raise TokenError("Signature verification failed")
+
+            claims = json.loads(_b64decode(payload_segment))
+        except TokenError:
+            raise
+        except (ValueError, UnicodeError) as e:
+            raise TokenError("Malformed token") from e
+
+        if not isinstance(claims, dict):
+            raise TokenError("Invalid claims payload")
+
+        now = time.time()
+        exp = claims.get("exp")
+        if exp is not None:
+            if not isinstance(exp, (int, float)):
+                raise TokenError("Invalid exp claim")
+            if exp < now:
+                raise TokenError("Token has expired")
+        nbf = claims.get("nbf")
+        if nbf is not None:
+            if not isinstance(nbf, (int, float)):
+                raise TokenError("Invalid nbf claim")
+            if nbf > now:
+                raise TokenError("Token is not yet valid")
+
+        return claims
+
+
+@lru_cache
+def get_jwt_codec() -> JWTCodec:
+    """Get the process-wide codec built from Settings."""
+    settings = get_settings()
+    return JWTCodec(
+        algorithm=settings.JWT_ALGORITHM,
+        secret_key=settings.JWT_SECRET_KEY,
+        private_key_pem=settings.JWT_PRIVATE_KEY,
+        public_key_pem=settings.JWT_PUBLIC_KEY,
+    )
@@ -1,6 +1,6 @@
 import asyncio
 import sys
-import main  # Ensure all models are registered
+import db.models  # Ensure all models are registered
 from db.session import AsyncSessionLocal
 from db.models.users import User
 from sqlalchemy import select
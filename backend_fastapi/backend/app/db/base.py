@@ -1,4 +1,11 @@
 from sqlalchemy.orm import DeclarativeBase
 
 class Base(DeclarativeBase):
+    """
+    Declarative base for all models.
+
+    Relationships are declared with lazy="raise_on_sql": queries must load
+    the relationships they use (selectinload / joinedload), so an accidental
+    per-row lazy load raises instead of silently adding queries.
+    """
     pass
@@ -17,12 +17,19 @@ class RideStatusEnum(str, enum.Enum):
     ongoing = "ongoing"
     completed = "completed"
     cancelled = "cancelled"
+    expired = "expired"  # still open when its departure time passed
 
 class RideRequestStatusEnum(str, enum.Enum):
     pending = "pending"
     accepted = "accepted"
     rejected = "rejected"
 
+class OcrStatusEnum(str, enum.Enum):
+    queued = "queued"
+    running = "running"
+    done = "done"
+    failed = "failed"
+
 class AllowedGenderEnum(str, enum.Enum):
     any = "any"
     male = "male"
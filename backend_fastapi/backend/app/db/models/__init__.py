@@ -0,0 +1,13 @@
+"""
+Model registry.
+Importing this package registers every table with Base.metadata, so callers
+(main.py, Alembic, CLI scripts) only need `import db.models`.
+"""
+from db.models import (
+    users, vehicles, rides, ride_requests, ride_participants, ride_history,
+    driver_profiles, driver_verifications, identity_verifications,
+    college_students, saved_addresses, refresh_tokens, otp_sessions,
+    emergency_contacts, face_data, fare_estimates, ratings, reports,
+    sos_alerts, user_ride_stats, rating_summaries, ride_templates,
+    campus_holidays, driver_daily_seats, sos_notifications,
+)
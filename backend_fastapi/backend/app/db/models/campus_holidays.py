@@ -0,0 +1,11 @@
+from sqlalchemy import Date, String
+from sqlalchemy.orm import Mapped, mapped_column
+from db.base import Base
+
+
+class CampusHoliday(Base):
+    """Days on which recurring rides are not materialized."""
+    __tablename__ = "campus_holidays"
+
+    holiday_date: Mapped[str] = mapped_column(Date, primary_key=True)
+    name: Mapped[str] = mapped_column(String(100), nullable=False)
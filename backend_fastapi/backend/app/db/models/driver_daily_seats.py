@@ -0,0 +1,19 @@
+from sqlalchemy import Integer, Date, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+from db.base import Base
+
+
+class DriverDailySeats(Base):
+    """
+    Seats a driver has filled on a given day, across all of their rides.
+    Kept in step with accepted requests by services/seat_limit_service.py so
+    DriverProfile.daily_seat_limit can be checked without summing rides.
+    """
+    __tablename__ = "driver_daily_seats"
+
+    driver_id: Mapped[UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("users.user_id"), primary_key=True
+    )
+    ride_date: Mapped[str] = mapped_column(Date, primary_key=True)
+    seats_reserved: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
@@ -20,10 +20,12 @@ class DriverProfile(Base):
 
     user = relationship(
         "User",
+        lazy="raise_on_sql",
         uselist=False
     )
 
     vehicle = relationship(
         "Vehicle",
+        lazy="raise_on_sql",
         uselist=False
     )
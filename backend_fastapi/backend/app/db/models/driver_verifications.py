@@ -3,7 +3,7 @@ Driver verification model.
 Stores driver license verification requests.
 """
 import uuid
-from sqlalchemy import String, TIMESTAMP, Enum, Text, ForeignKey
+from sqlalchemy import String, TIMESTAMP, Enum, Text, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
@@ -13,12 +13,16 @@ from db.enums import VerificationStatusEnum
 
 class DriverVerification(Base):
     __tablename__ = "driver_verifications"
+    __table_args__ = (
+        # Admin review queue: WHERE status = ... ORDER BY created_at
+        Index("ix_driver_verifications_status_created_at", "status", "created_at"),
+    )
 
     verification_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
     )
     user_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("users.user_id"), nullable=False
+        UUID(as_uuid=True), ForeignKey("users.user_id"), nullable=False, index=True
     )
     license_number: Mapped[str | None] = mapped_column(String(50))
     license_document_url: Mapped[str | None] = mapped_column(String)
@@ -30,3 +34,9 @@ class DriverVerification(Base):
         TIMESTAMP(timezone=True), server_default=func.now()
     )
     reviewed_at: Mapped[str | None] = mapped_column(TIMESTAMP(timezone=True))
+
+    # Review lease (services/review_queue.py): the admin working on it, until when
+    claimed_by: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("users.user_id")
+    )
+    claimed_until: Mapped[str | None] = mapped_column(TIMESTAMP(timezone=True))
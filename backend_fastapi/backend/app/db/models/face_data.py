@@ -13,4 +13,5 @@ class FaceData(Base):
         primary_key=True
     )
     face_embedding: Mapped[list[float]] = mapped_column(ARRAY(Float), nullable=False)
-    last_verified_at: Mapped[str | None] = mapped_column(TIMESTAMP)
+    # Watermark for services/face_match_service.py picking up new embeddings
+    last_verified_at: Mapped[str | None] = mapped_column(TIMESTAMP(timezone=True), index=True)
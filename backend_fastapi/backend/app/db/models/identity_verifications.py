@@ -3,22 +3,31 @@ Identity verification model.
 Stores verification requests for college student identity (ID card, etc.).
 """
 import uuid
-from sqlalchemy import String, TIMESTAMP, Enum, Text, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import String, TIMESTAMP, Enum, Text, ForeignKey, Float, Index, text
+from sqlalchemy.dialects.postgresql import UUID, ARRAY
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 from db.base import Base
-from db.enums import VerificationStatusEnum
+from db.enums import VerificationStatusEnum, OcrStatusEnum
 
 
 class IdentityVerification(Base):
     __tablename__ = "identity_verifications"
+    __table_args__ = (
+        # Admin review queue: WHERE status = ... ORDER BY created_at
+        Index("ix_identity_verifications_status_created_at", "status", "created_at"),
+        # OCR job queue (services/ocr_service.py claims from here)
+        Index(
+            "ix_identity_verifications_ocr_queue", "created_at",
+            postgresql_where=text("ocr_status IN ('queued', 'running')"),
+        ),
+    )
 
     verification_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
     )
     user_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("users.user_id"), nullable=False
+        UUID(as_uuid=True), ForeignKey("users.user_id"), nullable=False, index=True
     )
     college_id_number: Mapped[str | None] = mapped_column(String(50))
     document_url: Mapped[str | None] = mapped_column(String)
@@ -30,3 +39,21 @@ class IdentityVerification(Base):
         TIMESTAMP(timezone=True), server_default=func.now()
     )
     reviewed_at: Mapped[str | None] = mapped_column(TIMESTAMP(timezone=True))
+
+    # Review lease (services/review_queue.py): the admin working on it, until when
+    claimed_by: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("users.user_id")
+    )
+    claimed_until: Mapped[str | None] = mapped_column(TIMESTAMP(timezone=True))
+
+    # OCR pre-read of the document for the admin reviewer
+    ocr_status: Mapped[OcrStatusEnum | None] = mapped_column(Enum(OcrStatusEnum))
+    ocr_college_id_number: Mapped[str | None] = mapped_column(String(50))
+    ocr_flags: Mapped[list[str] | None] = mapped_column(ARRAY(String))
+    ocr_started_at: Mapped[str | None] = mapped_column(TIMESTAMP(timezone=True))
+    ocr_completed_at: Mapped[str | None] = mapped_column(TIMESTAMP(timezone=True))
+
+    # Closest other account by face embedding (services/face_index.py),
+    # set when the similarity reaches FACE_DUPLICATE_THRESHOLD
+    face_match_user_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True))
+    face_match_score: Mapped[float | None] = mapped_column(Float)
@@ -0,0 +1,22 @@
+from sqlalchemy import Integer, TIMESTAMP, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+from db.base import Base
+
+
+class RatingSummary(Base):
+    """
+    Running sum/count of ratings received per user, upserted in the same
+    transaction as each new rating. Average = rating_sum / rating_count.
+    """
+    __tablename__ = "rating_summaries"
+
+    user_id: Mapped[UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("users.user_id"), primary_key=True
+    )
+    rating_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    rating_sum: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    updated_at: Mapped[str] = mapped_column(
+        TIMESTAMP(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
@@ -16,13 +16,13 @@ class Rating(Base):
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
     )
     ride_id: Mapped[UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("rides.ride_id")
+        UUID(as_uuid=True), ForeignKey("rides.ride_id"), index=True
     )
     rater_id: Mapped[UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("users.user_id")
     )
     rated_user_id: Mapped[UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("users.user_id")
+        UUID(as_uuid=True), ForeignKey("users.user_id"), index=True
     )
     rating_value: Mapped[int] = mapped_column(Integer)
     comment: Mapped[str | None]
@@ -11,6 +11,9 @@ class RefreshToken(Base):
     Refresh token model for persistent login.
     Tokens are hashed before storage. Each login issues a new token,
     and token rotation is enforced on every refresh.
+
+    All tokens rotated from the same login share a family_id, so reuse of
+    a rotated token can revoke the whole chain.
     """
     __tablename__ = "refresh_tokens"
 
@@ -20,8 +23,12 @@ class RefreshToken(Base):
     user_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("users.user_id", ondelete="CASCADE"), nullable=False
     )
+    family_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), nullable=False, index=True
+    )
     token_hash: Mapped[str] = mapped_column(String(64), unique=True, nullable=False)
     is_revoked: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    revoked_at: Mapped[str | None] = mapped_column(TIMESTAMP(timezone=True))
     expires_at: Mapped[str] = mapped_column(TIMESTAMP(timezone=True), nullable=False)
     created_at: Mapped[str] = mapped_column(
         TIMESTAMP(timezone=True), server_default=func.now()
@@ -19,7 +19,7 @@ class Report(Base):
         UUID(as_uuid=True), ForeignKey("rides.ride_id"), nullable=False
     )
     reporter_id: Mapped[UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("users.user_id"), nullable=False
+        UUID(as_uuid=True), ForeignKey("users.user_id"), nullable=False, index=True
     )
     reported_user_id: Mapped[UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("users.user_id"), nullable=False
@@ -1,11 +1,35 @@
 import uuid
-from sqlalchemy import TIMESTAMP, ForeignKey
+from sqlalchemy import TIMESTAMP, DECIMAL, ForeignKey, Index, String, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 from db.base import Base
 
+# Columns carried by the history indexes so GET /users/me/history is index-only
+_HISTORY_ROW_COLUMNS = [
+    "ride_id", "start_address", "end_address", "fare", "driver_name", "passenger_name",
+]
+
+
 class RideHistory(Base):
+    """
+    One row per (completed ride, passenger), written by the ride completion
+    pipeline. Addresses, fare and both names are copied in so history pages
+    never join back to rides or users.
+    """
     __tablename__ = "ride_history"
+    __table_args__ = (
+        UniqueConstraint("ride_id", "passenger_id"),
+        Index(
+            "ix_ride_history_passenger_completed",
+            "passenger_id", "completed_at", "history_id",
+            postgresql_include=_HISTORY_ROW_COLUMNS + ["driver_id"],
+        ),
+        Index(
+            "ix_ride_history_driver_completed",
+            "driver_id", "completed_at", "history_id",
+            postgresql_include=_HISTORY_ROW_COLUMNS + ["passenger_id"],
+        ),
+    )
 
     history_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
@@ -22,3 +46,10 @@ class RideHistory(Base):
     completed_at: Mapped[str] = mapped_column(
         TIMESTAMP(timezone=True), nullable=False
     )
+
+    # Denormalized from rides / users at completion time
+    start_address: Mapped[str | None] = mapped_column(String)
+    end_address: Mapped[str | None] = mapped_column(String)
+    fare: Mapped[float | None] = mapped_column(DECIMAL(6, 2))
+    driver_name: Mapped[str | None] = mapped_column(String(100))
+    passenger_name: Mapped[str | None] = mapped_column(String(100))
@@ -13,10 +13,10 @@ class RideParticipant(Base):
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
     )
     ride_id: Mapped[UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("rides.ride_id"), nullable=False
+        UUID(as_uuid=True), ForeignKey("rides.ride_id"), nullable=False, index=True
     )
     user_id: Mapped[UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("users.user_id"), nullable=False
+        UUID(as_uuid=True), ForeignKey("users.user_id"), nullable=False, index=True
     )
 
     # Per-rider pickup location (copied from request on accept)
@@ -34,10 +34,12 @@ class RideParticipant(Base):
 
     ride = relationship(
         "Ride",
+        lazy="raise_on_sql",
         back_populates="participants"
     )
 
     user = relationship(
         "User",
+        lazy="raise_on_sql",
         back_populates="ride_participations"
     )
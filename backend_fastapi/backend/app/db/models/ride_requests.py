@@ -37,10 +37,12 @@ class RideRequest(Base):
 
     ride = relationship(
         "Ride",
+        lazy="raise_on_sql",
         back_populates="ride_requests"
     )
 
     passenger = relationship(
         "User",
+        lazy="raise_on_sql",
         back_populates="ride_requests"
     )
\ No newline at end of file
@@ -0,0 +1,56 @@
+import uuid
+from sqlalchemy import (
+    Boolean, Integer, Date, Time, Enum, DECIMAL, TIMESTAMP, ForeignKey, String
+)
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+from geoalchemy2 import Geography
+from db.base import Base
+from db.enums import AllowedGenderEnum
+
+
+class RideTemplate(Base):
+    """
+    A driver's recurring commute. The ride scheduler materializes one Ride
+    per matching weekday (bit 0 = Monday ... bit 6 = Sunday in weekday_mask)
+    over the next RIDE_TEMPLATE_HORIZON_DAYS days.
+    """
+    __tablename__ = "ride_templates"
+
+    template_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    )
+    driver_id: Mapped[UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("users.user_id"), nullable=False, index=True
+    )
+    vehicle_id: Mapped[UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("vehicles.vehicle_id"), nullable=False
+    )
+
+    start_location = mapped_column(Geography(geometry_type="POINT", srid=4326))
+    end_location = mapped_column(Geography(geometry_type="POINT", srid=4326))
+    start_address: Mapped[str] = mapped_column(String)
+    end_address: Mapped[str] = mapped_column(String)
+
+    weekday_mask: Mapped[int] = mapped_column(Integer, nullable=False)
+    ride_time: Mapped[str] = mapped_column(Time, nullable=False)
+    available_seats: Mapped[int] = mapped_column(Integer, nullable=False)
+    allowed_gender: Mapped[AllowedGenderEnum] = mapped_column(
+        Enum(AllowedGenderEnum), nullable=False
+    )
+    allowed_community: Mapped[str | None] = mapped_column(String(50))
+    estimated_fare: Mapped[float | None] = mapped_column(DECIMAL(6, 2))
+
+    valid_from: Mapped[str] = mapped_column(Date, nullable=False)
+    valid_until: Mapped[str | None] = mapped_column(Date)
+    is_active: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
+
+    created_at: Mapped[str] = mapped_column(
+        TIMESTAMP(timezone=True), server_default=func.now()
+    )
+
+    @property
+    def weekdays(self) -> list[int]:
+        """ISO weekdays (1 = Monday) set in weekday_mask."""
+        return [day for day in range(1, 8) if self.weekday_mask & (1 << (day - 1))]
@@ -1,6 +1,7 @@
 import uuid
 from sqlalchemy import (
-    Integer, Date, Time, Enum, DECIMAL, TIMESTAMP, ForeignKey, String
+    Boolean, Integer, Date, Time, Enum, DECIMAL, TIMESTAMP, ForeignKey, String,
+    UniqueConstraint, Index, literal_column, text,
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
@@ -13,6 +14,16 @@ from sqlalchemy.orm import relationship
 
 class Ride(Base):
     __tablename__ = "rides"
+    __table_args__ = (
+        # One materialized ride per template per day (scheduler upserts on this)
+        UniqueConstraint("template_id", "ride_date"),
+        # Only bookable rides: stays the size of the upcoming schedule because
+        # the expiry sweeper moves past rides out of 'open'
+        Index(
+            "ix_rides_open_departure", "ride_date", "ride_time",
+            postgresql_where=text("status = 'open'"),
+        ),
+    )
 
     ride_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
@@ -45,6 +56,15 @@ class Ride(Base):
     )
     pickup_otp: Mapped[str | None] = mapped_column(String(4), nullable=True)
 
+    # Set when materialized from a recurring RideTemplate
+    template_id: Mapped[UUID | None] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("ride_templates.template_id"), nullable=True
+    )
+    # Cancelled by a campus holiday (not the driver); removing the holiday reopens it
+    cancelled_by_holiday: Mapped[bool] = mapped_column(
+        Boolean, nullable=False, default=False, server_default=text("false")
+    )
+
     created_at: Mapped[str] = mapped_column(
         TIMESTAMP(timezone=True), server_default=func.now()
     )
@@ -52,6 +72,7 @@ class Ride(Base):
     # Driver (User)
     driver = relationship(
         "User",
+        lazy="raise_on_sql",
         back_populates="driven_rides",
         foreign_keys=[driver_id]
     )
@@ -59,12 +80,14 @@ class Ride(Base):
     # Vehicle used
     vehicle = relationship(
         "Vehicle",
+        lazy="raise_on_sql",
         back_populates="rides"
     )
 
     # Incoming join requests
     ride_requests = relationship(
         "RideRequest",
+        lazy="raise_on_sql",
         back_populates="ride",
         cascade="all, delete-orphan"
     )
@@ -72,6 +95,12 @@ class Ride(Base):
     # Confirmed participants
     participants = relationship(
         "RideParticipant",
+        lazy="raise_on_sql",
         back_populates="ride",
         cascade="all, delete-orphan"
-    )
\ No newline at end of file
+    )
+
+
+# `status = 'open'` as an inline literal rather than a bind parameter, so
+# prepared (generic) plans can still match the ix_rides_open_departure predicate
+RIDE_IS_OPEN = Ride.__table__.c.status == literal_column("'open'")
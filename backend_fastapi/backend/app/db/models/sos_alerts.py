@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import TIMESTAMP, ForeignKey
+from sqlalchemy import TIMESTAMP, ForeignKey, Index, Text, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
@@ -8,12 +8,20 @@ from db.base import Base
 
 class SOSAlert(Base):
     __tablename__ = "sos_alerts"
+    __table_args__ = (
+        # Security's live view: WHERE resolved_at IS NULL ORDER BY triggered_at DESC.
+        # Stays as small as the number of open alerts however much history piles up.
+        Index(
+            "ix_sos_alerts_unresolved", "triggered_at",
+            postgresql_where=text("resolved_at IS NULL"),
+        ),
+    )
 
     alert_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
     )
     user_id: Mapped[UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("users.user_id"), nullable=False
+        UUID(as_uuid=True), ForeignKey("users.user_id"), nullable=False, index=True
     )
     ride_id: Mapped[UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("rides.ride_id"), nullable=False
@@ -24,3 +32,14 @@ class SOSAlert(Base):
     triggered_at: Mapped[str] = mapped_column(
         TIMESTAMP(timezone=True), server_default=func.now()
     )
+
+    # Lifecycle: acknowledged (someone is responding) -> resolved
+    acknowledged_at: Mapped[str | None] = mapped_column(TIMESTAMP(timezone=True))
+    acknowledged_by: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("users.user_id")
+    )
+    resolved_at: Mapped[str | None] = mapped_column(TIMESTAMP(timezone=True))
+    resolved_by: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("users.user_id")
+    )
+    resolution_notes: Mapped[str | None] = mapped_column(Text)
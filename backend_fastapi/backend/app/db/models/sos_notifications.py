@@ -0,0 +1,29 @@
+import uuid
+from sqlalchemy import TIMESTAMP, Boolean, ForeignKey, Integer, String, Text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+from db.base import Base
+
+
+class SOSNotification(Base):
+    """One emergency SMS sent for an SOS alert (services/sos_dispatch.py)."""
+    __tablename__ = "sos_notifications"
+
+    notification_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    )
+    alert_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("sos_alerts.alert_id"), nullable=False, index=True
+    )
+    # NULL for campus security numbers
+    contact_id: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("emergency_contacts.contact_id", ondelete="SET NULL")
+    )
+    phone: Mapped[str] = mapped_column(String(15), nullable=False)
+    delivered: Mapped[bool] = mapped_column(Boolean, nullable=False)
+    error: Mapped[str | None] = mapped_column(Text)
+    latency_ms: Mapped[int] = mapped_column(Integer, nullable=False)
+    sent_at: Mapped[str] = mapped_column(
+        TIMESTAMP(timezone=True), server_default=func.now()
+    )
@@ -0,0 +1,20 @@
+from sqlalchemy import Integer, Float, TIMESTAMP, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+from db.base import Base
+
+
+class UserRideStats(Base):
+    """
+    Per-user ride aggregates, maintained incrementally by the ride
+    completion pipeline (services/ride_completion_service.py).
+    """
+    __tablename__ = "user_ride_stats"
+
+    user_id: Mapped[UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("users.user_id"), primary_key=True
+    )
+    rides_given: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    rides_taken: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    distance_shared_km: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    last_ride_at: Mapped[str | None] = mapped_column(TIMESTAMP(timezone=True))
@@ -43,7 +43,7 @@ class User(Base):
     
     # Timestamps
     created_at: Mapped[str] = mapped_column(
-        TIMESTAMP(timezone=True), server_default=func.now()
+        TIMESTAMP(timezone=True), server_default=func.now(), index=True
     )
     updated_at: Mapped[str | None] = mapped_column(
         TIMESTAMP(timezone=True), onupdate=func.now()
@@ -52,20 +52,24 @@ class User(Base):
     # Relationships
     driven_rides = relationship(
         "Ride",
+        lazy="raise_on_sql",
         back_populates="driver"
     )
 
     vehicles = relationship(
         "Vehicle",
+        lazy="raise_on_sql",
         back_populates="owner"
     )
 
     ride_requests = relationship(
         "RideRequest",
+        lazy="raise_on_sql",
         back_populates="passenger"
     )
 
     ride_participations = relationship(
         "RideParticipant",
+        lazy="raise_on_sql",
         back_populates="user"
     )
\ No newline at end of file
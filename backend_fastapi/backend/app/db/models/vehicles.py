@@ -14,7 +14,7 @@ class Vehicle(Base):
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
     )
     user_id: Mapped[UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("users.user_id")
+        UUID(as_uuid=True), ForeignKey("users.user_id"), index=True
     )
     vehicle_type: Mapped[VehicleTypeEnum] = mapped_column(
         Enum(VehicleTypeEnum), nullable=False
@@ -26,10 +26,12 @@ class Vehicle(Base):
 
     owner = relationship(
         "User",
+        lazy="raise_on_sql",
         back_populates="vehicles"
     )
 
     rides = relationship(
         "Ride",
+        lazy="raise_on_sql",
         back_populates="vehicle"
     )
\ No newline at end of file
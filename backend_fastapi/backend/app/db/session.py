@@ -3,8 +3,11 @@ Async database session management.
 Uses SQLAlchemy 2.0 async engine with asyncpg driver.
 """
 import ssl
+import time
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from core.config import get_settings
+from core.metrics import record_query
 
 settings = get_settings()
 
@@ -25,6 +28,26 @@ engine = create_async_engine(
     }
 )
 
+
+# Per-request query instrumentation (see core/metrics.py)
+@event.listens_for(engine.sync_engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+@event.listens_for(engine.sync_engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    record_query(time.perf_counter() - conn.info["query_start_time"].pop())
+
+
+@event.listens_for(engine.sync_engine, "handle_error")
+def _handle_error(context):
+    # after_cursor_execute does not fire for a failed statement; drop its start time
+    conn = context.connection
+    if conn is not None and context.statement is not None and conn.info.get("query_start_time"):
+        record_query(time.perf_counter() - conn.info["query_start_time"].pop())
+
+
 # Session factory
 AsyncSessionLocal = async_sessionmaker(
     bind=engine,
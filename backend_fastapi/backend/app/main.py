@@ -4,12 +4,13 @@ College Carpool API - Main Application Entry Point
 import os
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 
 from core.config import get_settings
-# Import models to ensure they are registered with SQLAlchemy
-from db.models import users, vehicles, rides, ride_requests, ride_participants, ride_history, driver_profiles
-from db.models import identity_verifications, driver_verifications, saved_addresses, college_students
-from db.models import refresh_tokens  # Required for refresh token auth
+from core.lifespan import lifespan, InFlightMiddleware
+from core.metrics import MetricsMiddleware, render_prometheus
+# Register every model with SQLAlchemy before routers build queries
+import db.models  # noqa: F401
 from routers import auth, users as users_router, vehicles as vehicles_router, rides as rides_router
 from routers import verification as verification_router
 from routers import addresses as addresses_router
@@ -21,6 +22,7 @@ from routers import reports as reports_router
 from routers import emergency_contacts as emergency_contacts_router
 from routers import sos as sos_router
 from routers import admin as admin_router
+from routers import ride_templates as ride_templates_router
 
 settings = get_settings()
 
@@ -29,7 +31,8 @@ app = FastAPI(
     description="A secure carpooling platform for college students",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan,
 )
 
 # ---------------------------------------------------------------------------
@@ -52,11 +55,19 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Per-route latency / size / DB-query metrics and Server-Timing headers
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
+# Outermost: counts in-flight requests so shutdown can drain them
+app.add_middleware(InFlightMiddleware)
+
 # Include routers
 app.include_router(auth.router)
 app.include_router(users_router.router)
 app.include_router(vehicles_router.router)
 app.include_router(rides_router.router)
+app.include_router(ride_templates_router.router)
 app.include_router(verification_router.router)
 app.include_router(addresses_router.router)
 app.include_router(driver_profiles_router.router)
@@ -82,4 +93,15 @@ async def root():
 @app.get("/health")
 async def health():
     """Health check for load balancers."""
-    return {"status": "ok"}
\ No newline at end of file
+    return {"status": "ok"}
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus scrape endpoint."""
+    if not settings.METRICS_ENABLED:
+        return PlainTextResponse("metrics disabled\n", status_code=404)
+    return PlainTextResponse(
+        render_prometheus(InFlightMiddleware.active),
+        media_type="text/plain; version=0.0.4",
+    )
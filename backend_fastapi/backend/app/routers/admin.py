@@ -10,38 +10,68 @@ User Management:
 
 Identity Verification:
   GET  /admin/verifications/identity/pending        — List pending identity verifications
+  GET  /admin/verifications/identity/{user_id}/document — View submitted ID document
+  GET  /admin/verifications/identity/ocr            — OCR job queue status
   PUT  /admin/verifications/identity/{user_id}/approve — Approve identity
   PUT  /admin/verifications/identity/{user_id}/reject  — Reject identity
 
 Driver Verification:
   GET  /admin/verifications/driver/pending          — List pending driver verifications
+  GET  /admin/verifications/driver/{user_id}/document   — View submitted licence document
   PUT  /admin/verifications/driver/{user_id}/approve   — Approve driver
   PUT  /admin/verifications/driver/{user_id}/reject    — Reject driver
 
+Review Queue (identity | driver):
+  POST /admin/verifications/{kind}/claim    — Lease the next pending items to this admin
+  POST /admin/verifications/{kind}/release  — Return leased items to the queue
+  POST /admin/verifications/{kind}/approve  — Bulk approve
+  POST /admin/verifications/{kind}/reject   — Bulk reject
+
 SOS Alerts:
   GET  /admin/sos/active               — List active (unresolved) SOS alerts
+  PUT  /admin/sos/{alert_id}/acknowledge — Mark SOS alert as being handled
   PUT  /admin/sos/{alert_id}/resolve   — Mark SOS alert resolved
 
+Campus Holidays:
+  GET    /admin/holidays               — List upcoming holidays
+  POST   /admin/holidays               — Add holiday (cancels untaken template rides that day)
+  DELETE /admin/holidays/{holiday_date} — Remove holiday (reopens the rides it cancelled)
+
 Stats:
   GET  /admin/stats                    — Dashboard statistics
 """
 import uuid
-from datetime import datetime, timezone
+from datetime import date
 from typing import Optional
 from fastapi import APIRouter, HTTPException, status, Query, Depends
-from sqlalchemy import select, func
-from sqlalchemy.orm import selectinload
-from pydantic import BaseModel
+from sqlalchemy import String, cast, delete, exists, or_, select, func, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import aliased, selectinload
+from pydantic import BaseModel, Field
 
+from core.config import get_settings
 from core.deps import DBSession, CurrentUser
+from core.geo import point_coords
+from core.responses import list_response
 from db.models.users import User
 from db.models.identity_verifications import IdentityVerification
 from db.models.driver_verifications import DriverVerification
 from db.models.sos_alerts import SOSAlert
-from db.models.rides import Ride
+from db.models.rides import Ride, RIDE_IS_OPEN
+from db.models.ride_participants import RideParticipant
+from db.models.campus_holidays import CampusHoliday
+from db.models.ride_templates import RideTemplate
+from schemas.ride_templates import HolidayCreate, HolidayRead
+from services.blob_store import BlobStoreError, get_blob_store
+from services.ocr_service import ocr_queue_stats
+from services.ride_expiry_service import campus_today
+from services.review_queue import (
+    ReviewKind, ReviewQueueService, ReviewQueueError, VerificationNotFound,
+)
 from db.enums import VerificationStatusEnum, RideStatusEnum
 
 router = APIRouter(prefix="/admin", tags=["Admin"])
+settings = get_settings()
 
 
 # ---------------------------------------------------------------------------
@@ -59,6 +89,13 @@ async def require_admin(user: CurrentUser) -> User:
 AdminUser = Depends(require_admin)
 
 
+async def _document_response(value: Optional[str]):
+    try:
+        return await get_blob_store().document_response(value)
+    except BlobStoreError as e:
+        raise HTTPException(status_code=404, detail=e.message)
+
+
 # ---------------------------------------------------------------------------
 # Pydantic response schemas
 # ---------------------------------------------------------------------------
@@ -93,15 +130,26 @@ class VerificationItem(BaseModel):
     license_document_url: Optional[str] = None
     college_id_number: Optional[str] = None
     license_number: Optional[str] = None
+    ocr_status: Optional[str] = None
+    ocr_college_id_number: Optional[str] = None
+    ocr_flags: list[str] = []
+    face_match_user_id: Optional[str] = None
+    face_match_score: Optional[float] = None
+    claimed_by: Optional[str] = None
+    claimed_until: Optional[str] = None
 
 
 class SOSAlertItem(BaseModel):
     alert_id: str
     user_id: str
+    full_name: str
+    phone_number: str
     ride_id: str
     triggered_at: Optional[str]
     latitude: Optional[float]
     longitude: Optional[float]
+    acknowledged_at: Optional[str] = None
+    acknowledged_by: Optional[str] = None
 
 
 # ---------------------------------------------------------------------------
@@ -118,26 +166,24 @@ async def list_users(
     """List all users with pagination."""
     offset = (page - 1) * page_size
     result = await db.execute(
-        select(User).order_by(User.created_at.desc()).offset(offset).limit(page_size)
-    )
-    users = result.scalars().all()
-    return [
-        UserListItem(
-            user_id=str(u.user_id),
-            full_name=u.full_name,
-            phone_number=u.phone_number,
-            email=u.email,
-            gender=u.gender.value if hasattr(u.gender, "value") else u.gender,
-            is_active=u.is_active,
-            is_phone_verified=u.is_phone_verified,
-            is_email_verified=u.is_email_verified,
-            is_identity_verified=u.is_identity_verified,
-            is_driver_verified=u.is_driver_verified,
-            is_admin=u.is_admin,
-            created_at=str(u.created_at) if u.created_at else None,
+        select(
+            cast(User.user_id, String).label("user_id"),
+            User.full_name, User.phone_number, User.email,
+            cast(User.gender, String).label("gender"),
+            User.is_active, User.is_phone_verified, User.is_email_verified,
+            User.is_identity_verified, User.is_driver_verified, User.is_admin,
+            User.created_at,
         )
-        for u in users
-    ]
+        .order_by(User.created_at.desc())
+        .offset(offset)
+        .limit(page_size)
+    )
+    # created_at formatted in Python, the same way /users/{user_id} does it
+    rows = (
+        {**row, "created_at": str(row["created_at"]) if row["created_at"] else None}
+        for row in result.mappings()
+    )
+    return list_response(UserListItem, rows, trusted=True)
 
 
 @router.get("/users/{user_id}", response_model=UserListItem)
@@ -205,62 +251,110 @@ async def activate_user(
 # IDENTITY VERIFICATION MANAGEMENT
 # ---------------------------------------------------------------------------
 
-@router.get("/verifications/identity/pending", response_model=list[VerificationItem])
-async def list_pending_identity(
-    _: User = AdminUser,
-    db: DBSession = None,
-):
-    """List all submitted (pending) identity verifications."""
+async def _identity_items(db, *criteria) -> list[VerificationItem]:
     result = await db.execute(
-        select(IdentityVerification, User)
+        select(
+            IdentityVerification.user_id, User.full_name, User.phone_number, User.email,
+            IdentityVerification.status, IdentityVerification.created_at,
+            IdentityVerification.reviewer_notes, IdentityVerification.college_id_number,
+            IdentityVerification.document_url.is_not(None).label("has_document"),
+            IdentityVerification.ocr_status, IdentityVerification.ocr_college_id_number,
+            IdentityVerification.ocr_flags,
+            IdentityVerification.face_match_user_id, IdentityVerification.face_match_score,
+            IdentityVerification.claimed_by, IdentityVerification.claimed_until,
+        )
         .join(User, IdentityVerification.user_id == User.user_id)
-        .where(IdentityVerification.status == VerificationStatusEnum.submitted)
+        .where(*criteria)
         .order_by(IdentityVerification.created_at.asc())
     )
-    rows = result.all()
     return [
         VerificationItem(
-            user_id=str(iv.user_id),
-            full_name=u.full_name,
-            phone_number=u.phone_number,
-            email=u.email,
-            status=iv.status.value,
-            submitted_at=str(iv.created_at) if iv.created_at else None,
-            reviewer_notes=iv.reviewer_notes,
-            document_url=iv.document_url,
-            college_id_number=iv.college_id_number,
+            user_id=str(row.user_id),
+            full_name=row.full_name,
+            phone_number=row.phone_number,
+            email=row.email,
+            status=row.status.value,
+            submitted_at=str(row.created_at) if row.created_at else None,
+            reviewer_notes=row.reviewer_notes,
+            document_url=(
+                f"/admin/verifications/identity/{row.user_id}/document"
+                if row.has_document else None
+            ),
+            college_id_number=row.college_id_number,
+            ocr_status=row.ocr_status.value if row.ocr_status else None,
+            ocr_college_id_number=row.ocr_college_id_number,
+            ocr_flags=row.ocr_flags or [],
+            face_match_user_id=str(row.face_match_user_id) if row.face_match_user_id else None,
+            face_match_score=row.face_match_score,
+            claimed_by=str(row.claimed_by) if row.claimed_by else None,
+            claimed_until=str(row.claimed_until) if row.claimed_until else None,
         )
-        for iv, u in rows
+        for row in result
     ]
 
 
+@router.get("/verifications/identity/pending", response_model=list[VerificationItem])
+async def list_pending_identity(
+    _: User = AdminUser,
+    db: DBSession = None,
+):
+    """
+    List all submitted (pending) identity verifications.
+
+    Documents are not inlined: document_url points at the document endpoint,
+    which the review page loads per item. ocr_flags marks cards whose OCR
+    read disagrees with the submission (id_number_mismatch, name_mismatch, ...);
+    face_match_user_id is another account with a near-identical face.
+    claimed_by is set while another admin holds the item (see /claim).
+    """
+    return await _identity_items(db, IdentityVerification.status == VerificationStatusEnum.submitted)
+
+
+@router.get("/verifications/identity/ocr")
+async def get_identity_ocr_status(
+    _: User = AdminUser,
+    db: DBSession = None,
+):
+    """OCR pipeline backlog: job counts per status and the oldest queued job."""
+    return await ocr_queue_stats(db)
+
+
+@router.get("/verifications/identity/{user_id}/document")
+async def get_identity_document(
+    user_id: uuid.UUID,
+    _: User = AdminUser,
+    db: DBSession = None,
+):
+    """Stream (or redirect to) the ID document a user submitted."""
+    result = await db.execute(
+        select(IdentityVerification.document_url).where(IdentityVerification.user_id == user_id)
+    )
+    return await _document_response(result.scalar_one_or_none())
+
+
 class ReviewRequest(BaseModel):
     notes: Optional[str] = None
 
 
+def _review_error(e: ReviewQueueError) -> HTTPException:
+    code = 404 if isinstance(e, VerificationNotFound) else 409
+    return HTTPException(status_code=code, detail=e.message)
+
+
 @router.put("/verifications/identity/{user_id}/approve")
 async def approve_identity(
     user_id: uuid.UUID,
     payload: ReviewRequest = ReviewRequest(),
-    _: User = AdminUser,
+    admin: User = AdminUser,
     db: DBSession = None,
 ):
     """Approve identity verification: sets is_identity_verified = True."""
-    iv_result = await db.execute(
-        select(IdentityVerification).where(IdentityVerification.user_id == user_id)
-    )
-    iv = iv_result.scalar_one_or_none()
-    if not iv:
-        raise HTTPException(status_code=404, detail="Verification record not found")
-    iv.status = VerificationStatusEnum.verified
-    iv.reviewer_notes = payload.notes
-    iv.reviewed_at = datetime.now(timezone.utc)
-
-    user_result = await db.execute(select(User).where(User.user_id == user_id))
-    user = user_result.scalar_one_or_none()
-    if user:
-        user.is_identity_verified = True
-    await db.flush()
+    try:
+        await ReviewQueueService(db, ReviewKind.identity).decide_one(
+            admin.user_id, user_id, approve=True, notes=payload.notes
+        )
+    except ReviewQueueError as e:
+        raise _review_error(e)
     return {"message": "Identity verified and approved."}
 
 
@@ -268,20 +362,16 @@ async def approve_identity(
 async def reject_identity(
     user_id: uuid.UUID,
     payload: ReviewRequest = ReviewRequest(),
-    _: User = AdminUser,
+    admin: User = AdminUser,
     db: DBSession = None,
 ):
     """Reject identity verification with optional notes."""
-    iv_result = await db.execute(
-        select(IdentityVerification).where(IdentityVerification.user_id == user_id)
-    )
-    iv = iv_result.scalar_one_or_none()
-    if not iv:
-        raise HTTPException(status_code=404, detail="Verification record not found")
-    iv.status = VerificationStatusEnum.rejected
-    iv.reviewer_notes = payload.notes
-    iv.reviewed_at = datetime.now(timezone.utc)
-    await db.flush()
+    try:
+        await ReviewQueueService(db, ReviewKind.identity).decide_one(
+            admin.user_id, user_id, approve=False, notes=payload.notes
+        )
+    except ReviewQueueError as e:
+        raise _review_error(e)
     return {"message": "Identity verification rejected."}
 
 
@@ -289,58 +379,76 @@ async def reject_identity(
 # DRIVER VERIFICATION MANAGEMENT
 # ---------------------------------------------------------------------------
 
-@router.get("/verifications/driver/pending", response_model=list[VerificationItem])
-async def list_pending_driver(
-    _: User = AdminUser,
-    db: DBSession = None,
-):
-    """List all submitted (pending) driver verifications."""
+async def _driver_items(db, *criteria) -> list[VerificationItem]:
     result = await db.execute(
-        select(DriverVerification, User)
+        select(
+            DriverVerification.user_id, User.full_name, User.phone_number, User.email,
+            DriverVerification.status, DriverVerification.created_at,
+            DriverVerification.reviewer_notes, DriverVerification.license_number,
+            DriverVerification.license_document_url.is_not(None).label("has_document"),
+            DriverVerification.claimed_by, DriverVerification.claimed_until,
+        )
         .join(User, DriverVerification.user_id == User.user_id)
-        .where(DriverVerification.status == VerificationStatusEnum.submitted)
+        .where(*criteria)
         .order_by(DriverVerification.created_at.asc())
     )
-    rows = result.all()
     return [
         VerificationItem(
-            user_id=str(dv.user_id),
-            full_name=u.full_name,
-            phone_number=u.phone_number,
-            email=u.email,
-            status=dv.status.value,
-            submitted_at=str(dv.created_at) if dv.created_at else None,
-            reviewer_notes=dv.reviewer_notes,
-            license_document_url=dv.license_document_url,
-            license_number=dv.license_number,
+            user_id=str(row.user_id),
+            full_name=row.full_name,
+            phone_number=row.phone_number,
+            email=row.email,
+            status=row.status.value,
+            submitted_at=str(row.created_at) if row.created_at else None,
+            reviewer_notes=row.reviewer_notes,
+            license_document_url=(
+                f"/admin/verifications/driver/{row.user_id}/document"
+                if row.has_document else None
+            ),
+            license_number=row.license_number,
+            claimed_by=str(row.claimed_by) if row.claimed_by else None,
+            claimed_until=str(row.claimed_until) if row.claimed_until else None,
         )
-        for dv, u in rows
+        for row in result
     ]
 
 
+@router.get("/verifications/driver/pending", response_model=list[VerificationItem])
+async def list_pending_driver(
+    _: User = AdminUser,
+    db: DBSession = None,
+):
+    """List all submitted (pending) driver verifications (documents by link, as above)."""
+    return await _driver_items(db, DriverVerification.status == VerificationStatusEnum.submitted)
+
+
+@router.get("/verifications/driver/{user_id}/document")
+async def get_driver_document(
+    user_id: uuid.UUID,
+    _: User = AdminUser,
+    db: DBSession = None,
+):
+    """Stream (or redirect to) the licence document a user submitted."""
+    result = await db.execute(
+        select(DriverVerification.license_document_url).where(DriverVerification.user_id == user_id)
+    )
+    return await _document_response(result.scalar_one_or_none())
+
+
 @router.put("/verifications/driver/{user_id}/approve")
 async def approve_driver(
     user_id: uuid.UUID,
     payload: ReviewRequest = ReviewRequest(),
-    _: User = AdminUser,
+    admin: User = AdminUser,
     db: DBSession = None,
 ):
     """Approve driver verification: sets is_driver_verified = True."""
-    dv_result = await db.execute(
-        select(DriverVerification).where(DriverVerification.user_id == user_id)
-    )
-    dv = dv_result.scalar_one_or_none()
-    if not dv:
-        raise HTTPException(status_code=404, detail="Driver verification record not found")
-    dv.status = VerificationStatusEnum.verified
-    dv.reviewer_notes = payload.notes
-    dv.reviewed_at = datetime.now(timezone.utc)
-
-    user_result = await db.execute(select(User).where(User.user_id == user_id))
-    user = user_result.scalar_one_or_none()
-    if user:
-        user.is_driver_verified = True
-    await db.flush()
+    try:
+        await ReviewQueueService(db, ReviewKind.driver).decide_one(
+            admin.user_id, user_id, approve=True, notes=payload.notes
+        )
+    except ReviewQueueError as e:
+        raise _review_error(e)
     return {"message": "Driver verified and approved."}
 
 
@@ -348,23 +456,99 @@ async def approve_driver(
 async def reject_driver(
     user_id: uuid.UUID,
     payload: ReviewRequest = ReviewRequest(),
-    _: User = AdminUser,
+    admin: User = AdminUser,
     db: DBSession = None,
 ):
     """Reject driver verification."""
-    dv_result = await db.execute(
-        select(DriverVerification).where(DriverVerification.user_id == user_id)
-    )
-    dv = dv_result.scalar_one_or_none()
-    if not dv:
-        raise HTTPException(status_code=404, detail="Driver verification record not found")
-    dv.status = VerificationStatusEnum.rejected
-    dv.reviewer_notes = payload.notes
-    dv.reviewed_at = datetime.now(timezone.utc)
-    await db.flush()
+    try:
+        await ReviewQueueService(db, ReviewKind.driver).decide_one(
+            admin.user_id, user_id, approve=False, notes=payload.notes
+        )
+    except ReviewQueueError as e:
+        raise _review_error(e)
     return {"message": "Driver verification rejected."}
 
 
+# ---------------------------------------------------------------------------
+# REVIEW QUEUE (leased claims, bulk decisions)
+# ---------------------------------------------------------------------------
+
+class BulkReviewRequest(BaseModel):
+    user_ids: list[uuid.UUID] = Field(min_length=1, max_length=settings.REVIEW_CLAIM_MAX)
+    notes: Optional[str] = None
+
+
+class BulkReviewResponse(BaseModel):
+    decided: list[str]
+    skipped: list[str]  # not pending any more, or leased to another admin
+
+
+@router.post("/verifications/{kind}/claim", response_model=list[VerificationItem])
+async def claim_verifications(
+    kind: ReviewKind,
+    limit: int = Query(10, ge=1, le=settings.REVIEW_CLAIM_MAX),
+    admin: User = AdminUser,
+    db: DBSession = None,
+):
+    """
+    Lease the next `limit` pending verifications to the calling admin for
+    REVIEW_LEASE_SECONDS. Items already held by this admin come back first
+    with a fresh lease; items other admins hold are skipped, so each admin
+    gets a disjoint batch.
+    """
+    user_ids = await ReviewQueueService(db, kind).claim(admin.user_id, limit)
+    if not user_ids:
+        return []
+    items = _identity_items if kind is ReviewKind.identity else _driver_items
+    model = IdentityVerification if kind is ReviewKind.identity else DriverVerification
+    return await items(db, model.user_id.in_(user_ids))
+
+
+@router.post("/verifications/{kind}/release")
+async def release_verifications(
+    kind: ReviewKind,
+    payload: BulkReviewRequest,
+    admin: User = AdminUser,
+    db: DBSession = None,
+):
+    """Give leased items back to the queue without deciding them."""
+    released = await ReviewQueueService(db, kind).release(admin.user_id, payload.user_ids)
+    return {"released": [str(user_id) for user_id in released]}
+
+
+async def _bulk_decide(kind: ReviewKind, payload: BulkReviewRequest, admin: User, db, approve: bool):
+    decided = await ReviewQueueService(db, kind).decide(
+        admin.user_id, payload.user_ids, approve=approve, notes=payload.notes
+    )
+    done = set(decided)
+    return BulkReviewResponse(
+        decided=[str(user_id) for user_id in decided],
+        skipped=[str(user_id) for user_id in payload.user_ids if user_id not in done],
+    )
+
+
+@router.post("/verifications/{kind}/approve", response_model=BulkReviewResponse)
+async def bulk_approve_verifications(
+    kind: ReviewKind,
+    payload: BulkReviewRequest,
+    admin: User = AdminUser,
+    db: DBSession = None,
+):
+    """Approve pending verifications and set the users' verified flag, in one statement."""
+    return await _bulk_decide(kind, payload, admin, db, approve=True)
+
+
+@router.post("/verifications/{kind}/reject", response_model=BulkReviewResponse)
+async def bulk_reject_verifications(
+    kind: ReviewKind,
+    payload: BulkReviewRequest,
+    admin: User = AdminUser,
+    db: DBSession = None,
+):
+    """Reject pending verifications with shared notes."""
+    return await _bulk_decide(kind, payload, admin, db, approve=False)
+
+
 # ---------------------------------------------------------------------------
 # SOS ALERTS
 # ---------------------------------------------------------------------------
@@ -374,31 +558,186 @@ async def list_active_sos(
     _: User = AdminUser,
     db: DBSession = None,
 ):
-    """List all unresolved SOS alerts with location."""
+    """
+    List unresolved SOS alerts, newest first, with the caller's contact
+    details. Served from the partial index on unresolved alerts, with
+    coordinates projected in SQL.
+    """
     result = await db.execute(
-        select(SOSAlert).order_by(SOSAlert.triggered_at.desc())
+        select(
+            SOSAlert.alert_id, SOSAlert.user_id, User.full_name, User.phone_number,
+            SOSAlert.ride_id, SOSAlert.triggered_at,
+            SOSAlert.acknowledged_at, SOSAlert.acknowledged_by,
+            *point_coords(SOSAlert.location, "loc"),
+        )
+        .join(User, SOSAlert.user_id == User.user_id)
+        .where(SOSAlert.resolved_at.is_(None))
+        .order_by(SOSAlert.triggered_at.desc())
+    )
+    return [
+        SOSAlertItem(
+            alert_id=str(row.alert_id),
+            user_id=str(row.user_id),
+            full_name=row.full_name,
+            phone_number=row.phone_number,
+            ride_id=str(row.ride_id),
+            triggered_at=str(row.triggered_at) if row.triggered_at else None,
+            latitude=row.loc_lat,
+            longitude=row.loc_lng,
+            acknowledged_at=str(row.acknowledged_at) if row.acknowledged_at else None,
+            acknowledged_by=str(row.acknowledged_by) if row.acknowledged_by else None,
+        )
+        for row in result
+    ]
+
+
+class SOSResolveRequest(BaseModel):
+    notes: Optional[str] = None
+
+
+@router.put("/sos/{alert_id}/acknowledge")
+async def acknowledge_sos(
+    alert_id: uuid.UUID,
+    admin: User = AdminUser,
+    db: DBSession = None,
+):
+    """Record that the calling admin is responding to an alert (first acknowledgement wins)."""
+    result = await db.execute(
+        update(SOSAlert)
+        .where(SOSAlert.alert_id == alert_id, SOSAlert.resolved_at.is_(None))
+        .values(
+            acknowledged_at=func.coalesce(SOSAlert.acknowledged_at, func.now()),
+            acknowledged_by=func.coalesce(SOSAlert.acknowledged_by, admin.user_id),
+        )
+        .returning(SOSAlert.acknowledged_by)
+    )
+    acknowledged_by = result.scalar_one_or_none()
+    if acknowledged_by is None:
+        raise HTTPException(status_code=404, detail="Active SOS alert not found")
+    return {"message": "SOS alert acknowledged.", "acknowledged_by": str(acknowledged_by)}
+
+
+@router.put("/sos/{alert_id}/resolve")
+async def resolve_sos(
+    alert_id: uuid.UUID,
+    payload: SOSResolveRequest = SOSResolveRequest(),
+    admin: User = AdminUser,
+    db: DBSession = None,
+):
+    """Close an alert; it drops out of /admin/sos/active."""
+    result = await db.execute(
+        update(SOSAlert)
+        .where(SOSAlert.alert_id == alert_id, SOSAlert.resolved_at.is_(None))
+        .values(
+            resolved_at=func.now(),
+            resolved_by=admin.user_id,
+            resolution_notes=payload.notes,
+            acknowledged_at=func.coalesce(SOSAlert.acknowledged_at, func.now()),
+            acknowledged_by=func.coalesce(SOSAlert.acknowledged_by, admin.user_id),
+        )
+        .returning(SOSAlert.alert_id)
+    )
+    if result.scalar_one_or_none() is None:
+        raise HTTPException(status_code=404, detail="Active SOS alert not found")
+    return {"message": "SOS alert resolved."}
+
+
+# ---------------------------------------------------------------------------
+# CAMPUS HOLIDAYS
+# ---------------------------------------------------------------------------
+
+@router.get("/holidays", response_model=list[HolidayRead])
+async def list_holidays(
+    _: User = AdminUser,
+    db: DBSession = None,
+):
+    """List holidays from today on; the ride scheduler skips these dates."""
+    result = await db.execute(
+        select(CampusHoliday)
+        .where(CampusHoliday.holiday_date >= campus_today())
+        .order_by(CampusHoliday.holiday_date)
+    )
+    return result.scalars().all()
+
+
+@router.post("/holidays", response_model=HolidayRead, status_code=status.HTTP_201_CREATED)
+async def add_holiday(
+    payload: HolidayCreate,
+    _: User = AdminUser,
+    db: DBSession = None,
+):
+    """
+    Add (or rename) a campus holiday.
+
+    Template rides already materialized for that date are cancelled unless
+    someone has joined them; one-off rides are left alone.
+    """
+    stmt = insert(CampusHoliday).values(holiday_date=payload.holiday_date, name=payload.name)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[CampusHoliday.holiday_date],
+        set_={"name": stmt.excluded.name},
+    )
+    await db.execute(stmt)
+    await db.execute(
+        update(Ride)
+        .where(
+            Ride.template_id.is_not(None),
+            Ride.ride_date == payload.holiday_date,
+            Ride.status == RideStatusEnum.open,
+            ~exists().where(RideParticipant.ride_id == Ride.ride_id),
+        )
+        .values(status=RideStatusEnum.cancelled, cancelled_by_holiday=True)
+    )
+    return HolidayRead(holiday_date=payload.holiday_date, name=payload.name)
+
+
+@router.delete("/holidays/{holiday_date}", status_code=status.HTTP_204_NO_CONTENT)
+async def remove_holiday(
+    holiday_date: date,
+    _: User = AdminUser,
+    db: DBSession = None,
+):
+    """
+    Remove a holiday and reopen the template rides add_holiday cancelled.
+
+    Those rides keep their (template_id, ride_date) slot, so the scheduler
+    never re-creates them. Only rides marked cancelled_by_holiday are
+    reopened (rides the driver cancelled stay cancelled), and only when
+    their template is still active and covers the date and the driver has
+    not posted another ride at that time since.
+    """
+    result = await db.execute(
+        delete(CampusHoliday)
+        .where(CampusHoliday.holiday_date == holiday_date)
+        .returning(CampusHoliday.holiday_date)
+    )
+    if not result.scalar_one_or_none():
+        raise HTTPException(status_code=404, detail="Holiday not found")
+    if holiday_date < campus_today():
+        return
+
+    other = aliased(Ride)
+    await db.execute(
+        update(Ride)
+        .where(
+            Ride.template_id == RideTemplate.template_id,
+            Ride.ride_date == holiday_date,
+            Ride.status == RideStatusEnum.cancelled,
+            Ride.cancelled_by_holiday == True,
+            RideTemplate.is_active == True,
+            RideTemplate.valid_from <= holiday_date,
+            or_(RideTemplate.valid_until.is_(None), RideTemplate.valid_until >= holiday_date),
+            ~exists().where(RideParticipant.ride_id == Ride.ride_id),
+            ~exists().where(
+                other.driver_id == Ride.driver_id,
+                other.ride_date == Ride.ride_date,
+                other.ride_time == Ride.ride_time,
+                other.ride_id != Ride.ride_id,
+                other.status != RideStatusEnum.cancelled,
+            ),
+        )
+        .values(status=RideStatusEnum.open, cancelled_by_holiday=False)
     )
-    alerts = result.scalars().all()
-
-    items = []
-    for alert in alerts:
-        lat, lng = None, None
-        if alert.location is not None:
-            try:
-                from geoalchemy2.shape import to_shape
-                point = to_shape(alert.location)
-                lat, lng = point.y, point.x
-            except Exception:
-                pass
-        items.append(SOSAlertItem(
-            alert_id=str(alert.alert_id),
-            user_id=str(alert.user_id),
-            ride_id=str(alert.ride_id),
-            triggered_at=str(alert.triggered_at) if alert.triggered_at else None,
-            latitude=lat,
-            longitude=lng,
-        ))
-    return items
 
 
 # ---------------------------------------------------------------------------
@@ -431,9 +770,12 @@ async def get_stats(
     )).scalar()
     active_rides = (await db.execute(
         select(func.count(Ride.ride_id))
-        .where(Ride.status == RideStatusEnum.open)
+        .where(RIDE_IS_OPEN)
     )).scalar()
     total_sos = (await db.execute(select(func.count(SOSAlert.alert_id)))).scalar()
+    active_sos = (await db.execute(
+        select(func.count(SOSAlert.alert_id)).where(SOSAlert.resolved_at.is_(None))
+    )).scalar()
 
     return {
         "users": {
@@ -451,5 +793,6 @@ async def get_stats(
         },
         "sos": {
             "total_triggered": total_sos,
+            "active": active_sos,
         },
     }
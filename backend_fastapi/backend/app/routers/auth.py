@@ -14,9 +14,7 @@ Persistent Session:
 - POST /auth/refresh  → Exchange refresh_token for new access_token + rotated refresh_token
 - POST /auth/logout   → Revoke refresh_token
 """
-import hashlib
 import uuid
-from datetime import datetime, timezone, timedelta
 from fastapi import APIRouter, HTTPException, status, Request
 from sqlalchemy import select
 from pydantic import BaseModel
@@ -27,15 +25,15 @@ from core.security import (
     create_phone_verified_token,
     create_access_token,
     decode_token,
-    generate_refresh_token,
-    hash_refresh_token,
     TokenType
 )
 from core.config import get_settings
 from db.models.users import User
 from db.models.otp_sessions import OTPSession, IdentifierType
-from db.models.refresh_tokens import RefreshToken
 from services.otp_service import OTPService, OTPError
+from services.refresh_token_service import (
+    RefreshTokenService, RefreshTokenError, RefreshTokenReused
+)
 from services.sms_service import SMSService
 from schemas.auth import (
     PhoneSendOTPRequest, PhoneSendOTPResponse,
@@ -54,22 +52,6 @@ settings = get_settings()
 # HELPERS
 # =============================================================================
 
-async def _create_refresh_token_record(db, user_id: uuid.UUID) -> str:
-    """Generate, hash, store, and return a plain refresh token."""
-    plain = generate_refresh_token()
-    token_hash = hash_refresh_token(plain)
-    expires_at = datetime.now(timezone.utc) + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
-    record = RefreshToken(
-        token_id=uuid.uuid4(),
-        user_id=user_id,
-        token_hash=token_hash,
-        expires_at=expires_at,
-    )
-    db.add(record)
-    await db.flush()
-    return plain
-
-
 def _user_to_response(user: User) -> UserResponse:
     return UserResponse(
         user_id=str(user.user_id),
@@ -209,7 +191,7 @@ async def register(request: RegisterRequest, db: DBSession):
     await db.flush()
 
     access_token = create_access_token(str(user.user_id))
-    refresh_token = await _create_refresh_token_record(db, user.user_id)
+    refresh_token = await RefreshTokenService(db).issue(user.user_id)
 
     return RegisterResponse(
         access_token=access_token,
@@ -283,7 +265,7 @@ async def login_verify_otp(request: LoginVerifyOTPRequest, db: DBSession):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Account is deactivated")
 
     access_token = create_access_token(str(user.user_id))
-    refresh_token = await _create_refresh_token_record(db, user.user_id)
+    refresh_token = await RefreshTokenService(db).issue(user.user_id)
 
     return LoginResponse(
         access_token=access_token,
@@ -309,31 +291,19 @@ class RefreshResponse(BaseModel):
 async def refresh_tokens(request: RefreshRequest, db: DBSession):
     """
     Exchange a valid refresh token for a new access token and rotated refresh token.
-    The old refresh token is revoked immediately (rotation).
+    The old refresh token is revoked and its successor inserted in a single statement.
+    Reusing an already-rotated token revokes every token in its family.
     """
-    token_hash = hash_refresh_token(request.refresh_token)
-    result = await db.execute(
-        select(RefreshToken).where(
-            RefreshToken.token_hash == token_hash,
-            RefreshToken.is_revoked == False,
-        )
-    )
-    record = result.scalar_one_or_none()
-
-    if not record:
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid or revoked refresh token")
-
-    if record.expires_at < datetime.now(timezone.utc):
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Refresh token has expired. Please log in again.")
-
-    # Revoke old token (rotation)
-    record.is_revoked = True
-    await db.flush()
-
-    # Issue new tokens
-    access_token = create_access_token(str(record.user_id))
-    new_refresh_token = await _create_refresh_token_record(db, record.user_id)
-
+    try:
+        user_id, new_refresh_token = await RefreshTokenService(db).rotate(request.refresh_token)
+    except RefreshTokenReused as e:
+        # Persist the family revocation; get_db rolls back on exceptions
+        await db.commit()
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=e.message)
+    except RefreshTokenError as e:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=e.message)
+
+    access_token = create_access_token(str(user_id))
     return RefreshResponse(access_token=access_token, refresh_token=new_refresh_token)
 
 
@@ -348,12 +318,5 @@ class LogoutRequest(BaseModel):
 @router.post("/logout", status_code=status.HTTP_200_OK)
 async def logout(request: LogoutRequest, db: DBSession):
     """Revoke the refresh token (logout). Access token will expire naturally."""
-    token_hash = hash_refresh_token(request.refresh_token)
-    result = await db.execute(
-        select(RefreshToken).where(RefreshToken.token_hash == token_hash)
-    )
-    record = result.scalar_one_or_none()
-    if record and not record.is_revoked:
-        record.is_revoked = True
-        await db.flush()
+    await RefreshTokenService(db).revoke(request.refresh_token)
     return {"message": "Logged out successfully"}
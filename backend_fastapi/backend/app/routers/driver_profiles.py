@@ -7,6 +7,7 @@ from sqlalchemy import select
 from core.deps import DBSession, CurrentUser
 from db.models.driver_profiles import DriverProfile
 from db.models.vehicles import Vehicle
+from services.seat_limit_service import forget_seat_limit
 from schemas.driver_profiles import (
     DriverProfileCreate,
     DriverProfileRead,
@@ -54,6 +55,7 @@ async def create_driver_profile(
     db.add(profile)
     await db.flush()
     await db.refresh(profile)
+    forget_seat_limit(user.user_id)
 
     return DriverProfileRead(
         user_id=profile.user_id,
@@ -129,6 +131,7 @@ async def update_driver_profile(
 
     await db.flush()
     await db.refresh(profile)
+    forget_seat_limit(user.user_id)
 
     # Get vehicle number
     v_result = await db.execute(
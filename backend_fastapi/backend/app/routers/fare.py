@@ -8,10 +8,13 @@ Uses a hardcoded campus distance matrix and a simple formula:
 For non-campus routes, uses Haversine distance as approximation.
 """
 import math
+from functools import lru_cache
 from typing import Optional
 from fastapi import APIRouter, Query
 from pydantic import BaseModel
 
+from core.lifespan import on_startup
+
 
 router = APIRouter(prefix="/fare", tags=["Fare"])
 
@@ -133,9 +136,10 @@ class CampusMatrixResponse(BaseModel):
     routes: list[CampusRoute]
 
 
-@router.get("/campus-matrix", response_model=CampusMatrixResponse)
-async def get_campus_matrix():
-    """Return the full campus distance & fare matrix."""
+@on_startup
+@lru_cache
+def _build_campus_matrix() -> CampusMatrixResponse:
+    """Build the static campus matrix once; warmed up at startup."""
     campuses = [
         CampusInfo(key=k, name=v["name"], lat=v["lat"], lng=v["lng"])
         for k, v in CAMPUSES.items()
@@ -150,3 +154,9 @@ async def get_campus_matrix():
             estimated_fare=fare_info["total_fare"],
         ))
     return CampusMatrixResponse(campuses=campuses, routes=routes)
+
+
+@router.get("/campus-matrix", response_model=CampusMatrixResponse)
+async def get_campus_matrix():
+    """Return the full campus distance & fare matrix."""
+    return _build_campus_matrix()
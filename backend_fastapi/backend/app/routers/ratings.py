@@ -5,13 +5,17 @@ Endpoints:
   POST /ratings/{ride_id}          — Submit a rating for a ride
   GET  /ratings/ride/{ride_id}     — Get all ratings for a ride
   GET  /ratings/user/{user_id}     — Get rating summary for a user
+  GET  /ratings/users?user_id=...  — Rating summaries for many users at once
 """
 import uuid
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, status, Query
 from sqlalchemy import select, func
+from sqlalchemy.dialects.postgresql import insert
 
 from core.deps import DBSession, CurrentUser
+from core.responses import list_response
 from db.models.ratings import Rating
+from db.models.rating_summaries import RatingSummary
 from db.models.rides import Ride
 from db.models.ride_participants import RideParticipant
 from schemas.ratings import RatingCreate, RatingRead, UserRatingSummary
@@ -19,6 +23,8 @@ from schemas.ratings import RatingCreate, RatingRead, UserRatingSummary
 
 router = APIRouter(prefix="/ratings", tags=["Ratings"])
 
+MAX_BATCH_USERS = 100
+
 
 @router.post("/{ride_id}", response_model=RatingRead, status_code=status.HTTP_201_CREATED)
 async def submit_rating(
@@ -71,6 +77,20 @@ async def submit_rating(
     )
     db.add(rating)
     await db.flush()
+
+    # Keep the rated user's running totals in step, in the same transaction
+    summary = insert(RatingSummary).values(
+        user_id=payload.rated_user_id, rating_count=1, rating_sum=payload.rating_value
+    )
+    await db.execute(summary.on_conflict_do_update(
+        index_elements=[RatingSummary.user_id],
+        set_={
+            "rating_count": RatingSummary.rating_count + 1,
+            "rating_sum": RatingSummary.rating_sum + summary.excluded.rating_sum,
+            "updated_at": func.now(),
+        },
+    ))
+
     await db.refresh(rating)
     return rating
 
@@ -81,22 +101,45 @@ async def get_ride_ratings(ride_id: uuid.UUID, db: DBSession):
     result = await db.execute(
         select(Rating).where(Rating.ride_id == ride_id)
     )
-    return result.scalars().all()
+    return list_response(RatingRead, result.scalars().all())
+
+
+def _summary(user_id: uuid.UUID, count: int, total: int) -> UserRatingSummary:
+    return UserRatingSummary(
+        user_id=user_id,
+        average_rating=round(total / count, 1) if count else 0.0,
+        total_ratings=count,
+    )
 
 
 @router.get("/user/{user_id}", response_model=UserRatingSummary)
 async def get_user_rating_summary(user_id: uuid.UUID, db: DBSession):
     """Get aggregated rating summary for a user."""
     result = await db.execute(
-        select(
-            func.avg(Rating.rating_value).label("average_rating"),
-            func.count(Rating.rating_id).label("total_ratings"),
-        ).where(Rating.rated_user_id == user_id)
+        select(RatingSummary.rating_count, RatingSummary.rating_sum)
+        .where(RatingSummary.user_id == user_id)
     )
-    row = result.one()
+    row = result.first()
+    return _summary(user_id, row.rating_count, row.rating_sum) if row else _summary(user_id, 0, 0)
 
-    return UserRatingSummary(
-        user_id=user_id,
-        average_rating=round(float(row.average_rating or 0), 1),
-        total_ratings=int(row.total_ratings),
+
+@router.get("/users", response_model=list[UserRatingSummary])
+async def get_rating_summaries(
+    db: DBSession,
+    user_id: list[uuid.UUID] = Query(..., max_length=MAX_BATCH_USERS),
+):
+    """
+    Rating summaries for up to MAX_BATCH_USERS users in one primary-key lookup,
+    e.g. the driver badges on a ride list. Users without ratings get zeros.
+    """
+    user_ids = list(dict.fromkeys(user_id))
+    result = await db.execute(
+        select(RatingSummary.user_id, RatingSummary.rating_count, RatingSummary.rating_sum)
+        .where(RatingSummary.user_id.in_(user_ids))
     )
+    found = {row.user_id: row for row in result}
+    return [
+        _summary(uid, found[uid].rating_count, found[uid].rating_sum) if uid in found
+        else _summary(uid, 0, 0)
+        for uid in user_ids
+    ]
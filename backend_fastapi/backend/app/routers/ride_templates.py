@@ -0,0 +1,106 @@
+"""
+Ride Templates Router — Recurring commutes materialized by the ride scheduler.
+
+Endpoints:
+  POST   /ride-templates                 — Create template (driver); materializes upcoming rides
+  GET    /ride-templates                 — List my templates
+  DELETE /ride-templates/{template_id}   — Stop a template; cancels its future rides without riders
+"""
+import uuid
+from fastapi import APIRouter, HTTPException, status
+from sqlalchemy import select, update, exists
+
+from core.deps import DBSession, CurrentUser
+from core.geo import geography_point
+from db.enums import RideStatusEnum
+from db.models.ride_templates import RideTemplate
+from db.models.ride_participants import RideParticipant
+from db.models.rides import Ride
+from db.models.vehicles import Vehicle
+from schemas.ride_templates import RideTemplateCreate, RideTemplateRead
+from services.ride_expiry_service import campus_today
+from services.ride_scheduler import RideScheduler, weekdays_to_mask
+
+
+router = APIRouter(prefix="/ride-templates", tags=["Ride Templates"])
+
+
+@router.post("/", response_model=RideTemplateRead, status_code=status.HTTP_201_CREATED)
+async def create_ride_template(payload: RideTemplateCreate, user: CurrentUser, db: DBSession):
+    """Create a recurring ride and materialize its rides for the scheduling horizon."""
+    result = await db.execute(
+        select(Vehicle.vehicle_id).where(
+            Vehicle.vehicle_id == payload.vehicle_id,
+            Vehicle.user_id == user.user_id,
+        )
+    )
+    if not result.scalar_one_or_none():
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Vehicle not found or does not belong to you.",
+        )
+    if payload.valid_until and payload.valid_until < (payload.valid_from or campus_today()):
+        raise HTTPException(status_code=400, detail="valid_until is before valid_from")
+
+    template = RideTemplate(
+        template_id=uuid.uuid4(),
+        driver_id=user.user_id,
+        vehicle_id=payload.vehicle_id,
+        start_location=geography_point(
+            payload.start_location.latitude, payload.start_location.longitude
+        ),
+        end_location=geography_point(
+            payload.end_location.latitude, payload.end_location.longitude
+        ),
+        start_address=payload.start_address,
+        end_address=payload.end_address,
+        weekday_mask=weekdays_to_mask(payload.weekdays),
+        ride_time=payload.ride_time,
+        available_seats=payload.available_seats,
+        allowed_gender=payload.allowed_gender,
+        allowed_community=payload.allowed_community,
+        estimated_fare=payload.estimated_fare,
+        valid_from=payload.valid_from or campus_today(),
+        valid_until=payload.valid_until,
+        is_active=True,
+    )
+    db.add(template)
+    await db.flush()
+    await RideScheduler(db).materialize(template_ids=[template.template_id])
+    await db.refresh(template)
+    return template
+
+
+@router.get("/", response_model=list[RideTemplateRead])
+async def list_my_ride_templates(user: CurrentUser, db: DBSession):
+    """List the current driver's ride templates."""
+    result = await db.execute(
+        select(RideTemplate)
+        .where(RideTemplate.driver_id == user.user_id)
+        .order_by(RideTemplate.created_at.desc())
+    )
+    return result.scalars().all()
+
+
+@router.delete("/{template_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def stop_ride_template(template_id: uuid.UUID, user: CurrentUser, db: DBSession):
+    """Deactivate a template and cancel its upcoming rides that nobody has joined."""
+    result = await db.execute(
+        update(RideTemplate)
+        .where(RideTemplate.template_id == template_id, RideTemplate.driver_id == user.user_id)
+        .values(is_active=False)
+        .returning(RideTemplate.template_id)
+    )
+    if not result.scalar_one_or_none():
+        raise HTTPException(status_code=404, detail="Ride template not found")
+
+    await db.execute(
+        update(Ride)
+        .where(
+            Ride.template_id == template_id,
+            Ride.ride_date >= campus_today(),
+            Ride.status == RideStatusEnum.open,
+            ~exists().where(RideParticipant.ride_id == Ride.ride_id),
+        )
+        .values(status=RideStatusEnum.cancelled)
+    )
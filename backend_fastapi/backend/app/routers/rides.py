@@ -4,6 +4,7 @@ Rides Router — Multi-passenger ride lifecycle management.
 Endpoints:
   POST   /rides                              — Create ride (driver)
   GET    /rides                              — List available rides
+  GET    /rides/feed                         — Open rides with driver, vehicle and rating
   GET    /rides/{ride_id}                    — Get ride details
   PUT    /rides/{ride_id}/status             — Update ride status
   POST   /rides/{ride_id}/request            — Rider requests to join (with pickup loc)
@@ -17,18 +18,26 @@ import string
 import uuid
 from typing import Optional
 from fastapi import APIRouter, HTTPException, status, Query
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import JSON, Numeric, case, cast, func, select, text
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.orm import aliased, selectinload
 
 from core.deps import DBSession, CurrentUser
-from db.models.rides import Ride
+from core.geo import geography_point, point_coords, point_json
+from core.responses import list_response
+from db.models.rides import Ride, RIDE_IS_OPEN
 from db.models.vehicles import Vehicle
 from db.models.ride_requests import RideRequest
 from db.models.ride_participants import RideParticipant
 from db.models.users import User
+from db.models.rating_summaries import RatingSummary
 from db.enums import RideStatusEnum, RideRequestStatusEnum
+from services.ride_completion_service import RideCompletionService
+from services.seat_limit_service import SeatLimitService, SeatLimitError
+from services.ride_expiry_service import campus_today
+from routers.tracking import forget_location
 from schemas.rides import (
-    RideCreate, RideRead, RideDetailRead, RideParticipantDetailRead,
+    RideCreate, RideRead, RideDetailRead, RideParticipantDetailRead, RideFeedItem,
     RideStatusUpdate, OtpVerifyRequest,
 )
 from schemas.ride_requests import (
@@ -61,20 +70,21 @@ async def create_ride(payload: RideCreate, user: CurrentUser, db: DBSession):
             detail="Vehicle not found or does not belong to you.",
         )
 
-    from geoalchemy2.shape import from_shape
-    from shapely.geometry import Point
+    if not await SeatLimitService(db).has_capacity(user.user_id, payload.ride_date):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Daily seat limit already reached for this date.",
+        )
 
     ride = Ride(
         ride_id=uuid.uuid4(),
         driver_id=user.user_id,
         vehicle_id=payload.vehicle_id,
-        start_location=from_shape(
-            Point(payload.start_location.longitude, payload.start_location.latitude),
-            srid=4326,
+        start_location=geography_point(
+            payload.start_location.latitude, payload.start_location.longitude
         ),
-        end_location=from_shape(
-            Point(payload.end_location.longitude, payload.end_location.latitude),
-            srid=4326,
+        end_location=geography_point(
+            payload.end_location.latitude, payload.end_location.longitude
         ),
         start_address=payload.start_address,
         end_address=payload.end_address,
@@ -95,67 +105,150 @@ async def create_ride(payload: RideCreate, user: CurrentUser, db: DBSession):
 
 @router.get("/", response_model=list[RideRead])
 async def list_rides(db: DBSession):
-    """List rides with status 'open'."""
+    """List open rides from today on."""
     result = await db.execute(
-        select(Ride).where(Ride.status == RideStatusEnum.open)
+        select(
+            Ride.ride_id,
+            point_json(Ride.start_location).label("start_location"),
+            point_json(Ride.end_location).label("end_location"),
+            Ride.start_address, Ride.end_address, Ride.ride_date, Ride.ride_time,
+            Ride.available_seats, Ride.allowed_gender, Ride.allowed_community,
+            Ride.estimated_fare, Ride.status, Ride.created_at,
+        ).where(RIDE_IS_OPEN, Ride.ride_date >= campus_today())
     )
-    return result.scalars().all()
+    return list_response(RideRead, result.mappings(), trusted=True)
+
+
+# ─── Ride feed ──────────────────────────────────────────────────────────────
+
+@router.get("/feed", response_model=list[RideFeedItem])
+async def ride_feed(
+    db: DBSession,
+    limit: int = Query(50, ge=1, le=200),
+):
+    """
+    Open rides, soonest first, with everything a ride card shows.
+
+    Driver, vehicle and rating aggregate are joined into flat rows in one
+    statement, so the client does not fetch ride detail per card.
+    """
+    average = cast(RatingSummary.rating_sum, Numeric) / func.nullif(RatingSummary.rating_count, 0)
+    result = await db.execute(
+        select(
+            Ride.ride_id,
+            point_json(Ride.start_location).label("start_location"),
+            point_json(Ride.end_location).label("end_location"),
+            Ride.start_address, Ride.end_address, Ride.ride_date, Ride.ride_time,
+            Ride.available_seats, Ride.allowed_gender, Ride.allowed_community,
+            Ride.estimated_fare, Ride.status, Ride.created_at,
+            Ride.driver_id,
+            User.full_name.label("driver_name"),
+            User.profile_photo_url.label("driver_photo_url"),
+            func.coalesce(func.round(average, 1), 0).label("driver_rating"),
+            func.coalesce(RatingSummary.rating_count, 0).label("driver_rating_count"),
+            Vehicle.vehicle_type,
+            Vehicle.vehicle_number,
+        )
+        .outerjoin(User, User.user_id == Ride.driver_id)
+        .outerjoin(Vehicle, Vehicle.vehicle_id == Ride.vehicle_id)
+        .outerjoin(RatingSummary, RatingSummary.user_id == Ride.driver_id)
+        .where(RIDE_IS_OPEN, Ride.ride_date >= campus_today())
+        .order_by(Ride.ride_date, Ride.ride_time)
+        .limit(limit)
+    )
+    return list_response(RideFeedItem, result.mappings(), trusted=True)
 
 
 # ─── Get ride details ───────────────────────────────────────────────────────
 
+def _ride_detail_query(ride_id: uuid.UUID, viewer_id: uuid.UUID):
+    """
+    Ride, driver, vehicle and participants in one statement.
+
+    Participants are aggregated into a JSON array by a correlated subquery;
+    per-rider OTPs are only included when the viewer is the driver.
+    """
+    participant_user = aliased(User, name="participant_user")
+    participants = (
+        select(
+            func.coalesce(
+                func.json_agg(
+                    aggregate_order_by(
+                        func.json_build_object(
+                            "participant_id", RideParticipant.participant_id,
+                            "user_id", RideParticipant.user_id,
+                            "full_name", func.coalesce(participant_user.full_name, "Unknown"),
+                            "phone_number", func.coalesce(participant_user.phone_number, ""),
+                            "pickup_lat", RideParticipant.pickup_lat,
+                            "pickup_lng", RideParticipant.pickup_lng,
+                            "pickup_address", RideParticipant.pickup_address,
+                            "is_picked_up", RideParticipant.is_picked_up,
+                            "pickup_otp", case(
+                                (Ride.driver_id == viewer_id, RideParticipant.pickup_otp)
+                            ),
+                            "joined_at", RideParticipant.joined_at,
+                        ),
+                        RideParticipant.joined_at,
+                    )
+                ),
+                text("'[]'::json"),
+                type_=JSON,
+            )
+        )
+        .select_from(RideParticipant)
+        .outerjoin(participant_user, participant_user.user_id == RideParticipant.user_id)
+        .where(RideParticipant.ride_id == Ride.ride_id)
+        .correlate(Ride)
+        .scalar_subquery()
+    )
+    return (
+        select(
+            Ride.ride_id, Ride.driver_id, Ride.start_address, Ride.end_address,
+            Ride.ride_date, Ride.ride_time, Ride.available_seats, Ride.allowed_gender,
+            Ride.allowed_community, Ride.estimated_fare, Ride.status, Ride.created_at,
+            Ride.pickup_otp,
+            *point_coords(Ride.start_location, "start"),
+            *point_coords(Ride.end_location, "end"),
+            User.full_name.label("driver_name"),
+            Vehicle.vehicle_number,
+            participants.label("participants"),
+        )
+        .outerjoin(User, User.user_id == Ride.driver_id)
+        .outerjoin(Vehicle, Vehicle.vehicle_id == Ride.vehicle_id)
+        .where(Ride.ride_id == ride_id)
+    )
+
+
 @router.get("/{ride_id}", response_model=RideDetailRead)
 async def get_ride(
     ride_id: uuid.UUID, user: CurrentUser, db: DBSession
 ):
     """Get full ride details including participants and their pickup info."""
-    result = await db.execute(
-        select(Ride)
-        .options(
-            selectinload(Ride.driver),
-            selectinload(Ride.vehicle),
-            selectinload(Ride.participants).selectinload(RideParticipant.user),
-        )
-        .where(Ride.ride_id == ride_id)
-    )
-    ride = result.scalar_one_or_none()
-    if not ride:
+    row = (await db.execute(_ride_detail_query(ride_id, user.user_id))).mappings().first()
+    if not row:
         raise HTTPException(status_code=404, detail="Ride not found")
 
-    is_driver = ride.driver_id == user.user_id
-
-    participants = []
-    for p in ride.participants:
-        participants.append(RideParticipantDetailRead(
-            participant_id=p.participant_id,
-            user_id=p.user_id,
-            full_name=p.user.full_name if p.user else "Unknown",
-            phone_number=p.user.phone_number if p.user else "",
-            pickup_lat=p.pickup_lat,
-            pickup_lng=p.pickup_lng,
-            pickup_address=p.pickup_address,
-            is_picked_up=p.is_picked_up,
-            # Show per-rider OTP to driver only
-            pickup_otp=p.pickup_otp if is_driver else None,
-            joined_at=p.joined_at,
-        ))
+    is_driver = row["driver_id"] == user.user_id
 
     return RideDetailRead(
-        ride_id=ride.ride_id,
-        start_location={"latitude": 0, "longitude": 0},  # placeholder
-        end_location={"latitude": 0, "longitude": 0},
-        start_address=ride.start_address,
-        end_address=ride.end_address,
-        ride_date=ride.ride_date,
-        ride_time=ride.ride_time,
-        available_seats=ride.available_seats,
-        allowed_gender=ride.allowed_gender,
-        status=ride.status,
-        created_at=ride.created_at,
-        driver_name=ride.driver.full_name if ride.driver else None,
-        vehicle_number=ride.vehicle.vehicle_number if ride.vehicle else None,
-        participants=participants,
-        pickup_otp=ride.pickup_otp if not is_driver else None,
+        ride_id=row["ride_id"],
+        start_location={"latitude": row["start_lat"], "longitude": row["start_lng"]},
+        end_location={"latitude": row["end_lat"], "longitude": row["end_lng"]},
+        start_address=row["start_address"],
+        end_address=row["end_address"],
+        ride_date=row["ride_date"],
+        ride_time=row["ride_time"],
+        available_seats=row["available_seats"],
+        allowed_gender=row["allowed_gender"],
+        allowed_community=row["allowed_community"],
+        estimated_fare=row["estimated_fare"],
+        status=row["status"],
+        created_at=row["created_at"],
+        driver_name=row["driver_name"],
+        vehicle_number=row["vehicle_number"],
+        participants=row["participants"],
+        # Ride-level OTP goes to riders only
+        pickup_otp=row["pickup_otp"] if not is_driver else None,
     )
 
 
@@ -169,17 +262,42 @@ async def update_ride_status(
     db: DBSession,
 ):
     """Update ride status (driver only)."""
+    # Row lock so two concurrent "completed" updates cannot both run the pipeline
     result = await db.execute(
-        select(Ride).where(Ride.ride_id == ride_id, Ride.driver_id == user.user_id)
+        select(Ride)
+        .where(Ride.ride_id == ride_id, Ride.driver_id == user.user_id)
+        .with_for_update()
     )
     ride = result.scalar_one_or_none()
     if not ride:
         raise HTTPException(status_code=404, detail="Ride not found or access denied")
 
+    # Completed and cancelled are final: reopening and repeating the transition
+    # would re-run the completion pipeline (counting the driver's stats twice)
+    # or release the ride's seats twice
+    final = (RideStatusEnum.completed, RideStatusEnum.cancelled)
+    if ride.status in final and payload.status != ride.status:
+        raise HTTPException(status_code=400, detail=f"Ride is already {ride.status.value}")
+
     # Generate ride-level OTP when driver starts heading out
     if payload.status == RideStatusEnum.driver_arriving and not ride.pickup_otp:
         ride.pickup_otp = _generate_otp()
 
+    if payload.status == RideStatusEnum.completed and ride.status != RideStatusEnum.completed:
+        await RideCompletionService(db).complete(ride.ride_id)
+
+    if payload.status == RideStatusEnum.cancelled and ride.status != RideStatusEnum.cancelled:
+        riders = await db.execute(
+            select(func.count()).where(
+                RideParticipant.ride_id == ride.ride_id,
+                RideParticipant.user_id != ride.driver_id,
+            )
+        )
+        await SeatLimitService(db).release(ride.driver_id, ride.ride_date, riders.scalar_one())
+
+    if payload.status in (RideStatusEnum.completed, RideStatusEnum.cancelled):
+        forget_location(ride.ride_id)
+
     ride.status = payload.status
     await db.flush()
     await db.refresh(ride)
@@ -282,26 +400,38 @@ async def handle_ride_request(
     db: DBSession,
 ):
     """Accept or reject a ride request (driver only)."""
+    # Row locks (ride first, then request) so two concurrent accepts cannot
+    # both pass the checks below and double-book a seat or a passenger
     ride_result = await db.execute(
-        select(Ride).where(Ride.ride_id == ride_id, Ride.driver_id == user.user_id)
+        select(Ride)
+        .where(Ride.ride_id == ride_id, Ride.driver_id == user.user_id)
+        .with_for_update()
     )
     ride = ride_result.scalar_one_or_none()
     if not ride:
         raise HTTPException(status_code=403, detail="Not your ride")
 
     req_result = await db.execute(
-        select(RideRequest).where(
+        select(RideRequest)
+        .where(
             RideRequest.request_id == request_id,
             RideRequest.ride_id == ride_id,
         )
+        .with_for_update()
     )
     req = req_result.scalar_one_or_none()
     if not req:
         raise HTTPException(status_code=404, detail="Request not found")
 
     if payload.action == "accept":
+        if req.request_status == RideRequestStatusEnum.accepted:
+            raise HTTPException(status_code=400, detail="Request already accepted")
         if ride.available_seats <= 0:
             raise HTTPException(status_code=400, detail="No seats available")
+        try:
+            await SeatLimitService(db).reserve(ride.driver_id, ride.ride_date)
+        except SeatLimitError as e:
+            raise HTTPException(status_code=400, detail=e.message)
 
         req.request_status = RideRequestStatusEnum.accepted
 
@@ -2,18 +2,19 @@
 SOS Router — Trigger and query SOS alerts during rides.
 
 Endpoints:
-  POST /sos/trigger  — Create an SOS alert (logs location, linked to ride)
-  GET  /sos/active   — Get active SOS alerts for current user
+  POST /sos/trigger  — Create an SOS alert (logs location, texts emergency contacts + security)
+  GET  /sos/active   — Get active (unresolved) SOS alerts for current user
 """
 import uuid
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, HTTPException, status
 from sqlalchemy import select
-from geoalchemy2.functions import ST_MakePoint
 
 from core.deps import DBSession, CurrentUser
+from core.geo import geography_point
 from db.models.sos_alerts import SOSAlert
 from db.models.rides import Ride
 from schemas.sos_alerts import SOSAlertCreate, SOSAlertRead
+from services.sos_dispatch import dispatch_sos, sos_message, sos_recipients
 
 
 router = APIRouter(prefix="/sos", tags=["SOS"])
@@ -24,41 +25,47 @@ async def trigger_sos(
     payload: SOSAlertCreate,
     user: CurrentUser,
     db: DBSession,
+    background_tasks: BackgroundTasks,
 ):
     """
     Trigger an SOS alert during a ride.
-    Stores the user's current location and links it to the ride.
+    Stores the user's current location and links it to the ride, then texts
+    the user's emergency contacts and campus security concurrently.
     """
     # Verify ride exists
     ride_result = await db.execute(
-        select(Ride).where(Ride.ride_id == payload.ride_id)
+        select(Ride.ride_id).where(Ride.ride_id == payload.ride_id)
     )
-    ride = ride_result.scalar_one_or_none()
-    if not ride:
+    if ride_result.scalar_one_or_none() is None:
         raise HTTPException(status_code=404, detail="Ride not found")
 
     alert = SOSAlert(
         alert_id=uuid.uuid4(),
         user_id=user.user_id,
         ride_id=payload.ride_id,
-        location=ST_MakePoint(
-            payload.location.longitude,
-            payload.location.latitude,
-            type_="GEOGRAPHY",
-        ),
+        location=geography_point(payload.location.latitude, payload.location.longitude),
     )
     db.add(alert)
     await db.flush()
     await db.refresh(alert)
+
+    recipients = await sos_recipients(db, user.user_id)
+    text = sos_message(
+        user.full_name, user.phone_number, payload.location.latitude, payload.location.longitude
+    )
+    # Commit first: background tasks run before get_db's commit, and the
+    # notification rows reference the alert (security also sees it sooner)
+    await db.commit()
+    background_tasks.add_task(dispatch_sos, alert.alert_id, recipients, text)
     return alert
 
 
 @router.get("/active", response_model=list[SOSAlertRead])
 async def get_active_alerts(user: CurrentUser, db: DBSession):
-    """Get all SOS alerts triggered by the current user."""
+    """Get the current user's SOS alerts that security has not resolved yet."""
     result = await db.execute(
         select(SOSAlert)
-        .where(SOSAlert.user_id == user.user_id)
+        .where(SOSAlert.user_id == user.user_id, SOSAlert.resolved_at.is_(None))
         .order_by(SOSAlert.triggered_at.desc())
     )
     return result.scalars().all()
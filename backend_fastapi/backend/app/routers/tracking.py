@@ -5,18 +5,23 @@ GET  /tracking/{ride_id}           — Returns current ride state for the live t
 POST /tracking/{ride_id}/location  — Driver updates their live location (stored in-memory/cache).
 GET  /tracking/{ride_id}/location  — Get driver's latest live location.
 """
+import json
+import os
 import uuid
-from typing import Optional
 from fastapi import APIRouter, HTTPException
 from sqlalchemy import select
 from sqlalchemy.orm import selectinload
 from pydantic import BaseModel
 
+from core.config import get_settings
 from core.deps import DBSession, CurrentUser
+from core.geo import point_to_dict
+from core.lifespan import on_startup, on_shutdown
 from db.models.rides import Ride
 
 
 router = APIRouter(prefix="/tracking", tags=["Tracking"])
+settings = get_settings()
 
 # ---------------------------------------------------------------------------
 # In-memory driver location store (sufficient for demo + single-server setup)
@@ -25,23 +30,39 @@ router = APIRouter(prefix="/tracking", tags=["Tracking"])
 _driver_locations: dict[str, dict] = {}
 
 
+@on_startup
+def _restore_locations() -> None:
+    """Reload live locations saved by the previous process (TRACKING_SNAPSHOT_PATH)."""
+    path = settings.TRACKING_SNAPSHOT_PATH
+    if not path or not os.path.exists(path):
+        return
+    with open(path) as f:
+        _driver_locations.update(json.load(f))
+    os.remove(path)
+
+
+@on_shutdown
+def _save_locations() -> None:
+    """Persist live locations so a restart mid-ride does not blank the map."""
+    path = settings.TRACKING_SNAPSHOT_PATH
+    if not path or not _driver_locations:
+        return
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(_driver_locations, f)
+    os.replace(tmp_path, path)
+
+
+def forget_location(ride_id: uuid.UUID) -> None:
+    """Drop live tracking state for a ride that has ended."""
+    _driver_locations.pop(str(ride_id), None)
+
+
 class LocationUpdate(BaseModel):
     latitude: float
     longitude: float
 
 
-def _geo_to_coords(geo_value) -> Optional[dict]:
-    """Convert a GeoAlchemy2 Geography value to {latitude, longitude} dict."""
-    if geo_value is None:
-        return None
-    try:
-        from geoalchemy2.shape import to_shape
-        point = to_shape(geo_value)
-        return {"latitude": point.y, "longitude": point.x}
-    except Exception:
-        return None
-
-
 @router.get("/{ride_id}")
 async def get_tracking_info(
     ride_id: uuid.UUID, user: CurrentUser, db: DBSession
@@ -84,8 +105,8 @@ async def get_tracking_info(
     return {
         "ride_id": str(ride.ride_id),
         "status": ride.status.value,
-        "start_location": _geo_to_coords(ride.start_location),
-        "end_location": _geo_to_coords(ride.end_location),
+        "start_location": point_to_dict(ride.start_location),
+        "end_location": point_to_dict(ride.end_location),
         "start_address": ride.start_address,
         "end_address": ride.end_address,
         "driver": driver_info,
@@ -134,5 +155,5 @@ async def clear_driver_location(
     if not result.scalar_one_or_none():
         raise HTTPException(status_code=403, detail="Not your ride")
 
-    _driver_locations.pop(str(ride_id), None)
+    forget_location(ride_id)
     return {"message": "Location cleared"}
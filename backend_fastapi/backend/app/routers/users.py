@@ -1,12 +1,23 @@
 """
 Users Router — User profile management.
+
+Endpoints:
+  GET  /users/me           — Current user's profile
+  PUT  /users/me           — Update profile
+  GET  /users/me/history   — Completed rides, newest first (keyset paged)
 """
-from fastapi import APIRouter, HTTPException, status
-from sqlalchemy import select
+import base64
+import uuid
+from datetime import datetime
+from typing import Literal, Optional
+from fastapi import APIRouter, HTTPException, status, Query
+from sqlalchemy import select, literal, tuple_, union_all
 
 from core.deps import DBSession, CurrentUser
 from db.models.users import User
+from db.models.ride_history import RideHistory
 from schemas.users import UserRead, UserUpdate
+from schemas.ride_history import RideHistoryItem, RideHistoryPage
 
 
 router = APIRouter(prefix="/users", tags=["Users"])
@@ -35,3 +46,80 @@ async def update_my_profile(
     await db.flush()
     await db.refresh(user)
     return user
+
+
+# ─── Ride history ───────────────────────────────────────────────────────────
+
+def _encode_cursor(completed_at: datetime, history_id: uuid.UUID) -> str:
+    raw = f"{completed_at.isoformat()}|{history_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+    try:
+        completed_at, history_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(completed_at), uuid.UUID(history_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _history_branch(role: str, user_id: uuid.UUID, after, limit: int):
+    """
+    History rows for one side of the ride, newest first.
+
+    Each branch is an ordered range scan of its covering index
+    (passenger_id | driver_id, completed_at, history_id); no heap access.
+    """
+    if role == "rider":
+        own, counterpart = RideHistory.passenger_id, RideHistory.driver_name
+    else:
+        own, counterpart = RideHistory.driver_id, RideHistory.passenger_name
+
+    query = select(
+        RideHistory.history_id,
+        RideHistory.ride_id,
+        literal(role).label("role"),
+        RideHistory.completed_at,
+        RideHistory.start_address,
+        RideHistory.end_address,
+        RideHistory.fare,
+        counterpart.label("counterpart_name"),
+    ).where(own == user_id)
+    if after:
+        query = query.where(
+            tuple_(RideHistory.completed_at, RideHistory.history_id) < tuple_(*after)
+        )
+    return query.order_by(
+        RideHistory.completed_at.desc(), RideHistory.history_id.desc()
+    ).limit(limit)
+
+
+@router.get("/me/history", response_model=RideHistoryPage)
+async def get_my_ride_history(
+    user: CurrentUser,
+    db: DBSession,
+    role: Literal["all", "rider", "driver"] = "all",
+    limit: int = Query(20, ge=1, le=50),
+    cursor: Optional[str] = None,
+):
+    """Completed rides the user drove or rode in, newest first."""
+    after = _decode_cursor(cursor) if cursor else None
+    # Fetch one extra row to know whether another page exists
+    if role == "all":
+        merged = union_all(
+            _history_branch("rider", user.user_id, after, limit + 1),
+            _history_branch("driver", user.user_id, after, limit + 1),
+        ).subquery()
+        query = select(merged).order_by(
+            merged.c.completed_at.desc(), merged.c.history_id.desc()
+        ).limit(limit + 1)
+    else:
+        query = _history_branch(role, user.user_id, after, limit + 1)
+
+    rows = (await db.execute(query)).mappings().all()
+    items = [RideHistoryItem(**row) for row in rows[:limit]]
+    next_cursor = None
+    if len(rows) > limit:
+        last = items[-1]
+        next_cursor = _encode_cursor(last.completed_at, last.history_id)
+    return RideHistoryPage(items=items, next_cursor=next_cursor)
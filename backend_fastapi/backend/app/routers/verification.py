@@ -4,15 +4,19 @@ Verification Router — Tiered identity verification for UniRide.
 Endpoints:
   POST /verification/email/send-otp      — Send OTP to college email (auth required)
   POST /verification/email/verify-otp   — Verify email OTP → is_email_verified = True
-  POST /verification/identity/submit     — Upload college ID doc → status = submitted
+  POST /verification/identity/upload     — Upload college ID doc (multipart) → status = submitted
+  POST /verification/identity/submit     — Submit college ID doc URL / base64 → status = submitted
   GET  /verification/identity/status     — Get identity verification status
-  POST /verification/driver/submit       — Upload licence doc → status = submitted
+  PUT  /verification/face                — Save face embedding (duplicate-account check)
+  POST /verification/driver/upload       — Upload licence doc (multipart) → status = submitted
+  POST /verification/driver/submit       — Submit licence doc URL / base64 → status = submitted
   GET  /verification/driver/status       — Get driver verification status
 """
 import uuid
 from typing import Optional
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Request, status
 from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel, field_validator
 import re
 
@@ -27,9 +31,15 @@ from db.models.users import User
 from db.models.otp_sessions import OTPSession, IdentifierType
 from db.models.identity_verifications import IdentityVerification
 from db.models.driver_verifications import DriverVerification
-from db.enums import VerificationStatusEnum
+from db.enums import VerificationStatusEnum, OcrStatusEnum
 from services.otp_service import OTPService, OTPError
 from services.email_service import EmailService
+from services.ocr_service import notify_ocr
+from services.face_match_service import find_face_matches, save_face_embedding
+from services.blob_store import (
+    BlobStoreError, BlobTooLarge, UnsupportedDocument, StoredBlob,
+    decode_inline_document, get_blob_store,
+)
 
 router = APIRouter(prefix="/verification", tags=["Verification"])
 settings = get_settings()
@@ -145,6 +155,39 @@ async def verify_email_otp(
     return {"message": "Email verified successfully", "email": email}
 
 
+# =============================================================================
+# DOCUMENT STORAGE
+# =============================================================================
+
+def _document_error(e: BlobStoreError) -> HTTPException:
+    if isinstance(e, BlobTooLarge):
+        return HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=e.message)
+    if isinstance(e, UnsupportedDocument):
+        return HTTPException(status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE, detail=e.message)
+    return HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
+
+
+async def _receive_document(request: Request) -> tuple[StoredBlob, dict[str, str]]:
+    """Stream a multipart upload (`file` + text fields) into the blob store."""
+    try:
+        return await get_blob_store().receive_multipart(request)
+    except BlobStoreError as e:
+        raise _document_error(e)
+
+
+async def _document_ref(value: str) -> str:
+    """
+    What to store for a JSON-submitted document: external URLs as-is,
+    base64 / data URIs moved into the blob store as a reference.
+    """
+    if value.startswith(("http://", "https://")):
+        return value
+    try:
+        return (await get_blob_store().put_bytes(decode_inline_document(value))).ref
+    except BlobStoreError as e:
+        raise _document_error(e)
+
+
 # =============================================================================
 # IDENTITY VERIFICATION (College ID upload)
 # =============================================================================
@@ -161,23 +204,41 @@ class VerificationStatusResponse(BaseModel):
     reviewed_at: Optional[str] = None
 
 
-@router.post("/identity/submit", status_code=200)
-async def submit_identity_verification(
-    payload: IdentitySubmitRequest,
-    user: CurrentUser,
-    db: DBSession,
-):
-    """
-    Submit college ID document for identity verification.
-    Creates or updates the verification record with status = submitted.
-    Admin must approve to set is_identity_verified = True.
-    """
+class FaceEmbeddingRequest(BaseModel):
+    face_embedding: list[float]
+
+    @field_validator("face_embedding")
+    @classmethod
+    def validate_dimension(cls, v: list[float]) -> list[float]:
+        if len(v) != settings.FACE_EMBEDDING_DIM:
+            raise ValueError(f"face_embedding must have {settings.FACE_EMBEDDING_DIM} values")
+        return v
+
+
+def _record_face_match(record: IdentityVerification) -> None:
+    """Flag the closest other account when its face embedding is near-identical."""
+    matches = find_face_matches(record.user_id)
+    if matches and matches[0][1] >= settings.FACE_DUPLICATE_THRESHOLD:
+        record.face_match_user_id, record.face_match_score = matches[0]
+    else:
+        record.face_match_user_id = record.face_match_score = None
+
+
+def _check_identity_submittable(user: User) -> None:
     if user.is_identity_verified:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Identity is already verified.",
         )
 
+
+async def _submit_identity(
+    user: User, db: AsyncSession, document_ref: str, college_id_number: Optional[str]
+) -> dict:
+    """
+    Create or update the verification record with status = submitted and
+    queue it for OCR. Admin must approve to set is_identity_verified = True.
+    """
     # Upsert verification record
     result = await db.execute(
         select(IdentityVerification).where(IdentityVerification.user_id == user.user_id)
@@ -187,23 +248,81 @@ async def submit_identity_verification(
     if record:
         if record.status == VerificationStatusEnum.verified:
             raise HTTPException(status_code=400, detail="Already verified.")
-        record.document_url = payload.document_url
-        record.college_id_number = payload.college_id_number
+        record.document_url = document_ref
+        record.college_id_number = college_id_number
         record.status = VerificationStatusEnum.submitted
+        record.ocr_college_id_number = None
+        record.ocr_flags = None
     else:
         record = IdentityVerification(
             verification_id=uuid.uuid4(),
             user_id=user.user_id,
-            college_id_number=payload.college_id_number,
-            document_url=payload.document_url,
+            college_id_number=college_id_number,
+            document_url=document_ref,
             status=VerificationStatusEnum.submitted,
         )
         db.add(record)
-
-    await db.flush()
+    record.ocr_status = OcrStatusEnum.queued
+    _record_face_match(record)
+
+    # Commit before waking the OCR dispatcher: it claims jobs in its own
+    # session and would not see an uncommitted row (background tasks run
+    # before get_db's commit)
+    await db.commit()
+    notify_ocr()
     return {"message": "Identity verification submitted. Pending admin review.", "status": "submitted"}
 
 
+@router.post("/identity/upload", status_code=200)
+async def upload_identity_document(
+    request: Request,
+    user: CurrentUser,
+    db: DBSession,
+):
+    """
+    Upload the college ID as multipart/form-data: `file` (JPEG, PNG, WebP or
+    PDF) and optional `college_id_number`. The file is streamed into the
+    document store; the verification record keeps only a reference.
+    """
+    _check_identity_submittable(user)
+    blob, fields = await _receive_document(request)
+    return await _submit_identity(user, db, blob.ref, fields.get("college_id_number"))
+
+
+@router.post("/identity/submit", status_code=200)
+async def submit_identity_verification(
+    payload: IdentitySubmitRequest,
+    user: CurrentUser,
+    db: DBSession,
+):
+    """
+    Submit college ID document for identity verification.
+    Base64 documents are moved into the document store; prefer /identity/upload.
+    """
+    _check_identity_submittable(user)
+    document_ref = await _document_ref(payload.document_url)
+    return await _submit_identity(user, db, document_ref, payload.college_id_number)
+
+
+@router.put("/face", status_code=200)
+async def save_face(payload: FaceEmbeddingRequest, user: CurrentUser, db: DBSession):
+    """
+    Save the face embedding computed on the device during the selfie check.
+    A pending identity submission is re-checked against other accounts.
+    """
+    await save_face_embedding(db, user.user_id, payload.face_embedding)
+    result = await db.execute(
+        select(IdentityVerification).where(
+            IdentityVerification.user_id == user.user_id,
+            IdentityVerification.status == VerificationStatusEnum.submitted,
+        )
+    )
+    record = result.scalar_one_or_none()
+    if record:
+        _record_face_match(record)
+    return {"message": "Face data saved."}
+
+
 @router.get("/identity/status", response_model=VerificationStatusResponse)
 async def get_identity_status(user: CurrentUser, db: DBSession):
     """Get the current identity verification status for the authenticated user."""
@@ -231,17 +350,7 @@ class DriverVerificationSubmitRequest(BaseModel):
     license_document_url: str  # URL or base64 string of the licence document
 
 
-@router.post("/driver/submit", status_code=200)
-async def submit_driver_verification(
-    payload: DriverVerificationSubmitRequest,
-    user: CurrentUser,
-    db: DBSession,
-):
-    """
-    Submit driving licence for driver verification.
-    Requires identity verification first.
-    Admin must approve to set is_driver_verified = True.
-    """
+def _check_driver_submittable(user: User) -> None:
     if not user.is_identity_verified:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -250,6 +359,14 @@ async def submit_driver_verification(
     if user.is_driver_verified:
         raise HTTPException(status_code=400, detail="Driver is already verified.")
 
+
+async def _submit_driver(
+    user: User, db: AsyncSession, document_ref: str, license_number: Optional[str]
+) -> dict:
+    """
+    Create or update the driver verification record with status = submitted.
+    Admin must approve to set is_driver_verified = True.
+    """
     result = await db.execute(
         select(DriverVerification).where(DriverVerification.user_id == user.user_id)
     )
@@ -258,15 +375,15 @@ async def submit_driver_verification(
     if record:
         if record.status == VerificationStatusEnum.verified:
             raise HTTPException(status_code=400, detail="Already verified.")
-        record.license_number = payload.license_number
-        record.license_document_url = payload.license_document_url
+        record.license_number = license_number
+        record.license_document_url = document_ref
         record.status = VerificationStatusEnum.submitted
     else:
         record = DriverVerification(
             verification_id=uuid.uuid4(),
             user_id=user.user_id,
-            license_number=payload.license_number,
-            license_document_url=payload.license_document_url,
+            license_number=license_number,
+            license_document_url=document_ref,
             status=VerificationStatusEnum.submitted,
         )
         db.add(record)
@@ -275,6 +392,33 @@ async def submit_driver_verification(
     return {"message": "Driver verification submitted. Pending admin review.", "status": "submitted"}
 
 
+@router.post("/driver/upload", status_code=200)
+async def upload_driver_document(request: Request, user: CurrentUser, db: DBSession):
+    """
+    Upload the driving licence as multipart/form-data: `file` (JPEG, PNG,
+    WebP or PDF) and optional `license_number`. Requires identity
+    verification first.
+    """
+    _check_driver_submittable(user)
+    blob, fields = await _receive_document(request)
+    return await _submit_driver(user, db, blob.ref, fields.get("license_number"))
+
+
+@router.post("/driver/submit", status_code=200)
+async def submit_driver_verification(
+    payload: DriverVerificationSubmitRequest,
+    user: CurrentUser,
+    db: DBSession,
+):
+    """
+    Submit driving licence for driver verification.
+    Base64 documents are moved into the document store; prefer /driver/upload.
+    """
+    _check_driver_submittable(user)
+    document_ref = await _document_ref(payload.license_document_url)
+    return await _submit_driver(user, db, document_ref, payload.license_number)
+
+
 @router.get("/driver/status", response_model=VerificationStatusResponse)
 async def get_driver_status(user: CurrentUser, db: DBSession):
     """Get the current driver verification status for the authenticated user."""
@@ -2,9 +2,10 @@ from pydantic import BaseModel, Field, model_validator
 from uuid import UUID
 from datetime import datetime
 from typing import Optional, Any
-from geoalchemy2.shape import to_shape
 from geoalchemy2.elements import WKBElement
 
+from core.geo import point_to_dict
+
 class LocationPoint(BaseModel):
     latitude: float = Field(..., ge=-90, le=90)
     longitude: float = Field(..., ge=-180, le=180)
@@ -13,8 +14,7 @@ class LocationPoint(BaseModel):
     @classmethod
     def parse_wkb(cls, v: Any) -> Any:
         if isinstance(v, WKBElement):
-            point = to_shape(v)
-            return {"latitude": point.y, "longitude": point.x}
+            return point_to_dict(v)
         return v
 
 class TimestampMixin(BaseModel):
@@ -17,6 +17,7 @@ class RideStatusEnum(str, Enum):
     ongoing = "ongoing"
     completed = "completed"
     cancelled = "cancelled"
+    expired = "expired"  # still open when its departure time passed
 
 class RideRequestStatusEnum(str, Enum):
     pending = "pending"
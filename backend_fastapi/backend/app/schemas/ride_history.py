@@ -1,6 +1,7 @@
 from pydantic import BaseModel
 from uuid import UUID
 from datetime import datetime
+from typing import List, Literal, Optional
 
 class RideHistoryRead(BaseModel):
     history_id: UUID
@@ -8,3 +9,21 @@ class RideHistoryRead(BaseModel):
     driver_id: UUID
     passenger_id: UUID
     completed_at: datetime
+
+
+class RideHistoryItem(BaseModel):
+    """One history row as seen by the requesting user."""
+    history_id: UUID
+    ride_id: UUID
+    role: Literal["driver", "rider"]
+    completed_at: datetime
+    start_address: Optional[str] = None
+    end_address: Optional[str] = None
+    fare: Optional[float] = None
+    counterpart_name: Optional[str] = None  # driver when riding, passenger when driving
+
+
+class RideHistoryPage(BaseModel):
+    """Keyset page; pass next_cursor back as ?cursor= for the following page."""
+    items: List[RideHistoryItem]
+    next_cursor: Optional[str] = None
@@ -0,0 +1,65 @@
+"""
+Ride template schemas for recurring commutes.
+"""
+from pydantic import BaseModel, Field, field_validator
+from uuid import UUID
+from datetime import date, time, datetime
+from typing import List, Optional
+from .common import LocationPoint
+from .enums import AllowedGenderEnum
+
+
+class RideTemplateCreate(BaseModel):
+    """Recurring ride. weekdays uses ISO numbering: 1 = Monday ... 7 = Sunday."""
+    vehicle_id: UUID
+    start_location: LocationPoint
+    end_location: LocationPoint
+    start_address: str
+    end_address: str
+    weekdays: List[int] = Field(..., min_length=1, max_length=7)
+    ride_time: time
+    available_seats: int = Field(..., ge=1)
+    allowed_gender: AllowedGenderEnum = AllowedGenderEnum.any
+    allowed_community: Optional[str] = None
+    estimated_fare: Optional[float] = None
+    valid_from: Optional[date] = None
+    valid_until: Optional[date] = None
+
+    @field_validator("weekdays")
+    @classmethod
+    def check_weekdays(cls, v: List[int]) -> List[int]:
+        if any(day < 1 or day > 7 for day in v):
+            raise ValueError("weekdays must be between 1 (Monday) and 7 (Sunday)")
+        return sorted(set(v))
+
+
+class RideTemplateRead(BaseModel):
+    template_id: UUID
+    vehicle_id: UUID
+    start_location: LocationPoint
+    end_location: LocationPoint
+    start_address: str
+    end_address: str
+    weekdays: List[int]
+    ride_time: time
+    available_seats: int
+    allowed_gender: AllowedGenderEnum
+    allowed_community: Optional[str] = None
+    estimated_fare: Optional[float] = None
+    valid_from: date
+    valid_until: Optional[date] = None
+    is_active: bool
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class HolidayCreate(BaseModel):
+    holiday_date: date
+    name: str = Field(..., max_length=100)
+
+
+class HolidayRead(HolidayCreate):
+    class Config:
+        from_attributes = True
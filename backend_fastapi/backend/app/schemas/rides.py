@@ -3,7 +3,7 @@ from uuid import UUID
 from datetime import date, time, datetime
 from typing import List, Optional
 from .common import LocationPoint
-from .enums import RideStatusEnum, AllowedGenderEnum
+from .enums import RideStatusEnum, AllowedGenderEnum, VehicleTypeEnum
 
 
 class RideBase(BaseModel):
@@ -56,6 +56,17 @@ class RideDetailRead(RideRead):
     pickup_otp: Optional[str] = None  # ride-level OTP (legacy)
 
 
+class RideFeedItem(RideRead):
+    """Ride card row: ride plus driver, vehicle and rating, flat for the feed UI."""
+    driver_id: UUID
+    driver_name: Optional[str] = None
+    driver_photo_url: Optional[str] = None
+    driver_rating: float = 0.0
+    driver_rating_count: int = 0
+    vehicle_type: Optional[VehicleTypeEnum] = None
+    vehicle_number: Optional[str] = None
+
+
 class RideSearchResult(RideRead):
     """Ride search result with distance from search point."""
     distance_km: float = Field(..., description="Distance from search point in km")
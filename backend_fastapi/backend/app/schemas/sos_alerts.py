@@ -1,6 +1,7 @@
 from pydantic import BaseModel
 from uuid import UUID
 from datetime import datetime
+from typing import Optional
 from .common import LocationPoint
 
 class SOSAlertCreate(BaseModel):
@@ -11,3 +12,4 @@ class SOSAlertRead(SOSAlertCreate):
     alert_id: UUID
     user_id: UUID
     triggered_at: datetime
+    acknowledged_at: Optional[datetime] = None
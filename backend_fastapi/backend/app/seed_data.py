@@ -0,0 +1,374 @@
+"""
+Deterministic synthetic dataset for performance work.
+
+Streams users, vehicles, driver profiles, rides, ride requests, participants,
+ride history, ratings and OTP sessions into Postgres with asyncpg binary
+COPY. The same --seed always produces the same rows. Ride endpoints are
+scattered around the campuses in routers/fare.py.
+
+Rides and their dependent rows are generated and copied batch by batch, so
+memory stays bounded at millions of rows.
+
+Usage (from backend/app, against a scratch database):
+    python seed_data.py                      # 200k users, 1M rides
+    python seed_data.py --scale 0.05         # quick local dataset
+    python seed_data.py --truncate --seed 7
+"""
+import argparse
+import asyncio
+import hashlib
+import math
+import random
+import time
+import uuid
+from decimal import Decimal
+from datetime import date, datetime, time as dt_time, timedelta, timezone
+
+import db.models  # Ensure all models are registered
+from core.geo import encode_point
+from db.session import engine
+from db.enums import (
+    GenderEnum, VehicleTypeEnum, RideStatusEnum, RideRequestStatusEnum, AllowedGenderEnum,
+)
+from routers.fare import CAMPUSES
+
+BATCH_SIZE = 50_000
+
+# Base volumes at --scale 1
+BASE_USERS = 200_000
+BASE_RIDES = 1_000_000
+BASE_OTP_SESSIONS = 500_000
+DRIVER_SHARE = 0.12
+
+SEEDED_TABLES = (
+    "ratings", "ride_history", "ride_participants", "ride_requests", "rides",
+    "driver_profiles", "vehicles", "otp_sessions", "user_ride_stats", "rating_summaries",
+    "driver_daily_seats", "users",
+)
+
+COMMUNITIES = ("hostel", "day_scholar", "faculty", None)
+AREAS = ("Koramangala", "HSR Layout", "Jayanagar", "BTM Layout", "Indiranagar",
+         "Banashankari", "Rajajinagar", "Whitefield", "Electronic City", "Hebbal")
+
+
+def _user_name(index: int) -> str:
+    return f"Student {index:07d}"
+
+
+def _uuid(rng: random.Random) -> uuid.UUID:
+    return uuid.UUID(int=rng.getrandbits(128), version=4)
+
+
+def _near(rng: random.Random, lat: float, lng: float, radius_km: float) -> tuple[float, float]:
+    """Random point within radius_km of (lat, lng), denser near the centre."""
+    distance = radius_km * rng.random() ** 2
+    bearing = rng.uniform(0, 2 * math.pi)
+    dlat = distance / 111.0 * math.cos(bearing)
+    dlng = distance / (111.0 * math.cos(math.radians(lat))) * math.sin(bearing)
+    return lat + dlat, lng + dlng
+
+
+async def _copy(conn, table: str, columns: tuple[str, ...], records: list[tuple]) -> None:
+    if records:
+        await conn.copy_records_to_table(table, records=records, columns=columns)
+
+
+# ---------------------------------------------------------------------------
+# Users, vehicles, driver profiles
+# ---------------------------------------------------------------------------
+
+USER_COLUMNS = (
+    "user_id", "full_name", "email", "phone_number", "college_id", "gender", "community",
+    "is_phone_verified", "is_email_verified", "is_identity_verified", "is_driver_verified",
+    "is_admin", "is_active", "created_at",
+)
+VEHICLE_COLUMNS = ("vehicle_id", "user_id", "vehicle_type", "vehicle_number", "created_at")
+DRIVER_PROFILE_COLUMNS = ("user_id", "vehicle_id", "daily_seat_limit", "is_driver_active")
+
+
+async def seed_users(conn, rng: random.Random, n_users: int, now: datetime):
+    """Copy users plus a vehicle and driver profile per driver. Returns (user_ids, drivers)."""
+    user_ids: list[uuid.UUID] = []
+    drivers: list[tuple[uuid.UUID, uuid.UUID, int, str]] = []  # (user_id, vehicle_id, seats, name)
+    genders = list(GenderEnum)
+
+    for start in range(0, n_users, BATCH_SIZE):
+        users, vehicles, profiles = [], [], []
+        for i in range(start, min(start + BATCH_SIZE, n_users)):
+            user_id = _uuid(rng)
+            is_driver = rng.random() < DRIVER_SHARE
+            created = now - timedelta(days=rng.uniform(0, 720))
+            users.append((
+                user_id, _user_name(i), f"student{i:07d}@christuniversity.in",
+                f"+91{7000000000 + i}", f"CU{i:08d}", rng.choice(genders).name,
+                rng.choice(COMMUNITIES), True, rng.random() < 0.7, is_driver or rng.random() < 0.8,
+                is_driver, False, rng.random() > 0.01, created,
+            ))
+            user_ids.append(user_id)
+            if is_driver:
+                vehicle_id = _uuid(rng)
+                vehicle_type = VehicleTypeEnum.two_wheeler if rng.random() < 0.6 else VehicleTypeEnum.four_wheeler
+                seats = 1 if vehicle_type is VehicleTypeEnum.two_wheeler else rng.randint(2, 4)
+                vehicles.append((vehicle_id, user_id, vehicle_type.name, f"KA{i:08d}", created))
+                profiles.append((user_id, vehicle_id, seats * 4, True))
+                drivers.append((user_id, vehicle_id, seats, _user_name(i)))
+
+        await _copy(conn, "users", USER_COLUMNS, users)
+        await _copy(conn, "vehicles", VEHICLE_COLUMNS, vehicles)
+        await _copy(conn, "driver_profiles", DRIVER_PROFILE_COLUMNS, profiles)
+
+    return user_ids, drivers
+
+
+# ---------------------------------------------------------------------------
+# Rides and dependent rows
+# ---------------------------------------------------------------------------
+
+RIDE_COLUMNS = (
+    "ride_id", "driver_id", "vehicle_id", "start_location", "end_location", "start_address",
+    "end_address", "ride_date", "ride_time", "available_seats", "allowed_gender",
+    "allowed_community", "estimated_fare", "status", "created_at",
+)
+REQUEST_COLUMNS = (
+    "request_id", "ride_id", "passenger_id", "request_status", "pickup_lat", "pickup_lng",
+    "pickup_address", "requested_at",
+)
+PARTICIPANT_COLUMNS = (
+    "participant_id", "ride_id", "user_id", "pickup_lat", "pickup_lng", "pickup_address",
+    "is_picked_up", "joined_at",
+)
+HISTORY_COLUMNS = (
+    "history_id", "ride_id", "driver_id", "passenger_id", "completed_at",
+    "start_address", "end_address", "fare", "driver_name", "passenger_name",
+)
+RATING_COLUMNS = ("rating_id", "ride_id", "rater_id", "rated_user_id", "rating_value", "created_at")
+
+
+def _ride_status(rng: random.Random, departure: datetime, now: datetime) -> RideStatusEnum:
+    if departure > now:
+        return RideStatusEnum.cancelled if rng.random() < 0.03 else RideStatusEnum.open
+    if now - departure < timedelta(hours=1):
+        return rng.choice((RideStatusEnum.driver_arriving, RideStatusEnum.ongoing))
+    return RideStatusEnum.cancelled if rng.random() < 0.08 else RideStatusEnum.completed
+
+
+async def seed_rides(conn, rng: random.Random, n_rides: int, user_ids, drivers, now: datetime) -> dict:
+    campuses = list(CAMPUSES.values())
+    today = now.date()
+    counts = dict.fromkeys(("rides", "ride_requests", "ride_participants", "ride_history", "ratings"), 0)
+
+    for start in range(0, n_rides, BATCH_SIZE):
+        rides, requests, participants, history, ratings = [], [], [], [], []
+        for _ in range(start, min(start + BATCH_SIZE, n_rides)):
+            ride_id = _uuid(rng)
+            driver_id, vehicle_id, seats, driver_name = rng.choice(drivers)
+            campus = rng.choice(campuses)
+            area = rng.choice(AREAS)
+            home_lat, home_lng = _near(rng, campus["lat"], campus["lng"], 15.0)
+            campus_lat, campus_lng = _near(rng, campus["lat"], campus["lng"], 0.3)
+            to_campus = rng.random() < 0.55
+            if to_campus:
+                start_pt, end_pt = (home_lat, home_lng), (campus_lat, campus_lng)
+                start_address, end_address = area, campus["name"]
+                hour = rng.choice((7, 8, 8, 8, 9))
+            else:
+                start_pt, end_pt = (campus_lat, campus_lng), (home_lat, home_lng)
+                start_address, end_address = campus["name"], area
+                hour = rng.choice((13, 15, 16, 16, 17, 18))
+
+            ride_date = today + timedelta(days=rng.randint(-180, 14))
+            ride_time = dt_time(hour, rng.choice((0, 15, 30, 45)))
+            departure = datetime.combine(ride_date, ride_time, tzinfo=timezone.utc)
+            status = _ride_status(rng, departure, now)
+            created = departure - timedelta(hours=rng.uniform(1, 72))
+            fare = Decimal(f"{rng.uniform(30, 250):.2f}")
+
+            rides.append((
+                ride_id, driver_id, vehicle_id, encode_point(*start_pt), encode_point(*end_pt),
+                start_address, end_address, ride_date, ride_time, seats,
+                AllowedGenderEnum.any.name if rng.random() < 0.8 else rng.choice(list(AllowedGenderEnum)).name,
+                None, fare, status.name, created,
+            ))
+
+            # Requests from distinct passengers; accepted ones become participants
+            passengers = set()
+            accepted = 0
+            for _ in range(rng.randint(0, seats + 2)):
+                passenger_index = rng.randrange(len(user_ids))
+                passenger_id = user_ids[passenger_index]
+                if passenger_id == driver_id or passenger_id in passengers:
+                    continue
+                passengers.add(passenger_id)
+                pickup_lat, pickup_lng = _near(rng, *start_pt, 1.0)
+                requested = created + timedelta(minutes=rng.uniform(1, 600))
+                if status is RideStatusEnum.open and rng.random() < 0.5:
+                    request_status = RideRequestStatusEnum.pending
+                elif accepted < seats and rng.random() < 0.7:
+                    request_status = RideRequestStatusEnum.accepted
+                else:
+                    request_status = RideRequestStatusEnum.rejected
+                requests.append((
+                    _uuid(rng), ride_id, passenger_id, request_status.name,
+                    pickup_lat, pickup_lng, area, requested,
+                ))
+                if request_status is not RideRequestStatusEnum.accepted:
+                    continue
+
+                accepted += 1
+                picked_up = status is RideStatusEnum.completed
+                participants.append((
+                    _uuid(rng), ride_id, passenger_id, pickup_lat, pickup_lng, area,
+                    picked_up, requested + timedelta(minutes=rng.uniform(1, 30)),
+                ))
+                if status is RideStatusEnum.completed:
+                    completed_at = departure + timedelta(minutes=rng.uniform(20, 75))
+                    history.append((
+                        _uuid(rng), ride_id, driver_id, passenger_id, completed_at,
+                        start_address, end_address, fare, driver_name, _user_name(passenger_index),
+                    ))
+                    if rng.random() < 0.6:
+                        ratings.append((
+                            _uuid(rng), ride_id, passenger_id, driver_id,
+                            rng.choices((1, 2, 3, 4, 5), weights=(2, 3, 10, 35, 50))[0],
+                            completed_at + timedelta(hours=rng.uniform(0, 48)),
+                        ))
+                    if rng.random() < 0.3:
+                        ratings.append((
+                            _uuid(rng), ride_id, driver_id, passenger_id,
+                            rng.choices((3, 4, 5), weights=(10, 30, 60))[0],
+                            completed_at + timedelta(hours=rng.uniform(0, 48)),
+                        ))
+
+        await _copy(conn, "rides", RIDE_COLUMNS, rides)
+        await _copy(conn, "ride_requests", REQUEST_COLUMNS, requests)
+        await _copy(conn, "ride_participants", PARTICIPANT_COLUMNS, participants)
+        await _copy(conn, "ride_history", HISTORY_COLUMNS, history)
+        await _copy(conn, "ratings", RATING_COLUMNS, ratings)
+        for table, rows in (("rides", rides), ("ride_requests", requests),
+                            ("ride_participants", participants), ("ride_history", history),
+                            ("ratings", ratings)):
+            counts[table] += len(rows)
+        print(f"  rides {min(start + BATCH_SIZE, n_rides):,}/{n_rides:,}")
+
+    return counts
+
+
+# Same aggregates the completion pipeline maintains incrementally
+RIDE_STATS_SQL = """
+WITH ride_km AS (
+    SELECT r.ride_id, r.driver_id, r.ride_date,
+           ST_Distance(r.start_location, r.end_location) / 1000.0 AS km
+    FROM rides r
+    WHERE r.status = 'completed'
+),
+deltas AS (
+    SELECT driver_id AS user_id, 1 AS given, 0 AS taken, km, ride_date FROM ride_km
+    UNION ALL
+    SELECT h.passenger_id, 0, 1, k.km, k.ride_date
+    FROM ride_history h JOIN ride_km k ON k.ride_id = h.ride_id
+)
+INSERT INTO user_ride_stats (user_id, rides_given, rides_taken, distance_shared_km, last_ride_at)
+SELECT user_id, sum(given), sum(taken), sum(km), max(ride_date)::timestamptz
+FROM deltas
+GROUP BY user_id
+"""
+
+
+RATING_SUMMARY_SQL = """
+INSERT INTO rating_summaries (user_id, rating_count, rating_sum)
+SELECT rated_user_id, count(*), sum(rating_value) FROM ratings GROUP BY rated_user_id
+"""
+
+DAILY_SEATS_SQL = """
+INSERT INTO driver_daily_seats (driver_id, ride_date, seats_reserved)
+SELECT r.driver_id, r.ride_date, count(*)
+FROM ride_participants p JOIN rides r ON r.ride_id = p.ride_id
+WHERE r.status <> 'cancelled' AND p.user_id <> r.driver_id
+GROUP BY r.driver_id, r.ride_date
+"""
+
+
+# ---------------------------------------------------------------------------
+# OTP sessions
+# ---------------------------------------------------------------------------
+
+OTP_COLUMNS = (
+    "session_id", "identifier", "identifier_type", "otp_hash", "attempts",
+    "is_verified", "is_expired", "expires_at", "verified_at", "created_at", "ip_address",
+)
+
+
+async def seed_otp_sessions(conn, rng: random.Random, n_sessions: int, n_users: int, now: datetime) -> None:
+    for start in range(0, n_sessions, BATCH_SIZE):
+        rows = []
+        for _ in range(start, min(start + BATCH_SIZE, n_sessions)):
+            created = now - timedelta(minutes=rng.uniform(0, 60 * 24 * 30))
+            verified = rng.random() < 0.85
+            otp_hash = hashlib.sha256(f"{rng.randint(0, 999999):06d}".encode()).hexdigest()
+            rows.append((
+                _uuid(rng), f"+91{7000000000 + rng.randrange(n_users)}", "phone", otp_hash,
+                rng.randint(1, 3) if verified else rng.randint(0, 3),
+                verified, not verified, created + timedelta(minutes=5),
+                created + timedelta(seconds=rng.uniform(5, 120)) if verified else None,
+                created, f"10.{rng.randrange(256)}.{rng.randrange(256)}.{rng.randrange(256)}",
+            ))
+        await _copy(conn, "otp_sessions", OTP_COLUMNS, rows)
+
+
+# ---------------------------------------------------------------------------
+# Entry point
+# ---------------------------------------------------------------------------
+
+async def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic carpool dataset")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiplier on the base volumes")
+    parser.add_argument("--truncate", action="store_true", help="Empty the seeded tables first")
+    parser.add_argument(
+        "--anchor-date", type=date.fromisoformat, default=date.today(),
+        help="Day the dataset is centred on (YYYY-MM-DD, default today)",
+    )
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    # Timestamps are relative to the anchor day: same seed + anchor, same rows
+    now = datetime.combine(args.anchor_date, dt_time(12), tzinfo=timezone.utc)
+    n_users = max(int(BASE_USERS * args.scale), 100)
+    n_rides = max(int(BASE_RIDES * args.scale), 100)
+    n_sessions = int(BASE_OTP_SESSIONS * args.scale)
+
+    started = time.perf_counter()
+    async with engine.connect() as sa_conn:
+        raw = await sa_conn.get_raw_connection()
+        conn = raw.driver_connection
+        await conn.set_type_codec(
+            "geography", schema="public", format="binary",
+            encoder=lambda value: value, decoder=lambda value: value,
+        )
+        if args.truncate:
+            await conn.execute(f"TRUNCATE {', '.join(SEEDED_TABLES)} CASCADE")
+
+        print(f"Seeding {n_users:,} users...")
+        user_ids, drivers = await seed_users(conn, rng, n_users, now)
+        print(f"Seeding {n_rides:,} rides from {len(drivers):,} drivers...")
+        counts = await seed_rides(conn, rng, n_rides, user_ids, drivers, now)
+        print(f"Seeding {n_sessions:,} OTP sessions...")
+        await seed_otp_sessions(conn, rng, n_sessions, n_users, now)
+
+        print("Aggregating user_ride_stats from ride_history...")
+        await conn.execute(RIDE_STATS_SQL)
+        print("Aggregating rating_summaries from ratings...")
+        await conn.execute(RATING_SUMMARY_SQL)
+        print("Aggregating driver_daily_seats from ride_participants...")
+        await conn.execute(DAILY_SEATS_SQL)
+
+        # Fresh statistics so the planner sees real row counts straight away
+        await conn.execute(f"ANALYZE {', '.join(SEEDED_TABLES)}")
+
+    await engine.dispose()
+    summary = ", ".join(f"{count:,} {table}" for table, count in counts.items())
+    print(f"✅ Seeded {n_users:,} users, {summary} in {time.perf_counter() - started:.0f}s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
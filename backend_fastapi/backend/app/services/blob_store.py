@@ -0,0 +1,486 @@
+"""
+Blob Store - content-addressed storage for verification documents.
+
+Uploaded files are stored once under their SHA-256 and database rows keep
+only a reference string (`blob:sha256:<hex>`), never the bytes.
+
+Backends (BLOB_STORE_BACKEND):
+  local  files under BLOB_STORE_PATH, fanned out as ab/cd/<hash>
+  s3     any S3-compatible bucket (boto3, only imported when selected);
+         downloads are redirects to presigned URLs
+
+Uploads stream: receive_multipart() feeds the request body to
+python-multipart chunk by chunk, hashing and spooling the file part to a
+staging file as it arrives and aborting as soon as BLOB_MAX_UPLOAD_BYTES is
+exceeded. The file type is sniffed from its first bytes; the client's
+Content-Type is ignored. A hash that is already stored is not written again.
+"""
+import asyncio
+import base64
+import binascii
+import hashlib
+import os
+import re
+import tempfile
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import AsyncIterator, Optional
+
+from fastapi import Request
+from fastapi.responses import RedirectResponse, Response, StreamingResponse
+
+try:
+    from python_multipart.multipart import MultipartParser, parse_options_header
+except ModuleNotFoundError:  # python-multipart < 0.0.13
+    from multipart.multipart import MultipartParser, parse_options_header
+
+from core.config import get_settings
+
+settings = get_settings()
+
+BLOB_REF_PREFIX = "blob:sha256:"
+CHUNK_SIZE = 64 * 1024
+
+_KEY = re.compile(r"^[0-9a-f]{64}$")
+_MAX_FIELD_BYTES = 1024  # Non-file form fields (college_id_number, ...)
+_FORM_OVERHEAD_BYTES = 16 * 1024  # Boundaries, part headers and small fields
+
+_SIGNATURES = (
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"%PDF-", "application/pdf"),
+)
+
+
+class BlobStoreError(Exception):
+    """Base exception for blob store operations."""
+    def __init__(self, message: str, error_code: str):
+        self.message = message
+        self.error_code = error_code
+        super().__init__(message)
+
+
+class BlobTooLarge(BlobStoreError):
+    """Raised when an upload exceeds BLOB_MAX_UPLOAD_BYTES."""
+    pass
+
+
+class UnsupportedDocument(BlobStoreError):
+    """Raised when the uploaded bytes are not a supported document type."""
+    pass
+
+
+class BlobNotFound(BlobStoreError):
+    """Raised when a referenced blob is missing from the backend."""
+    pass
+
+
+def sniff_content_type(head: bytes) -> Optional[str]:
+    """JPEG / PNG / WebP / PDF from the leading bytes, else None."""
+    for signature, content_type in _SIGNATURES:
+        if head.startswith(signature):
+            return content_type
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "image/webp"
+    return None
+
+
+def blob_ref(key: str) -> str:
+    return f"{BLOB_REF_PREFIX}{key}"
+
+
+def parse_blob_ref(value: Optional[str]) -> Optional[str]:
+    """The hash in a `blob:sha256:` reference, or None for anything else."""
+    if not value or not value.startswith(BLOB_REF_PREFIX):
+        return None
+    key = value[len(BLOB_REF_PREFIX):]
+    return key if _KEY.match(key) else None
+
+
+def decode_inline_document(value: str) -> bytes:
+    """Decode a base64 / data-URI document as older clients submitted them."""
+    if value.startswith("data:"):
+        value = value.partition(",")[2]
+    try:
+        return base64.b64decode(value, validate=False)
+    except (binascii.Error, ValueError):
+        raise UnsupportedDocument("Document is not valid base64.", "INVALID_BASE64")
+
+
+@dataclass(frozen=True)
+class StoredBlob:
+    key: str
+    size: int
+    content_type: str
+    deduplicated: bool
+
+    @property
+    def ref(self) -> str:
+        return blob_ref(self.key)
+
+
+# ---------------------------------------------------------------------------
+# Backends
+# ---------------------------------------------------------------------------
+
+class BlobBackend(ABC):
+    """Where blob bytes live. Keys are lowercase hex SHA-256 digests."""
+
+    @abstractmethod
+    def staging_dir(self) -> str:
+        """Directory for in-progress uploads (same filesystem as the store, if local)."""
+        pass
+
+    @abstractmethod
+    async def exists(self, key: str) -> bool:
+        pass
+
+    @abstractmethod
+    async def put_file(self, key: str, path: str, content_type: str) -> None:
+        """Store a finished staging file under key; takes ownership of path."""
+        pass
+
+    @abstractmethod
+    def read(self, key: str) -> AsyncIterator[bytes]:
+        """Yield the blob in chunks. Raises BlobNotFound."""
+        pass
+
+    async def presigned_url(self, key: str) -> Optional[str]:
+        """Direct download URL, for backends that can serve blobs themselves."""
+        return None
+
+
+class LocalBlobBackend(BlobBackend):
+    """Blobs as files under a root directory."""
+
+    def __init__(self, root: str):
+        self.root = Path(root)
+        self._staging = self.root / "tmp"
+        self._staging.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / key[2:4] / key
+
+    def staging_dir(self) -> str:
+        return str(self._staging)
+
+    async def exists(self, key: str) -> bool:
+        return await asyncio.to_thread(self._path(key).exists)
+
+    async def put_file(self, key: str, path: str, content_type: str) -> None:
+        def _move():
+            dest = self._path(key)
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(path, dest)
+        await asyncio.to_thread(_move)
+
+    async def read(self, key: str) -> AsyncIterator[bytes]:
+        try:
+            f = await asyncio.to_thread(open, self._path(key), "rb")
+        except FileNotFoundError:
+            raise BlobNotFound("Document not found.", "BLOB_NOT_FOUND")
+        try:
+            while chunk := await asyncio.to_thread(f.read, CHUNK_SIZE):
+                yield chunk
+        finally:
+            f.close()
+
+
+class S3BlobBackend(BlobBackend):
+    """Blobs as objects in an S3-compatible bucket under documents/."""
+
+    def __init__(self):
+        # Deferred: boto3 is only needed when the s3 backend is configured
+        import boto3
+        from botocore.exceptions import ClientError
+
+        self._client_error = ClientError
+        self.bucket = settings.BLOB_S3_BUCKET
+        self.client = boto3.client(
+            "s3",
+            endpoint_url=settings.BLOB_S3_ENDPOINT_URL or None,
+            region_name=settings.BLOB_S3_REGION or None,
+            aws_access_key_id=settings.BLOB_S3_ACCESS_KEY or None,
+            aws_secret_access_key=settings.BLOB_S3_SECRET_KEY or None,
+        )
+
+    @staticmethod
+    def _object_key(key: str) -> str:
+        return f"documents/{key}"
+
+    def staging_dir(self) -> str:
+        return tempfile.gettempdir()
+
+    async def exists(self, key: str) -> bool:
+        try:
+            await asyncio.to_thread(
+                self.client.head_object, Bucket=self.bucket, Key=self._object_key(key)
+            )
+        except self._client_error as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+                return False
+            raise
+        return True
+
+    async def put_file(self, key: str, path: str, content_type: str) -> None:
+        try:
+            await asyncio.to_thread(
+                self.client.upload_file, path, self.bucket, self._object_key(key),
+                ExtraArgs={"ContentType": content_type},
+            )
+        finally:
+            os.remove(path)
+
+    async def read(self, key: str) -> AsyncIterator[bytes]:
+        try:
+            obj = await asyncio.to_thread(
+                self.client.get_object, Bucket=self.bucket, Key=self._object_key(key)
+            )
+        except self._client_error:
+            raise BlobNotFound("Document not found.", "BLOB_NOT_FOUND")
+        body = obj["Body"]
+        try:
+            while chunk := await asyncio.to_thread(body.read, CHUNK_SIZE):
+                yield chunk
+        finally:
+            body.close()
+
+    async def presigned_url(self, key: str) -> Optional[str]:
+        return await asyncio.to_thread(
+            self.client.generate_presigned_url,
+            "get_object",
+            Params={"Bucket": self.bucket, "Key": self._object_key(key)},
+            ExpiresIn=settings.BLOB_URL_EXPIRE_SECONDS,
+        )
+
+
+# ---------------------------------------------------------------------------
+# Streaming multipart receiver
+# ---------------------------------------------------------------------------
+
+class _FormReceiver:
+    """
+    python-multipart callbacks: the file part is hashed and spooled to a
+    staging file as it arrives; other parts are kept as short text fields.
+    """
+
+    def __init__(self, file_field: str, staging_dir: str, max_bytes: int):
+        self.file_field = file_field
+        self.staging_dir = staging_dir
+        self.max_bytes = max_bytes
+        self.hasher = hashlib.sha256()
+        self.size = 0
+        self.head = b""
+        self.path: Optional[str] = None
+        self.fields: dict[str, str] = {}
+        self._file = None
+        self._headers: dict[bytes, bytes] = {}
+        self._header_field = b""
+        self._header_value = b""
+        self._name = ""
+        self._value = bytearray()
+        self._is_file = False
+
+    def callbacks(self) -> dict:
+        return {
+            "on_part_begin": self.on_part_begin,
+            "on_header_field": self.on_header_field,
+            "on_header_value": self.on_header_value,
+            "on_header_end": self.on_header_end,
+            "on_headers_finished": self.on_headers_finished,
+            "on_part_data": self.on_part_data,
+            "on_part_end": self.on_part_end,
+        }
+
+    def on_part_begin(self) -> None:
+        self._headers = {}
+        self._value = bytearray()
+
+    def on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self._header_field += data[start:end]
+
+    def on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self._header_value += data[start:end]
+
+    def on_header_end(self) -> None:
+        self._headers[self._header_field.lower()] = self._header_value
+        self._header_field = b""
+        self._header_value = b""
+
+    def on_headers_finished(self) -> None:
+        _, params = parse_options_header(self._headers.get(b"content-disposition", b""))
+        self._name = params.get(b"name", b"").decode("latin-1")
+        self._is_file = self._name == self.file_field
+        if self._is_file:
+            if self.path is not None:
+                raise BlobStoreError("Upload exactly one file.", "MULTIPLE_FILES")
+            fd, self.path = tempfile.mkstemp(dir=self.staging_dir, prefix="upload-")
+            self._file = os.fdopen(fd, "wb")
+
+    def on_part_data(self, data: bytes, start: int, end: int) -> None:
+        chunk = data[start:end]
+        if self._is_file:
+            self.size += len(chunk)
+            if self.size > self.max_bytes:
+                raise BlobTooLarge(
+                    f"File exceeds the {self.max_bytes // (1024 * 1024)} MB limit.", "FILE_TOO_LARGE"
+                )
+            if len(self.head) < 16:
+                self.head += chunk[:16 - len(self.head)]
+            self.hasher.update(chunk)
+            self._file.write(chunk)
+        else:
+            self._value += chunk
+            if len(self._value) > _MAX_FIELD_BYTES:
+                raise BlobStoreError(f"Form field '{self._name}' is too long.", "FIELD_TOO_LARGE")
+
+    def on_part_end(self) -> None:
+        if self._is_file:
+            self._file.close()
+            self._file = None
+        elif self._name:
+            self.fields[self._name] = self._value.decode("utf-8", "replace")
+
+    def discard(self) -> None:
+        if self._file is not None:
+            self._file.close()
+        if self.path and os.path.exists(self.path):
+            os.remove(self.path)
+
+
+# ---------------------------------------------------------------------------
+# Store
+# ---------------------------------------------------------------------------
+
+class BlobStore:
+    """Content-addressed, deduplicating document store over a BlobBackend."""
+
+    def __init__(self, backend: BlobBackend, max_bytes: int):
+        self.backend = backend
+        self.max_bytes = max_bytes
+
+    async def _commit(self, path: str, key: str, size: int, content_type: str) -> StoredBlob:
+        if await self.backend.exists(key):
+            await asyncio.to_thread(os.remove, path)
+            return StoredBlob(key, size, content_type, deduplicated=True)
+        await self.backend.put_file(key, path, content_type)
+        return StoredBlob(key, size, content_type, deduplicated=False)
+
+    async def receive_multipart(
+        self, request: Request, file_field: str = "file"
+    ) -> tuple[StoredBlob, dict[str, str]]:
+        """
+        Stream a multipart/form-data body into the store.
+
+        Returns:
+            The stored file part and the remaining (text) form fields
+        """
+        content_type, params = parse_options_header(request.headers.get("content-type", ""))
+        if content_type != b"multipart/form-data" or b"boundary" not in params:
+            raise BlobStoreError("Expected a multipart/form-data upload.", "NOT_MULTIPART")
+        declared = request.headers.get("content-length")
+        if declared and declared.isdigit() and int(declared) > self.max_bytes + _FORM_OVERHEAD_BYTES:
+            raise BlobTooLarge(
+                f"File exceeds the {self.max_bytes // (1024 * 1024)} MB limit.", "FILE_TOO_LARGE"
+            )
+
+        receiver = _FormReceiver(file_field, self.backend.staging_dir(), self.max_bytes)
+        parser = MultipartParser(params[b"boundary"], receiver.callbacks())
+        try:
+            async for chunk in request.stream():
+                parser.write(chunk)
+            parser.finalize()
+            if receiver.path is None or receiver.size == 0:
+                raise BlobStoreError(f"No file in form field '{file_field}'.", "NO_FILE")
+            sniffed = sniff_content_type(receiver.head)
+            if sniffed is None:
+                raise UnsupportedDocument(
+                    "Upload a JPEG, PNG, WebP or PDF document.", "UNSUPPORTED_TYPE"
+                )
+            blob = await self._commit(
+                receiver.path, receiver.hasher.hexdigest(), receiver.size, sniffed
+            )
+        except BaseException:
+            receiver.discard()
+            raise
+        return blob, receiver.fields
+
+    async def put_bytes(self, data: bytes) -> StoredBlob:
+        """Store an in-memory document (legacy base64 submissions)."""
+        if len(data) > self.max_bytes:
+            raise BlobTooLarge(
+                f"File exceeds the {self.max_bytes // (1024 * 1024)} MB limit.", "FILE_TOO_LARGE"
+            )
+        content_type = sniff_content_type(data[:16])
+        if content_type is None:
+            raise UnsupportedDocument("Upload a JPEG, PNG, WebP or PDF document.", "UNSUPPORTED_TYPE")
+
+        def _spool() -> str:
+            fd, path = tempfile.mkstemp(dir=self.backend.staging_dir(), prefix="upload-")
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            return path
+
+        path = await asyncio.to_thread(_spool)
+        try:
+            return await self._commit(path, hashlib.sha256(data).hexdigest(), len(data), content_type)
+        except BaseException:
+            if os.path.exists(path):
+                os.remove(path)
+            raise
+
+    async def response(self, key: str) -> Response:
+        """Serve a blob: redirect to a presigned URL if possible, else stream it."""
+        url = await self.backend.presigned_url(key)
+        if url:
+            return RedirectResponse(url)
+        chunks = self.backend.read(key)
+        head = await anext(chunks, b"")  # raises BlobNotFound before headers are sent
+
+        async def body():
+            yield head
+            async for chunk in chunks:
+                yield chunk
+
+        return StreamingResponse(
+            body(),
+            media_type=sniff_content_type(head) or "application/octet-stream",
+            headers={"Cache-Control": "private, max-age=86400, immutable"},
+        )
+
+    async def read_document(self, value: Optional[str]) -> Optional[bytes]:
+        """Bytes of a stored or inline document; None for external URLs."""
+        key = parse_blob_ref(value)
+        if key:
+            return b"".join([chunk async for chunk in self.backend.read(key)])
+        if not value or value.startswith(("http://", "https://")):
+            return None
+        return decode_inline_document(value)
+
+    async def document_response(self, value: Optional[str]) -> Response:
+        """
+        Serve whatever a document column holds: a blob reference, an external
+        URL, or (rows written before the blob store) inline base64.
+        """
+        if not value:
+            raise BlobNotFound("No document on file.", "BLOB_NOT_FOUND")
+        key = parse_blob_ref(value)
+        if key:
+            return await self.response(key)
+        if value.startswith(("http://", "https://")):
+            return RedirectResponse(value)
+        data = decode_inline_document(value)
+        return Response(data, media_type=sniff_content_type(data[:16]) or "application/octet-stream")
+
+
+@lru_cache
+def get_blob_store() -> BlobStore:
+    """Get the process-wide store for the configured backend."""
+    backends = {
+        "local": lambda: LocalBlobBackend(settings.BLOB_STORE_PATH),
+        "s3": S3BlobBackend,
+    }
+    backend = backends[settings.BLOB_STORE_BACKEND]()  # validated by Settings
+    return BlobStore(backend, settings.BLOB_MAX_UPLOAD_BYTES)
@@ -0,0 +1,234 @@
+"""
+Face Index - in-memory cosine similarity search over face embeddings.
+
+FaceIndex keeps every embedding unit-normalised in one contiguous float32
+matrix, so cosine similarity for a batch of queries is a single matrix
+product followed by a partial sort. With FACE_INDEX_NLIST > 0 a coarse
+quantizer (spherical k-means, IVF-style) partitions the rows; a query then
+only scores the rows in its FACE_INDEX_NPROBE closest partitions.
+
+Used by services/face_match_service.py, which keeps it in sync with the
+face_data table.
+Not safe for concurrent use from several threads except fit_centroids().
+"""
+import uuid
+from typing import Optional, Sequence
+
+import numpy as np
+
+_QUERY_BATCH = 256  # Queries scored per matrix product (bounds the score matrix)
+_ASSIGN_BATCH = 8192
+_KMEANS_ITERATIONS = 10
+_TRAIN_SAMPLE_PER_LIST = 64
+
+Match = tuple[uuid.UUID, float]
+
+
+class FaceIndex:
+    """Top-k cosine search over a growing set of (user_id, embedding) rows."""
+
+    def __init__(self, dim: int, nlist: int = 0, nprobe: int = 8, seed: int = 0):
+        self.dim = dim
+        self.nlist = nlist
+        self.nprobe = nprobe
+        self._rng = np.random.default_rng(seed)
+        self._vectors = np.empty((1024, dim), dtype=np.float32)
+        self._ids: list[uuid.UUID] = []
+        self._rows: dict[uuid.UUID, int] = {}
+        # Coarse quantizer (trained by the sync task once there is enough data)
+        self._centroids: Optional[np.ndarray] = None
+        self._assign = np.empty(1024, dtype=np.int32)
+        self._lists: list[set[int]] = []
+        self._list_rows: list[Optional[np.ndarray]] = []  # cached array form of each list
+        self._trained_size = 0
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, user_id: uuid.UUID) -> bool:
+        return user_id in self._rows
+
+    def _normalize(self, vectors) -> np.ndarray:
+        v = np.asarray(vectors, dtype=np.float32).reshape(-1, self.dim)
+        norms = np.linalg.norm(v, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return v / norms
+
+    def _grow(self, needed: int) -> None:
+        capacity = len(self._vectors)
+        if needed <= capacity:
+            return
+        capacity = max(needed, capacity * 2)
+        vectors = np.empty((capacity, self.dim), dtype=np.float32)
+        vectors[:len(self)] = self._vectors[:len(self)]
+        assign = np.empty(capacity, dtype=np.int32)
+        assign[:len(self)] = self._assign[:len(self)]
+        self._vectors, self._assign = vectors, assign
+
+    def vector(self, user_id: uuid.UUID) -> Optional[np.ndarray]:
+        row = self._rows.get(user_id)
+        return None if row is None else self._vectors[row]
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+
+    def upsert_many(self, user_ids: Sequence[uuid.UUID], vectors) -> None:
+        """Insert or replace embeddings; one row per user."""
+        normalized = self._normalize(vectors)
+        self._grow(len(self) + len(user_ids))
+        rows = np.empty(len(user_ids), dtype=np.int64)
+        for i, user_id in enumerate(user_ids):
+            row = self._rows.get(user_id)
+            if row is None:
+                row = len(self._ids)
+                self._ids.append(user_id)
+                self._rows[user_id] = row
+            elif self._centroids is not None:
+                self._unlist(row)
+            rows[i] = row
+        self._vectors[rows] = normalized
+
+        if self._centroids is not None:
+            assignments = self._nearest_centroids(normalized)
+            self._assign[rows] = assignments
+            for row in rows.tolist():
+                self._enlist(row)
+
+    def remove(self, user_id: uuid.UUID) -> None:
+        row = self._rows.pop(user_id, None)
+        if row is None:
+            return
+        last = len(self._ids) - 1
+        if self._centroids is not None:
+            self._unlist(row)
+            self._unlist(last)
+        if row != last:
+            moved = self._ids[last]
+            self._ids[row] = moved
+            self._rows[moved] = row
+            self._vectors[row] = self._vectors[last]
+            self._assign[row] = self._assign[last]
+            if self._centroids is not None:
+                self._enlist(row)
+        self._ids.pop()
+
+    # ------------------------------------------------------------------
+    # Coarse quantizer
+    # ------------------------------------------------------------------
+
+    def _enlist(self, row: int) -> None:
+        self._lists[self._assign[row]].add(row)
+        self._list_rows[self._assign[row]] = None
+
+    def _unlist(self, row: int) -> None:
+        self._lists[self._assign[row]].discard(row)
+        self._list_rows[self._assign[row]] = None
+
+    def _rows_in(self, centroid: int) -> np.ndarray:
+        rows = self._list_rows[centroid]
+        if rows is None:
+            rows = np.fromiter(self._lists[centroid], dtype=np.int64, count=len(self._lists[centroid]))
+            self._list_rows[centroid] = rows
+        return rows
+
+    def _nearest_centroids(self, vectors: np.ndarray) -> np.ndarray:
+        out = np.empty(len(vectors), dtype=np.int32)
+        for start in range(0, len(vectors), _ASSIGN_BATCH):
+            block = vectors[start:start + _ASSIGN_BATCH]
+            out[start:start + len(block)] = np.argmax(block @ self._centroids.T, axis=1)
+        return out
+
+    def needs_training(self) -> bool:
+        # Too few rows per list makes the partitions meaningless; retrain as the data doubles
+        if not self.nlist or len(self) < self.nlist * 40:
+            return False
+        return self._centroids is None or len(self) >= 2 * self._trained_size
+
+    def training_sample(self) -> np.ndarray:
+        n = len(self)
+        size = min(n, self.nlist * _TRAIN_SAMPLE_PER_LIST)
+        return self._vectors[self._rng.choice(n, size, replace=False)]
+
+    def fit_centroids(self, sample: np.ndarray) -> np.ndarray:
+        """Spherical k-means over a sample; touches no index state, so it can run in a thread."""
+        centroids = sample[self._rng.choice(len(sample), self.nlist, replace=False)].copy()
+        for _ in range(_KMEANS_ITERATIONS):
+            assign = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.stack(
+                [np.bincount(assign, weights=column, minlength=self.nlist) for column in sample.T],
+                axis=1,
+            )
+            empty = np.bincount(assign, minlength=self.nlist) == 0
+            sums[empty] = centroids[empty]  # keep the old centroid for empty clusters
+            centroids = self._normalize(sums)
+        return centroids
+
+    def use_centroids(self, centroids: np.ndarray) -> None:
+        """Install a trained quantizer and re-partition every row."""
+        n = len(self)
+        self._centroids = centroids
+        assignments = self._nearest_centroids(self._vectors[:n])
+        self._assign[:n] = assignments
+        order = np.argsort(assignments, kind="stable")
+        bounds = np.searchsorted(assignments[order], np.arange(self.nlist + 1))
+        self._list_rows = [order[bounds[c]:bounds[c + 1]].astype(np.int64) for c in range(self.nlist)]
+        self._lists = [set(rows.tolist()) for rows in self._list_rows]
+        self._trained_size = n
+
+    def train(self) -> None:
+        self.use_centroids(self.fit_centroids(self.training_sample()))
+
+    # ------------------------------------------------------------------
+    # Search
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _top(scores: np.ndarray, k: int) -> np.ndarray:
+        if k >= len(scores):
+            return np.argsort(-scores)
+        top = np.argpartition(-scores, k - 1)[:k]
+        return top[np.argsort(-scores[top])]
+
+    def search(
+        self,
+        queries,
+        k: int = 5,
+        exclude: Optional[Sequence[Optional[uuid.UUID]]] = None,
+    ) -> list[list[Match]]:
+        """
+        Top-k most similar users for each query vector, best first.
+
+        exclude[i] (typically the querying user) is left out of result i.
+        """
+        q = self._normalize(queries)
+        n = len(self)
+        results: list[list[Match]] = []
+        if n == 0:
+            return [[] for _ in range(len(q))]
+
+        for start in range(0, len(q), _QUERY_BATCH):
+            block = q[start:start + _QUERY_BATCH]
+            if self._centroids is None:
+                block_scores = block @ self._vectors[:n].T
+            else:
+                nprobe = min(self.nprobe, self.nlist)
+                probes = np.argpartition(-(block @ self._centroids.T), nprobe - 1, axis=1)[:, :nprobe]
+
+            for i, query in enumerate(block):
+                if self._centroids is None:
+                    rows, scores = None, block_scores[i]
+                else:
+                    rows = np.concatenate([self._rows_in(c) for c in probes[i]])
+                    scores = self._vectors[rows] @ query
+                skip = self._rows.get(exclude[start + i]) if exclude else None
+                if skip is not None:
+                    scores = np.where((rows if rows is not None else np.arange(n)) == skip, -np.inf, scores)
+                top = self._top(scores, min(k + 1, len(scores)))
+                hits = [
+                    (self._ids[row if rows is None else rows[row]], float(scores[row]))
+                    for row in top.tolist()
+                    if scores[row] > -np.inf
+                ]
+                results.append(hits[:k])
+        return results
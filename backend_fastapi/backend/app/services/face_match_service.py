@@ -0,0 +1,135 @@
+"""
+Face Match Service - duplicate-account check on face embeddings.
+
+Every identity submission looks up the submitter's face embedding against
+everyone else's, inline, so one person behind several accounts is flagged
+for the admin reviewer instead of being found by a nightly full scan.
+
+Each app worker holds its own services.face_index.FaceIndex. The
+face-index-sync background task loads face_data at startup, trains the
+coarse quantizer off the event loop when FACE_INDEX_NLIST is set, and then
+picks up embeddings saved by other workers by last_verified_at.
+save_face_embedding() updates the local index immediately.
+"""
+import asyncio
+import logging
+import uuid
+from datetime import timedelta
+from typing import Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import get_settings
+from core.lifespan import background_task
+from db.models.face_data import FaceData
+from db.session import AsyncSessionLocal
+from services.face_index import FaceIndex
+
+logger = logging.getLogger("uvicorn.error")
+settings = get_settings()
+
+_LOAD_BATCH = 5000
+# now() is the transaction start; re-read a margin so slow commits are not missed
+_SYNC_OVERLAP = timedelta(minutes=1)
+
+_index: Optional[FaceIndex] = None  # created on first use
+_ready = asyncio.Event()
+
+
+def _get_index() -> FaceIndex:
+    global _index
+    if _index is None:
+        _index = FaceIndex(
+            settings.FACE_EMBEDDING_DIM,
+            nlist=settings.FACE_INDEX_NLIST,
+            nprobe=settings.FACE_INDEX_NPROBE,
+        )
+    return _index
+
+
+async def save_face_embedding(db: AsyncSession, user_id: uuid.UUID, embedding: list[float]) -> None:
+    """Upsert the user's FaceData row and this worker's index entry."""
+    stmt = insert(FaceData).values(
+        user_id=user_id, face_embedding=embedding, last_verified_at=func.now()
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[FaceData.user_id],
+        set_={"face_embedding": stmt.excluded.face_embedding, "last_verified_at": func.now()},
+    )
+    await db.execute(stmt)
+    if settings.FACE_INDEX_ENABLED:
+        _get_index().upsert_many([user_id], [embedding])
+
+
+def find_face_matches(user_id: uuid.UUID, k: Optional[int] = None) -> Optional[list[tuple[uuid.UUID, float]]]:
+    """
+    Other users whose face embedding is closest to this user's, best first,
+    as (user_id, cosine similarity).
+
+    Returns None when the check cannot run (index disabled or still
+    loading, or the user has no face embedding).
+    """
+    if not _ready.is_set():
+        return None
+    index = _get_index()
+    vector = index.vector(user_id)
+    if vector is None:
+        return None
+    return index.search(vector, k=k or settings.FACE_MATCH_TOP_K, exclude=[user_id])[0]
+
+
+async def _load_rows(since=None):
+    """Index face_data rows (all, or changed since `since`) in batches; returns the newest timestamp."""
+    index = _get_index()
+    newest = since
+    query = select(FaceData.user_id, FaceData.face_embedding, FaceData.last_verified_at)
+    if since is not None:
+        query = query.where(FaceData.last_verified_at > since - _SYNC_OVERLAP)
+    async with AsyncSessionLocal() as db:
+        result = await db.stream(query.execution_options(yield_per=_LOAD_BATCH))
+        async for batch in result.partitions():
+            rows = [row for row in batch if len(row.face_embedding) == index.dim]
+            if len(rows) < len(batch):
+                logger.warning("Skipped %d face embeddings of the wrong dimension", len(batch) - len(rows))
+            if rows:
+                index.upsert_many([row.user_id for row in rows], [row.face_embedding for row in rows])
+            stamps = [row.last_verified_at for row in batch if row.last_verified_at is not None]
+            if stamps:
+                newest = max([newest, *stamps]) if newest else max(stamps)
+            await asyncio.sleep(0)  # let requests run between batches
+    return newest
+
+
+async def _train_if_needed() -> None:
+    index = _get_index()
+    if index.needs_training():
+        centroids = await asyncio.to_thread(index.fit_centroids, index.training_sample())
+        index.use_centroids(centroids)
+        logger.info("Face index quantizer trained: %d lists over %d embeddings", index.nlist, len(index))
+
+
+@background_task("face-index-sync")
+async def run_face_index_sync() -> None:
+    """Load face_data into the index, then follow writes from other workers."""
+    if not settings.FACE_INDEX_ENABLED:
+        return
+    watermark = None
+    while not _ready.is_set():
+        try:
+            watermark = await _load_rows()
+            await _train_if_needed()
+            _ready.set()
+            logger.info("Face index loaded %d embeddings", len(_get_index()))
+        except Exception:
+            logger.exception("Face index load failed; retrying")
+            await asyncio.sleep(settings.FACE_INDEX_REFRESH_SECONDS)
+
+    while True:
+        await asyncio.sleep(settings.FACE_INDEX_REFRESH_SECONDS)
+        try:
+            watermark = await _load_rows(watermark)
+            await _train_if_needed()
+        except Exception:
+            logger.exception("Face index refresh failed")
@@ -0,0 +1,189 @@
+"""
+OCR Service - pre-reads submitted college IDs for the admin review queue.
+
+The queue lives in identity_verifications: a submission sets
+ocr_status = 'queued' and calls notify_ocr(). The ocr-pipeline background
+task in each app worker then:
+
+  1. claims up to the free space of a bounded in-process queue
+     (UPDATE ... SET ocr_status = 'running' over a SKIP LOCKED selection,
+     oldest first), so admission-week backlogs wait in the table, not in
+     memory, and several app workers never claim the same row
+  2. has OCR_WORKERS consumers run services.ocr_worker.extract_id_fields
+     in a ProcessPoolExecutor, keeping CPU-bound extraction off the
+     event loop
+  3. writes the result back: ocr_college_id_number, ocr_flags for the
+     reviewer, and college_id_number pre-filled when the user left it blank
+
+Jobs left 'running' longer than OCR_JOB_TIMEOUT_SECONDS (a worker died)
+are claimed again.
+"""
+import asyncio
+import logging
+import multiprocessing
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import timedelta
+from functools import partial
+from typing import Optional
+from sqlalchemy import and_, func, literal_column, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import get_settings
+from core.lifespan import background_task
+from db.enums import OcrStatusEnum
+from db.models.identity_verifications import IdentityVerification
+from db.models.users import User
+from db.session import AsyncSessionLocal
+from services.blob_store import get_blob_store
+from services.ocr_worker import extract_id_fields
+
+logger = logging.getLogger("uvicorn.error")
+settings = get_settings()
+
+# Providers implemented in services/ocr_worker.py; others use the text scan
+_WORKER_PROVIDERS = ("console", "tesseract")
+
+_wakeup = asyncio.Event()
+
+
+def notify_ocr() -> None:
+    """Wake this worker's dispatcher after queueing a job (others poll)."""
+    _wakeup.set()
+
+
+@dataclass(frozen=True)
+class OcrJob:
+    verification_id: uuid.UUID
+    document_url: Optional[str]
+    college_id_number: Optional[str]
+    full_name: Optional[str]
+
+
+async def ocr_queue_stats(db: AsyncSession) -> dict:
+    """Job counts per ocr_status plus the age of the oldest queued job."""
+    counts = dict((await db.execute(
+        select(IdentityVerification.ocr_status, func.count())
+        .where(IdentityVerification.ocr_status.is_not(None))
+        .group_by(IdentityVerification.ocr_status)
+    )).all())
+    oldest = (await db.execute(
+        select(func.min(IdentityVerification.created_at))
+        .where(IdentityVerification.ocr_status == literal_column("'queued'"))
+    )).scalar()
+    return {
+        **{s.value: counts.get(s, 0) for s in OcrStatusEnum},
+        "oldest_queued_at": str(oldest) if oldest else None,
+        "provider": settings.OCR_PROVIDER,
+        "workers_per_process": settings.OCR_WORKERS,
+    }
+
+
+async def _claim(limit: int) -> list[OcrJob]:
+    """Mark up to `limit` queued (or stale running) jobs as running and return them."""
+    iv = IdentityVerification
+    stale_before = func.now() - timedelta(seconds=settings.OCR_JOB_TIMEOUT_SECONDS)
+    claimable = (
+        select(iv.verification_id)
+        .where(or_(
+            iv.ocr_status == literal_column("'queued'"),
+            and_(iv.ocr_status == literal_column("'running'"), iv.ocr_started_at < stale_before),
+        ))
+        .order_by(iv.created_at)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            update(iv)
+            .where(iv.verification_id.in_(claimable.scalar_subquery()), iv.user_id == User.user_id)
+            .values(ocr_status=OcrStatusEnum.running, ocr_started_at=func.now())
+            .returning(iv.verification_id, iv.document_url, iv.college_id_number, User.full_name)
+        )
+        jobs = [OcrJob(*row) for row in result.all()]
+        await db.commit()
+    return jobs
+
+
+async def _run_job(job: OcrJob, pool: ProcessPoolExecutor) -> None:
+    provider = settings.OCR_PROVIDER.lower()
+    try:
+        data = await get_blob_store().read_document(job.document_url)
+        if data is None:
+            result = {"college_id_number": None, "flags": ["external_document"]}
+        else:
+            result = await asyncio.get_running_loop().run_in_executor(pool, partial(
+                extract_id_fields, data, provider, settings.OCR_COLLEGE_ID_PATTERN,
+                job.full_name, job.college_id_number,
+            ))
+        status = OcrStatusEnum.done
+    except Exception:
+        logger.exception("OCR failed for verification %s", job.verification_id)
+        result = {"college_id_number": None, "flags": ["ocr_failed"]}
+        status = OcrStatusEnum.failed
+
+    iv = IdentityVerification
+    async with AsyncSessionLocal() as db:
+        # Only if still ours: a resubmission re-queues the row meanwhile
+        await db.execute(
+            update(iv)
+            .where(iv.verification_id == job.verification_id, iv.ocr_status == OcrStatusEnum.running)
+            .values(
+                ocr_status=status,
+                ocr_college_id_number=result["college_id_number"],
+                ocr_flags=result["flags"],
+                ocr_completed_at=func.now(),
+                college_id_number=func.coalesce(iv.college_id_number, result["college_id_number"]),
+            )
+        )
+        await db.commit()
+
+
+async def _consume(queue: asyncio.Queue, pool: ProcessPoolExecutor) -> None:
+    while True:
+        job = await queue.get()
+        try:
+            await _run_job(job, pool)
+        except Exception:
+            logger.exception("Could not record OCR result for %s", job.verification_id)
+        finally:
+            queue.task_done()
+            _wakeup.set()  # room to claim another
+
+
+@background_task("ocr-pipeline")
+async def run_ocr_pipeline() -> None:
+    """Claim queued OCR jobs into a bounded queue served by a process pool."""
+    if settings.OCR_WORKERS <= 0:
+        return
+    if settings.OCR_PROVIDER.lower() not in _WORKER_PROVIDERS:
+        logger.warning("OCR_PROVIDER=%s is not implemented; using the built-in text scan", settings.OCR_PROVIDER)
+
+    # spawn: forking a process that runs an event loop and DB pool is unsafe
+    pool = ProcessPoolExecutor(
+        max_workers=settings.OCR_WORKERS, mp_context=multiprocessing.get_context("spawn")
+    )
+    queue: asyncio.Queue[OcrJob] = asyncio.Queue(maxsize=settings.OCR_QUEUE_SIZE)
+    consumers = [asyncio.create_task(_consume(queue, pool)) for _ in range(settings.OCR_WORKERS)]
+    try:
+        while True:
+            _wakeup.clear()
+            free = queue.maxsize - queue.qsize()
+            try:
+                jobs = await _claim(free) if free else []
+            except Exception:
+                logger.exception("Could not claim OCR jobs")
+                jobs = []
+            for job in jobs:
+                queue.put_nowait(job)
+            if jobs and len(jobs) == free:
+                continue  # possibly more waiting; claim again once there is room
+            try:
+                await asyncio.wait_for(_wakeup.wait(), timeout=settings.OCR_POLL_INTERVAL_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+    finally:
+        for consumer in consumers:
+            consumer.cancel()
+        pool.shutdown(wait=False, cancel_futures=True)
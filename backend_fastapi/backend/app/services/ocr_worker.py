@@ -0,0 +1,75 @@
+"""
+OCR Worker - CPU-bound college ID extraction, run in child processes.
+
+services/ocr_service.py submits extract_id_fields() to a
+ProcessPoolExecutor. Everything here is a plain function of bytes and
+strings so it pickles cleanly and imports fast under the "spawn" start
+method: do not import settings, the database or the app from this module.
+
+Providers:
+  tesseract  pytesseract + Pillow on images (PDFs fall back to the text scan)
+  console    pure-Python stand-in: printable text runs in the raw bytes,
+             which finds the text layer of uncompressed PDFs and test fixtures
+"""
+import io
+import re
+
+_PRINTABLE_RUN = re.compile(rb"[\x20-\x7e]{4,}")
+_WORD = re.compile(r"[a-z]+")
+
+
+def _text_standin(data: bytes) -> str:
+    return "\n".join(run.decode("ascii") for run in _PRINTABLE_RUN.findall(data))
+
+
+def _text_tesseract(data: bytes) -> str:
+    # Deferred: only the tesseract provider needs these
+    import pytesseract
+    from PIL import Image, ImageOps
+
+    image = ImageOps.grayscale(Image.open(io.BytesIO(data)))
+    return pytesseract.image_to_string(image)
+
+
+def extract_text(data: bytes, provider: str) -> str:
+    if provider == "tesseract" and not data.startswith(b"%PDF-"):
+        return _text_tesseract(data)
+    return _text_standin(data)
+
+
+def _name_found(full_name: str, text: str) -> bool:
+    """At least half of the name's words (2+ letters) appear in the text."""
+    wanted = {word for word in _WORD.findall(full_name.lower()) if len(word) > 1}
+    if not wanted:
+        return True
+    present = set(_WORD.findall(text.lower()))
+    return len(wanted & present) * 2 >= len(wanted)
+
+
+def extract_id_fields(
+    data: bytes,
+    provider: str,
+    id_pattern: str,
+    full_name: str | None,
+    declared_id: str | None,
+) -> dict:
+    """
+    Read a college ID document.
+
+    Returns:
+        {"college_id_number": str | None, "flags": [str, ...]} where flags are
+        id_number_not_found, id_number_mismatch (differs from declared_id)
+        and name_mismatch (full_name not on the card)
+    """
+    text = extract_text(data, provider)
+    match = re.search(id_pattern, text)
+    id_number = match.group(0) if match else None
+
+    flags = []
+    if id_number is None:
+        flags.append("id_number_not_found")
+    elif declared_id and declared_id.strip() != id_number:
+        flags.append("id_number_mismatch")
+    if full_name and not _name_found(full_name, text):
+        flags.append("name_mismatch")
+    return {"college_id_number": id_number, "flags": flags}
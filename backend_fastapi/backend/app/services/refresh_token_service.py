@@ -0,0 +1,164 @@
+"""
+Refresh Token Service - issuing, rotating and revoking refresh tokens.
+
+Tokens belong to a family: every login/registration starts a new family and
+each rotation hands the family_id down to the replacement token. Presenting
+a token that was already rotated away is treated as theft and revokes the
+whole family.
+"""
+import uuid
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import select, update, insert, literal, func
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import get_settings
+from core.security import generate_refresh_token, hash_refresh_token
+from db.models.refresh_tokens import RefreshToken
+
+settings = get_settings()
+
+
+class RefreshTokenError(Exception):
+    """Base exception for refresh token operations."""
+    def __init__(self, message: str, error_code: str):
+        self.message = message
+        self.error_code = error_code
+        super().__init__(message)
+
+
+class InvalidRefreshToken(RefreshTokenError):
+    """Raised when a token is unknown or has been revoked."""
+    pass
+
+
+class RefreshTokenExpired(RefreshTokenError):
+    """Raised when a token is past its expiry."""
+    pass
+
+
+class RefreshTokenReused(RefreshTokenError):
+    """Raised when an already-rotated token is presented again."""
+    pass
+
+
+class RefreshTokenService:
+    """Service for refresh token lifecycle with family-based reuse detection."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    @staticmethod
+    def _new_expiry() -> datetime:
+        return datetime.now(timezone.utc) + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+
+    async def issue(self, user_id: uuid.UUID) -> str:
+        """Start a new token family for a fresh login and return the plain token."""
+        plain = generate_refresh_token()
+        token_id = uuid.uuid4()
+        self.db.add(RefreshToken(
+            token_id=token_id,
+            user_id=user_id,
+            family_id=token_id,
+            token_hash=hash_refresh_token(plain),
+            expires_at=self._new_expiry(),
+        ))
+        await self.db.flush()
+        return plain
+
+    async def rotate(self, plain_token: str) -> tuple[uuid.UUID, str]:
+        """
+        Revoke the presented token and issue its successor in one round-trip.
+
+        The UPDATE ... RETURNING runs as a CTE feeding the INSERT, so the row
+        lock taken by the UPDATE decides concurrent refreshes: only one
+        request sees is_revoked = false and gets a successor.
+
+        Returns:
+            Tuple of (user_id, new plain token)
+
+        Raises:
+            InvalidRefreshToken: Unknown or revoked token
+            RefreshTokenExpired: Token past its expiry
+            RefreshTokenReused: Rotated token presented again (family revoked)
+        """
+        token_hash = hash_refresh_token(plain_token)
+        new_plain = generate_refresh_token()
+
+        rotated = (
+            update(RefreshToken)
+            .where(
+                RefreshToken.token_hash == token_hash,
+                RefreshToken.is_revoked == False,
+                RefreshToken.expires_at > func.now(),
+            )
+            .values(is_revoked=True, revoked_at=func.now())
+            .returning(RefreshToken.user_id, RefreshToken.family_id)
+            .cte("rotated")
+        )
+        stmt = (
+            insert(RefreshToken)
+            .from_select(
+                ["token_id", "user_id", "family_id", "token_hash", "is_revoked", "expires_at"],
+                select(
+                    literal(uuid.uuid4(), UUID(as_uuid=True)),
+                    rotated.c.user_id,
+                    rotated.c.family_id,
+                    literal(hash_refresh_token(new_plain)),
+                    literal(False),
+                    literal(self._new_expiry()),
+                ),
+            )
+            .returning(RefreshToken.user_id)
+        )
+        user_id = (await self.db.execute(stmt)).scalar_one_or_none()
+        if user_id is not None:
+            return user_id, new_plain
+
+        # Slow path: work out why rotation failed
+        result = await self.db.execute(
+            select(RefreshToken).where(RefreshToken.token_hash == token_hash)
+        )
+        record = result.scalar_one_or_none()
+        if not record:
+            raise InvalidRefreshToken("Invalid or revoked refresh token", "INVALID_TOKEN")
+
+        if not record.is_revoked:
+            raise RefreshTokenExpired(
+                "Refresh token has expired. Please log in again.",
+                "TOKEN_EXPIRED"
+            )
+
+        # Concurrent refreshes from one client (e.g. on app resume) lose the
+        # race within a few seconds; don't log the user out for that.
+        grace = timedelta(seconds=settings.REFRESH_TOKEN_REUSE_GRACE_SECONDS)
+        if record.revoked_at and datetime.now(timezone.utc) - record.revoked_at <= grace:
+            raise InvalidRefreshToken("Invalid or revoked refresh token", "INVALID_TOKEN")
+
+        await self.revoke_family(record.family_id)
+        raise RefreshTokenReused(
+            "Refresh token reuse detected. Please log in again.",
+            "TOKEN_REUSED"
+        )
+
+    async def revoke(self, plain_token: str) -> None:
+        """Revoke a single token (logout)."""
+        await self.db.execute(
+            update(RefreshToken)
+            .where(
+                RefreshToken.token_hash == hash_refresh_token(plain_token),
+                RefreshToken.is_revoked == False,
+            )
+            .values(is_revoked=True, revoked_at=func.now())
+        )
+
+    async def revoke_family(self, family_id: uuid.UUID) -> None:
+        """Revoke every live token descended from the same login."""
+        await self.db.execute(
+            update(RefreshToken)
+            .where(
+                RefreshToken.family_id == family_id,
+                RefreshToken.is_revoked == False,
+            )
+            .values(is_revoked=True, revoked_at=func.now())
+        )
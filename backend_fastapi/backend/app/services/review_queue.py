@@ -0,0 +1,182 @@
+"""
+Review Queue Service - leased work queue over pending verifications.
+
+Instead of every admin working through the same pending list, an admin
+claims the next few submissions: claimed_by / claimed_until are set over a
+FOR UPDATE SKIP LOCKED selection, so concurrent claims never hand out the
+same row and nobody waits on another admin's transaction. A lease that
+runs out (REVIEW_LEASE_SECONDS) returns the row to the queue.
+
+Decisions are set-based: one UPDATE ... RETURNING per batch, with the
+users.is_*_verified flags set in the same statement through a CTE. Rows
+leased to another admin are skipped, not overwritten.
+"""
+import enum
+import uuid
+from datetime import timedelta
+from typing import Optional
+
+from sqlalchemy import func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import get_settings
+from db.enums import VerificationStatusEnum
+from db.models.driver_verifications import DriverVerification
+from db.models.identity_verifications import IdentityVerification
+from db.models.users import User
+
+settings = get_settings()
+
+
+class ReviewKind(str, enum.Enum):
+    identity = "identity"
+    driver = "driver"
+
+
+# Verification table and the users flag an approval sets, per kind
+_KINDS = {
+    ReviewKind.identity: (IdentityVerification, "is_identity_verified"),
+    ReviewKind.driver: (DriverVerification, "is_driver_verified"),
+}
+
+
+class ReviewQueueError(Exception):
+    """Base exception for review queue operations."""
+    def __init__(self, message: str, error_code: str):
+        self.message = message
+        self.error_code = error_code
+        super().__init__(message)
+
+
+class VerificationNotFound(ReviewQueueError):
+    """Raised when a user has no verification record of this kind."""
+    pass
+
+
+class ClaimedByAnotherAdmin(ReviewQueueError):
+    """Raised when the record is leased to a different admin."""
+    pass
+
+
+class ReviewQueueService:
+    """Claims, releases and decides verifications of one kind."""
+
+    def __init__(self, db: AsyncSession, kind: ReviewKind):
+        self.db = db
+        self.kind = kind
+        self.model, self.user_flag = _KINDS[kind]
+
+    def _available_to(self, admin_id: uuid.UUID):
+        m = self.model
+        return or_(
+            m.claimed_by.is_(None),
+            m.claimed_by == admin_id,
+            m.claimed_until < func.now(),
+        )
+
+    async def claim(self, admin_id: uuid.UUID, limit: int) -> list[uuid.UUID]:
+        """
+        Lease up to `limit` of the oldest pending submissions to this admin
+        (including ones they already hold, whose lease is extended).
+
+        Returns:
+            user_ids of the leased submissions, oldest first
+        """
+        m = self.model
+        claimable = (
+            select(m.verification_id)
+            .where(m.status == VerificationStatusEnum.submitted, self._available_to(admin_id))
+            .order_by(m.created_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        result = await self.db.execute(
+            update(m)
+            .where(m.verification_id.in_(claimable.scalar_subquery()))
+            .values(
+                claimed_by=admin_id,
+                claimed_until=func.now() + timedelta(seconds=settings.REVIEW_LEASE_SECONDS),
+            )
+            .returning(m.user_id, m.created_at)
+        )
+        return [row.user_id for row in sorted(result.all(), key=lambda row: row.created_at)]
+
+    async def release(self, admin_id: uuid.UUID, user_ids: list[uuid.UUID]) -> list[uuid.UUID]:
+        """Hand this admin's leases on `user_ids` back to the queue."""
+        m = self.model
+        result = await self.db.execute(
+            update(m)
+            .where(m.user_id.in_(user_ids), m.claimed_by == admin_id)
+            .values(claimed_by=None, claimed_until=None)
+            .returning(m.user_id)
+        )
+        return list(result.scalars())
+
+    async def decide(
+        self,
+        admin_id: uuid.UUID,
+        user_ids: list[uuid.UUID],
+        approve: bool,
+        notes: Optional[str] = None,
+        pending_only: bool = True,
+    ) -> list[uuid.UUID]:
+        """
+        Approve or reject many verifications in one statement.
+
+        Rows leased to another admin (and, with pending_only, rows no longer
+        submitted) are left alone.
+
+        Returns:
+            user_ids that were decided
+        """
+        m = self.model
+        criteria = [m.user_id.in_(user_ids), self._available_to(admin_id)]
+        if pending_only:
+            criteria.append(m.status == VerificationStatusEnum.submitted)
+        decided = (
+            update(m)
+            .where(*criteria)
+            .values(
+                status=VerificationStatusEnum.verified if approve else VerificationStatusEnum.rejected,
+                reviewer_notes=notes,
+                reviewed_at=func.now(),
+                claimed_by=None,
+                claimed_until=None,
+            )
+            .returning(m.user_id)
+        )
+        if not approve:
+            return list((await self.db.execute(decided)).scalars())
+
+        decided = decided.cte("decided")
+        result = await self.db.execute(
+            update(User)
+            .where(User.user_id == decided.c.user_id)
+            .values({self.user_flag: True})
+            .returning(User.user_id)
+        )
+        return list(result.scalars())
+
+    async def decide_one(
+        self, admin_id: uuid.UUID, user_id: uuid.UUID, approve: bool, notes: Optional[str] = None
+    ) -> None:
+        """
+        Decide a single verification in any state (e.g. overturn a rejection).
+
+        Raises:
+            VerificationNotFound: No record for this user
+            ClaimedByAnotherAdmin: Record is leased to someone else
+        """
+        if await self.decide(admin_id, [user_id], approve, notes, pending_only=False):
+            return
+
+        # Slow path: work out why nothing was updated
+        exists_ = (await self.db.execute(
+            select(self.model.verification_id).where(self.model.user_id == user_id)
+        )).first()
+        if not exists_:
+            raise VerificationNotFound("Verification record not found", "NOT_FOUND")
+        raise ClaimedByAnotherAdmin(
+            "This verification is being reviewed by another admin.", "CLAIMED"
+        )
+
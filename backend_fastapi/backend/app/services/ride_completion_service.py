@@ -0,0 +1,111 @@
+"""
+Ride Completion Service - side effects of a ride reaching `completed`.
+
+One statement does the database work:
+  1. ride_history gets a row per participant (INSERT ... SELECT), with the
+     addresses, fare and names copied in for the history API
+  2. user_ride_stats is upserted for the driver (+1 given) and every
+     passenger that got a history row (+1 taken), both adding the ride's
+     straight-line distance to distance_shared_km
+
+ride_history is unique on (ride_id, passenger_id) and the insert skips
+conflicts, so a repeated completion neither duplicates history nor
+double-counts passengers. The driver is counted once because a ride is
+completed once: PUT /rides/{ride_id}/status refuses to move a ride out of
+completed.
+"""
+import uuid
+from sqlalchemy import func, literal, select, true, union_all
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from db.models.rides import Ride
+from db.models.ride_history import RideHistory
+from db.models.ride_participants import RideParticipant
+from db.models.user_ride_stats import UserRideStats
+from db.models.users import User
+
+
+class RideCompletionService:
+    """Bulk-writes history rows and per-user aggregates for a completed ride."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def complete(self, ride_id: uuid.UUID) -> int:
+        """
+        Record the completion of a ride.
+
+        Returns:
+            Number of passengers written to ride_history
+        """
+        ride = (
+            select(
+                Ride.ride_id,
+                Ride.driver_id,
+                Ride.start_address,
+                Ride.end_address,
+                Ride.estimated_fare,
+                User.full_name.label("driver_name"),
+                (func.ST_Distance(Ride.start_location, Ride.end_location) / 1000.0).label("km"),
+                func.now().label("completed_at"),
+            )
+            .outerjoin(User, User.user_id == Ride.driver_id)
+            .where(Ride.ride_id == ride_id)
+            .cte("ride")
+        )
+        passengers = (
+            select(RideParticipant.user_id, User.full_name)
+            .join(User, User.user_id == RideParticipant.user_id)
+            .where(RideParticipant.ride_id == ride_id)
+            .distinct()
+            .subquery()
+        )
+        history = (
+            insert(RideHistory)
+            .from_select(
+                [
+                    "history_id", "ride_id", "driver_id", "passenger_id", "completed_at",
+                    "start_address", "end_address", "fare", "driver_name", "passenger_name",
+                ],
+                select(
+                    func.gen_random_uuid(), ride.c.ride_id, ride.c.driver_id,
+                    passengers.c.user_id, ride.c.completed_at,
+                    ride.c.start_address, ride.c.end_address, ride.c.estimated_fare,
+                    ride.c.driver_name, passengers.c.full_name,
+                ).select_from(ride.join(passengers, passengers.c.user_id != ride.c.driver_id)),
+            )
+            .on_conflict_do_nothing(index_elements=["ride_id", "passenger_id"])
+            .returning(RideHistory.passenger_id)
+            .cte("history")
+        )
+        deltas = union_all(
+            select(
+                ride.c.driver_id.label("user_id"), literal(1).label("rides_given"),
+                literal(0).label("rides_taken"), ride.c.km, ride.c.completed_at,
+            ),
+            select(
+                history.c.passenger_id, literal(0), literal(1), ride.c.km, ride.c.completed_at,
+            ).select_from(history.join(ride, true())),
+        ).subquery()
+
+        stmt = insert(UserRideStats).from_select(
+            ["user_id", "rides_given", "rides_taken", "distance_shared_km", "last_ride_at"],
+            select(
+                deltas.c.user_id, deltas.c.rides_given, deltas.c.rides_taken,
+                func.coalesce(deltas.c.km, 0.0), deltas.c.completed_at,
+            ),
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[UserRideStats.user_id],
+            set_={
+                "rides_given": UserRideStats.rides_given + stmt.excluded.rides_given,
+                "rides_taken": UserRideStats.rides_taken + stmt.excluded.rides_taken,
+                "distance_shared_km": UserRideStats.distance_shared_km + stmt.excluded.distance_shared_km,
+                "last_ride_at": stmt.excluded.last_ride_at,
+            },
+        ).returning(UserRideStats.user_id)
+
+        result = await self.db.execute(stmt)
+        # Every returned row but the driver's is a passenger with a new history row
+        return max(len(result.all()) - 1, 0)
@@ -0,0 +1,98 @@
+"""
+Ride Expiry Service - moves rides nobody ran out of `open`.
+
+A ride whose ride_date/ride_time (campus-local) is more than
+RIDE_EXPIRY_GRACE_MINUTES in the past and is still `open` becomes `expired`.
+Each batch is one UPDATE over a LIMITed, SKIP LOCKED selection that walks
+ix_rides_open_departure (partial, WHERE status = 'open') from the oldest
+departure, and commits on its own so row locks stay short.
+
+Keeping `open` to upcoming rides is what keeps list_rides / the feed and
+that index proportional to the live schedule instead of all history.
+"""
+import asyncio
+import logging
+from datetime import date, datetime, timedelta
+from zoneinfo import ZoneInfo
+from sqlalchemy import literal, select, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import get_settings
+from core.lifespan import background_task
+from db.enums import RideStatusEnum
+from db.models.rides import Ride, RIDE_IS_OPEN
+from db.session import AsyncSessionLocal
+
+logger = logging.getLogger("uvicorn.error")
+settings = get_settings()
+
+_CAMPUS_TZ = ZoneInfo(settings.CAMPUS_TIMEZONE)
+
+
+def campus_now() -> datetime:
+    """Current wall-clock time on campus (naive, comparable to ride_date/ride_time)."""
+    return datetime.now(_CAMPUS_TZ).replace(tzinfo=None)
+
+
+def campus_today() -> date:
+    return campus_now().date()
+
+
+class RideExpiryService:
+    """Batch-expires open rides whose departure has passed."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def expire_batch(self, cutoff: datetime, batch_size: int) -> int:
+        """
+        Expire up to batch_size open rides departing before cutoff.
+
+        Returns:
+            Number of rides expired
+        """
+        stale = (
+            select(Ride.ride_id)
+            .where(
+                RIDE_IS_OPEN,
+                tuple_(Ride.ride_date, Ride.ride_time)
+                < tuple_(literal(cutoff.date()), literal(cutoff.time())),
+            )
+            .order_by(Ride.ride_date, Ride.ride_time)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        result = await self.db.execute(
+            update(Ride)
+            .where(Ride.ride_id.in_(stale.scalar_subquery()))
+            .values(status=RideStatusEnum.expired)
+            .returning(Ride.ride_id)
+        )
+        return len(result.all())
+
+
+async def sweep_expired_rides() -> int:
+    """Expire every stale open ride, one committed batch at a time."""
+    cutoff = campus_now() - timedelta(minutes=settings.RIDE_EXPIRY_GRACE_MINUTES)
+    batch_size = settings.RIDE_EXPIRY_BATCH_SIZE
+    total = 0
+    while True:
+        async with AsyncSessionLocal() as db:
+            expired = await RideExpiryService(db).expire_batch(cutoff, batch_size)
+            await db.commit()
+        total += expired
+        if expired < batch_size:
+            return total
+
+
+@background_task("ride-expiry-sweeper")
+async def run_ride_expiry_sweeper() -> None:
+    """Periodically expire stale open rides."""
+    while True:
+        try:
+            expired = await sweep_expired_rides()
+            if expired:
+                logger.info("Ride expiry sweeper expired %d rides", expired)
+        except Exception:
+            logger.exception("Ride expiry sweep failed")
+        await asyncio.sleep(settings.RIDE_EXPIRY_SWEEP_INTERVAL_SECONDS)
@@ -0,0 +1,163 @@
+"""
+Ride Scheduler - materializes recurring RideTemplates into Ride rows.
+
+For each batch of active templates one INSERT ... SELECT crosses the
+templates with the upcoming days (a VALUES list carrying each day's weekday
+bit) and keeps only the combinations that:
+  - match the template's weekday_mask and validity window
+  - are not campus holidays
+  - do not clash with a ride the driver already posted for that day/time
+
+Rides are unique on (template_id, ride_date), so re-running the scheduler
+(every RIDE_SCHEDULER_INTERVAL_SECONDS, on every worker) only fills gaps.
+"""
+import asyncio
+import logging
+import uuid
+from datetime import date, timedelta
+from sqlalchemy import Date, Integer, cast, column, exists, func, literal, or_, select, values
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import get_settings
+from core.lifespan import background_task
+from db.enums import RideStatusEnum
+from db.models.campus_holidays import CampusHoliday
+from db.models.ride_templates import RideTemplate
+from db.models.rides import Ride
+from db.session import AsyncSessionLocal
+from services.ride_expiry_service import campus_today
+
+logger = logging.getLogger("uvicorn.error")
+settings = get_settings()
+
+# Arbitrary constant so only one worker materializes at a time
+_SCHEDULER_LOCK_ID = 0x52494445
+
+
+def weekdays_to_mask(weekdays: list[int]) -> int:
+    """ISO weekdays (1 = Monday) -> bitmask with bit 0 = Monday."""
+    mask = 0
+    for day in weekdays:
+        mask |= 1 << (day - 1)
+    return mask
+
+
+class RideScheduler:
+    """Bulk-materializes upcoming rides from active templates."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    def _materialize_stmt(self, templates, days):
+        # Explicit cast: an untyped parameter in INSERT ... SELECT would arrive as text
+        status_type = Ride.__table__.c.status.type
+        ride_status = cast(literal(RideStatusEnum.open, status_type), status_type)
+        already_posted = exists().where(
+            Ride.driver_id == templates.c.driver_id,
+            Ride.ride_date == days.c.ride_date,
+            Ride.ride_time == templates.c.ride_time,
+            Ride.status != RideStatusEnum.cancelled,
+        )
+        holiday = exists().where(CampusHoliday.holiday_date == days.c.ride_date)
+
+        rows = (
+            select(
+                func.gen_random_uuid(), templates.c.driver_id, templates.c.vehicle_id,
+                templates.c.start_location, templates.c.end_location,
+                templates.c.start_address, templates.c.end_address,
+                days.c.ride_date, templates.c.ride_time, templates.c.available_seats,
+                templates.c.allowed_gender, templates.c.allowed_community,
+                templates.c.estimated_fare, ride_status, templates.c.template_id,
+            )
+            .select_from(
+                templates.join(days, templates.c.weekday_mask.op("&")(days.c.day_bit) != 0)
+            )
+            .where(
+                templates.c.valid_from <= days.c.ride_date,
+                or_(templates.c.valid_until.is_(None), templates.c.valid_until >= days.c.ride_date),
+                ~holiday,
+                ~already_posted,
+            )
+        )
+        return (
+            insert(Ride)
+            .from_select(
+                [
+                    "ride_id", "driver_id", "vehicle_id", "start_location", "end_location",
+                    "start_address", "end_address", "ride_date", "ride_time",
+                    "available_seats", "allowed_gender", "allowed_community",
+                    "estimated_fare", "status", "template_id",
+                ],
+                rows,
+            )
+            .on_conflict_do_nothing(index_elements=["template_id", "ride_date"])
+            .returning(Ride.ride_id)
+        )
+
+    async def materialize(
+        self,
+        template_ids: list[uuid.UUID] | None = None,
+        start: date | None = None,
+        horizon_days: int | None = None,
+    ) -> int:
+        """
+        Create missing rides from tomorrow (or `start`) through the horizon.
+
+        Returns:
+            Number of rides inserted
+        """
+        start = start or campus_today() + timedelta(days=1)
+        horizon = horizon_days or settings.RIDE_TEMPLATE_HORIZON_DAYS
+        dates = [start + timedelta(days=offset) for offset in range(horizon)]
+        days = values(
+            column("ride_date", Date), column("day_bit", Integer), name="days"
+        ).data([(day, 1 << (day.isoweekday() - 1)) for day in dates])
+
+        inserted = 0
+        last_id = None
+        while True:
+            ids_query = (
+                select(RideTemplate.template_id)
+                .where(RideTemplate.is_active == True)
+                .order_by(RideTemplate.template_id)
+                .limit(settings.RIDE_SCHEDULER_BATCH_SIZE)
+            )
+            if template_ids is not None:
+                ids_query = ids_query.where(RideTemplate.template_id.in_(template_ids))
+            if last_id is not None:
+                ids_query = ids_query.where(RideTemplate.template_id > last_id)
+            batch_ids = (await self.db.execute(ids_query)).scalars().all()
+            if not batch_ids:
+                return inserted
+
+            templates = (
+                select(RideTemplate.__table__)
+                .where(RideTemplate.template_id.in_(batch_ids))
+                .subquery("templates")
+            )
+            result = await self.db.execute(self._materialize_stmt(templates, days))
+            inserted += len(result.all())
+
+            if len(batch_ids) < settings.RIDE_SCHEDULER_BATCH_SIZE:
+                return inserted
+            last_id = batch_ids[-1]
+
+
+@background_task("ride-template-scheduler")
+async def run_ride_scheduler() -> None:
+    """Periodically top up materialized rides; one worker at a time via advisory lock."""
+    while True:
+        try:
+            async with AsyncSessionLocal() as db:
+                locked = (await db.execute(
+                    select(func.pg_try_advisory_xact_lock(_SCHEDULER_LOCK_ID))
+                )).scalar()
+                if locked:
+                    created = await RideScheduler(db).materialize()
+                    await db.commit()
+                    if created:
+                        logger.info("Ride scheduler materialized %d rides", created)
+        except Exception:
+            logger.exception("Ride scheduler run failed")
+        await asyncio.sleep(settings.RIDE_SCHEDULER_INTERVAL_SECONDS)
@@ -0,0 +1,177 @@
+"""
+Seat Limit Service - enforces DriverProfile.daily_seat_limit.
+
+driver_daily_seats holds one counter per (driver, ride_date). Accepting a
+rider bumps it with a single conditional upsert in the same transaction as
+the participant insert:
+
+    INSERT ... VALUES (driver, date, 1)
+    ON CONFLICT (driver_id, ride_date)
+    DO UPDATE SET seats_reserved = seats_reserved + 1
+    WHERE seats_reserved + 1 <= :limit
+    RETURNING seats_reserved
+
+No row back means the driver is full for the day. The row lock taken by the
+upsert serializes concurrent accepts, so the limit holds without summing
+the driver's rides.
+
+Each worker caches limits and last-seen counters for
+SEAT_LIMIT_CACHE_TTL_SECONDS. The cache only saves reads: the upsert above
+is the authority, and a cached "full" answer is re-read before rejecting.
+"""
+import time
+import uuid
+from datetime import date
+from typing import Optional
+from sqlalchemy import func, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import get_settings
+from db.models.driver_daily_seats import DriverDailySeats
+from db.models.driver_profiles import DriverProfile
+
+settings = get_settings()
+
+
+class SeatLimitError(Exception):
+    """Base exception for seat limit operations."""
+    def __init__(self, message: str, error_code: str):
+        self.message = message
+        self.error_code = error_code
+        super().__init__(message)
+
+
+class DailySeatLimitReached(SeatLimitError):
+    """Raised when a driver has no seats left for the day."""
+    pass
+
+
+# ---------------------------------------------------------------------------
+# Per-process read cache
+# ---------------------------------------------------------------------------
+_MAX_CACHED_COUNTERS = 50_000
+
+_limits: dict[uuid.UUID, tuple[Optional[int], float]] = {}
+_counters: dict[tuple[uuid.UUID, date], tuple[int, float]] = {}
+
+
+def _cached(cache: dict, key):
+    entry = cache.get(key)
+    if entry is None or entry[1] < time.monotonic():
+        return None
+    return entry
+
+
+def _remember(cache: dict, key, value) -> None:
+    if len(cache) >= _MAX_CACHED_COUNTERS:
+        now = time.monotonic()
+        for stale in [k for k, (_, expires) in cache.items() if expires < now]:
+            del cache[stale]
+        if len(cache) >= _MAX_CACHED_COUNTERS:
+            cache.clear()
+    cache[key] = (value, time.monotonic() + settings.SEAT_LIMIT_CACHE_TTL_SECONDS)
+
+
+def forget_seat_limit(driver_id: uuid.UUID) -> None:
+    """Drop a driver's cached limit, e.g. after their profile changes."""
+    _limits.pop(driver_id, None)
+
+
+class SeatLimitService:
+    """Per-day seat counters for drivers."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def daily_limit(self, driver_id: uuid.UUID) -> Optional[int]:
+        """The driver's daily_seat_limit, or None if no active driver profile sets one."""
+        entry = _cached(_limits, driver_id)
+        if entry is not None:
+            return entry[0]
+        result = await self.db.execute(
+            select(DriverProfile.daily_seat_limit).where(
+                DriverProfile.user_id == driver_id,
+                DriverProfile.is_driver_active == True,
+            )
+        )
+        limit = result.scalar_one_or_none()
+        _remember(_limits, driver_id, limit)
+        return limit
+
+    async def reserved(self, driver_id: uuid.UUID, ride_date: date, *, fresh: bool = False) -> int:
+        """Seats the driver has filled on ride_date."""
+        key = (driver_id, ride_date)
+        entry = None if fresh else _cached(_counters, key)
+        if entry is not None:
+            return entry[0]
+        result = await self.db.execute(
+            select(DriverDailySeats.seats_reserved).where(
+                DriverDailySeats.driver_id == driver_id,
+                DriverDailySeats.ride_date == ride_date,
+            )
+        )
+        count = result.scalar_one_or_none() or 0
+        _remember(_counters, key, count)
+        return count
+
+    async def has_capacity(self, driver_id: uuid.UUID, ride_date: date) -> bool:
+        """Whether the driver can still take a rider on ride_date."""
+        limit = await self.daily_limit(driver_id)
+        if limit is None:
+            return True
+        if await self.reserved(driver_id, ride_date) < limit:
+            return True
+        # Another worker may have released seats since we cached "full"
+        return await self.reserved(driver_id, ride_date, fresh=True) < limit
+
+    async def reserve(self, driver_id: uuid.UUID, ride_date: date, seats: int = 1) -> int:
+        """
+        Count `seats` more riders for the driver on ride_date.
+
+        Returns:
+            The new counter value
+
+        Raises:
+            DailySeatLimitReached: the reservation would exceed daily_seat_limit
+        """
+        limit = await self.daily_limit(driver_id)
+        if limit is not None and seats > limit:
+            raise DailySeatLimitReached(
+                f"Daily seat limit of {limit} reached for {ride_date}.", "DAILY_SEAT_LIMIT"
+            )
+
+        stmt = insert(DriverDailySeats).values(
+            driver_id=driver_id, ride_date=ride_date, seats_reserved=seats
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[DriverDailySeats.driver_id, DriverDailySeats.ride_date],
+            set_={"seats_reserved": DriverDailySeats.seats_reserved + seats},
+            where=(DriverDailySeats.seats_reserved + seats <= limit) if limit is not None else None,
+        ).returning(DriverDailySeats.seats_reserved)
+        count = (await self.db.execute(stmt)).scalar_one_or_none()
+
+        if count is None:
+            _remember(_counters, (driver_id, ride_date), limit)
+            raise DailySeatLimitReached(
+                f"Daily seat limit of {limit} reached for {ride_date}.", "DAILY_SEAT_LIMIT"
+            )
+        _remember(_counters, (driver_id, ride_date), count)
+        return count
+
+    async def release(self, driver_id: uuid.UUID, ride_date: date, seats: int = 1) -> None:
+        """Give back seats, e.g. when a ride with riders is cancelled."""
+        if seats <= 0:
+            return
+        result = await self.db.execute(
+            update(DriverDailySeats)
+            .where(
+                DriverDailySeats.driver_id == driver_id,
+                DriverDailySeats.ride_date == ride_date,
+            )
+            .values(seats_reserved=func.greatest(DriverDailySeats.seats_reserved - seats, 0))
+            .returning(DriverDailySeats.seats_reserved)
+        )
+        count = result.scalar_one_or_none()
+        if count is not None:
+            _remember(_counters, (driver_id, ride_date), count)
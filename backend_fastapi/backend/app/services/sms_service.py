@@ -1,22 +1,81 @@
 """
-SMS Service - handles sending OTP via SMS.
+SMS Service - handles sending OTP and emergency SMS.
 Supports multiple providers: Console (dev), MSG91, Twilio
+
+Traffic is split into lanes, each with its own provider connection pool and
+concurrency slots: "otp" for login/registration codes and "emergency" for
+SOS fan-out (services/sos_dispatch.py). An OTP burst during admissions can
+fill its own lane but never delays an SOS message.
 """
-import httpx
+import asyncio
 from abc import ABC, abstractmethod
+from typing import Optional
+
 from core.config import get_settings
+from core.lifespan import on_shutdown
 
 settings = get_settings()
 
 
+class SMSLane:
+    """Reserved connection pool and concurrency slots for one class of SMS traffic."""
+
+    def __init__(self, name: str, concurrency: int, timeout: float):
+        self.name = name
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.slots = asyncio.Semaphore(concurrency)
+        self._client = None
+
+    def client(self):
+        """Shared keep-alive HTTP client for this lane, created on first use."""
+        if self._client is None:
+            # Deferred: httpx is only needed when a real provider is configured
+            import httpx
+
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.concurrency,
+                    max_keepalive_connections=self.concurrency,
+                ),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+LANES = {
+    "otp": SMSLane("otp", settings.SMS_OTP_CONCURRENCY, settings.SMS_TIMEOUT_SECONDS),
+    "emergency": SMSLane("emergency", settings.SMS_EMERGENCY_CONCURRENCY, settings.SMS_EMERGENCY_TIMEOUT_SECONDS),
+}
+
+
+@on_shutdown
+async def close_sms_clients() -> None:
+    for lane in LANES.values():
+        await lane.aclose()
+
+
 class SMSProvider(ABC):
     """Abstract base class for SMS providers."""
+
+    def __init__(self, lane: SMSLane):
+        self.lane = lane
     
     @abstractmethod
     async def send_otp(self, phone: str, otp: str) -> bool:
         """Send OTP to phone number."""
         pass
 
+    @abstractmethod
+    async def send_message(self, phone: str, text: str) -> bool:
+        """Send a free-text transactional SMS."""
+        pass
+
 
 class ConsoleSMSProvider(SMSProvider):
     """Development provider that prints to console."""
@@ -29,31 +88,50 @@ class ConsoleSMSProvider(SMSProvider):
         print(f"{'='*50}\n")
         return True
 
+    async def send_message(self, phone: str, text: str) -> bool:
+        print(f"\n📱 SMS to {phone} [{self.lane.name}]\n   {text}\n")
+        return True
+
 
 class MSG91Provider(SMSProvider):
     """MSG91 SMS provider for production."""
     
     BASE_URL = "https://api.msg91.com/api/v5/otp"
+    FLOW_URL = "https://control.msg91.com/api/v5/flow/"
     
     async def send_otp(self, phone: str, otp: str) -> bool:
         # Remove + prefix for MSG91
         phone_clean = phone.lstrip("+")
-        
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.BASE_URL}",
-                headers={
-                    "authkey": settings.SMS_API_KEY,
-                    "Content-Type": "application/json"
-                },
-                json={
-                    "mobile": phone_clean,
-                    "otp": otp,
-                    "sender": settings.SMS_SENDER_ID,
-                    "message": f"Your College Carpool verification code is {otp}. Valid for 5 minutes.",
-                }
-            )
-            return response.status_code == 200
+
+        response = await self.lane.client().post(
+            f"{self.BASE_URL}",
+            headers={
+                "authkey": settings.SMS_API_KEY,
+                "Content-Type": "application/json"
+            },
+            json={
+                "mobile": phone_clean,
+                "otp": otp,
+                "sender": settings.SMS_SENDER_ID,
+                "message": f"Your College Carpool verification code is {otp}. Valid for 5 minutes.",
+            }
+        )
+        return response.status_code == 200
+
+    async def send_message(self, phone: str, text: str) -> bool:
+        response = await self.lane.client().post(
+            self.FLOW_URL,
+            headers={
+                "authkey": settings.SMS_API_KEY,
+                "Content-Type": "application/json"
+            },
+            json={
+                "template_id": settings.SMS_EMERGENCY_TEMPLATE_ID,
+                "sender": settings.SMS_SENDER_ID,
+                "recipients": [{"mobiles": phone.lstrip("+"), "message": text}],
+            }
+        )
+        return response.status_code == 200
 
 
 class TwilioProvider(SMSProvider):
@@ -65,8 +143,12 @@ class TwilioProvider(SMSProvider):
         print(f"[Twilio] Would send OTP {otp} to {phone}")
         return True
 
+    async def send_message(self, phone: str, text: str) -> bool:
+        print(f"[Twilio] Would send to {phone}: {text}")
+        return True
+
 
-def get_sms_provider() -> SMSProvider:
+def get_sms_provider(lane: SMSLane) -> SMSProvider:
     """Factory function to get the configured SMS provider."""
     providers = {
         "console": ConsoleSMSProvider,
@@ -75,14 +157,15 @@ def get_sms_provider() -> SMSProvider:
     }
     
     provider_class = providers.get(settings.SMS_PROVIDER.lower(), ConsoleSMSProvider)
-    return provider_class()
+    return provider_class(lane)
 
 
 class SMSService:
-    """High-level SMS service."""
+    """High-level SMS service; waits for a slot in its lane before sending."""
     
-    def __init__(self):
-        self.provider = get_sms_provider()
+    def __init__(self, lane: str = "otp"):
+        self.lane = LANES[lane]
+        self.provider = get_sms_provider(self.lane)
     
     async def send_otp(self, phone: str, otp: str) -> bool:
         """
@@ -95,4 +178,18 @@ class SMSService:
         Returns:
             True if sent successfully
         """
-        return await self.provider.send_otp(phone, otp)
+        async with self.lane.slots:
+            return await self.provider.send_otp(phone, otp)
+
+    async def send_message(self, phone: str, text: str, timeout: Optional[float] = None) -> bool:
+        """
+        Send a transactional SMS in this service's lane.
+
+        Raises:
+            asyncio.TimeoutError: no slot plus delivery within `timeout`
+        """
+        async def send():
+            async with self.lane.slots:
+                return await self.provider.send_message(phone, text)
+
+        return await asyncio.wait_for(send(), timeout=timeout or self.lane.timeout)
@@ -0,0 +1,109 @@
+"""
+SOS Dispatch - emergency SMS fan-out when an alert is raised.
+
+trigger_sos looks up the recipients (the user's emergency contacts plus
+SOS_SECURITY_PHONES), commits the alert and then schedules dispatch_sos():
+
+  1. every SMS goes out concurrently (asyncio.gather) through the
+     "emergency" SMS lane: its own provider connections and concurrency
+     slots, so a burst of OTP traffic cannot delay it
+  2. each send is bounded by SMS_EMERGENCY_TIMEOUT_SECONDS; a slow or
+     failed recipient never holds up the others
+  3. one sos_notifications row per recipient records delivery, error and
+     latency for the security team
+"""
+import asyncio
+import logging
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Optional
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import get_settings
+from db.models.emergency_contacts import EmergencyContact
+from db.models.sos_notifications import SOSNotification
+from db.session import AsyncSessionLocal
+from services.sms_service import SMSService
+
+logger = logging.getLogger("uvicorn.error")
+settings = get_settings()
+
+
+@dataclass(frozen=True)
+class Recipient:
+    phone: str
+    contact_id: Optional[uuid.UUID] = None  # None for campus security
+
+
+def security_phones() -> list[str]:
+    # Normalised and validated when the settings load
+    return [phone for phone in settings.SOS_SECURITY_PHONES.split(",") if phone]
+
+
+async def sos_recipients(db: AsyncSession, user_id: uuid.UUID) -> list[Recipient]:
+    """The user's emergency contacts followed by campus security, without duplicates."""
+    result = await db.execute(
+        select(EmergencyContact.contact_id, EmergencyContact.contact_phone)
+        .where(EmergencyContact.user_id == user_id)
+    )
+    recipients = [Recipient(row.contact_phone, row.contact_id) for row in result]
+    recipients += [Recipient(phone) for phone in security_phones()]
+    seen = set()
+    return [r for r in recipients if not (r.phone in seen or seen.add(r.phone))]
+
+
+def sos_message(full_name: str, phone: str, latitude: float, longitude: float) -> str:
+    return (
+        f"SOS: {full_name} ({phone}) raised an emergency alert during a UniRide trip. "
+        f"Location: https://maps.google.com/?q={latitude:.6f},{longitude:.6f}"
+    )
+
+
+async def _send(sms: SMSService, recipient: Recipient, text: str) -> dict:
+    started = time.perf_counter()
+    error = None
+    try:
+        delivered = await sms.send_message(recipient.phone, text)
+        if not delivered:
+            error = "rejected by provider"
+    except asyncio.TimeoutError:
+        delivered, error = False, "timeout"
+    except Exception as e:
+        delivered, error = False, f"{type(e).__name__}: {e}"
+    return {
+        "contact_id": recipient.contact_id,
+        "phone": recipient.phone,
+        "delivered": delivered,
+        "error": error,
+        "latency_ms": int((time.perf_counter() - started) * 1000),
+    }
+
+
+async def dispatch_sos(alert_id: uuid.UUID, recipients: list[Recipient], text: str) -> list[dict]:
+    """Send the SOS text to every recipient at once and record the outcomes."""
+    if not recipients:
+        logger.warning("SOS %s: no emergency contacts or security numbers to notify", alert_id)
+        return []
+
+    sms = SMSService(lane="emergency")
+    results = await asyncio.gather(*(_send(sms, recipient, text) for recipient in recipients))
+
+    failed = [r for r in results if not r["delivered"]]
+    if failed:
+        logger.error(
+            "SOS %s: %d of %d notifications failed (%s)", alert_id, len(failed), len(results),
+            ", ".join(f"{r['phone']}: {r['error']}" for r in failed),
+        )
+    try:
+        async with AsyncSessionLocal() as db:
+            await db.execute(
+                insert(SOSNotification),
+                [{"notification_id": uuid.uuid4(), "alert_id": alert_id, **r} for r in results],
+            )
+            await db.commit()
+    except Exception:
+        logger.exception("SOS %s: could not record notification results", alert_id)
+    return results